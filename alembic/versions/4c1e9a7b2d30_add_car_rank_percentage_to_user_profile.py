@@ -0,0 +1,33 @@
+"""add car_rank, percentage to user_profile
+
+Revision ID: 4c1e9a7b2d30
+Revises: dcfd87f5b085
+Create Date: 2026-10-18 10:12:41.503217
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+import sqlmodel
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4c1e9a7b2d30"
+down_revision: Union[str, None] = "dcfd87f5b085"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 기존 행은 NULL로 두고 app/data/car_rank/recompute.py로 채운다 (그 전까지 조회 시에는 계산만 하고 저장하지 않음)
+    op.add_column("user_profile", sa.Column("car_rank", sqlmodel.sql.sqltypes.AutoString(length=32), nullable=True))
+    op.add_column("user_profile", sa.Column("percentage", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("user_profile", "percentage")
+    op.drop_column("user_profile", "car_rank")
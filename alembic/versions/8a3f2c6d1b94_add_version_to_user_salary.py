@@ -0,0 +1,39 @@
+"""add version to user_salary
+
+Revision ID: 8a3f2c6d1b94
+Revises: 4c1e9a7b2d30
+Create Date: 2026-10-18 15:40:12.318904
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8a3f2c6d1b94"
+down_revision: Union[str, None] = "4c1e9a7b2d30"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 기존 행은 0으로 두고, 이후 제출은 Redis에서 발급한 순번으로 갱신한다
+    op.add_column(
+        "user_salary",
+        sa.Column(
+            "version",
+            sa.BigInteger(),
+            server_default="0",
+            nullable=False,
+            comment="제출 순번 (Redis INCR). 더 작은 값의 upsert는 무시",
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("user_salary", "version")
@@ -1,4 +1,22 @@
-REDIS_KEY_RATE_LIMIT_SALARY_SUBMIT = "salary_submit"
 SALARY_THOUSAND_WON = 10_000
 JOB_REDIS_KEY = "job:all:list"
+JOB_ETAG_REDIS_KEY = "job:all:etag"
 EXPIRE_JOB_REDIS_SEC = 60 * 60 * 24
+MAX_EXPERIENCE_YEAR = 10
+SALARY_STAT_VERSION_REDIS_KEY = "salary_stat:version"
+SALARY_STAT_VERSION_CHECK_SEC = 30
+MAX_SALARY_MANWON = 100_000
+SALARY_HISTOGRAM_REDIS_KEY = "salary_hist:{job_id}:{experience}"
+SALARY_HISTOGRAM_BUCKET_MANWON = 100
+PERCENTILE_MIN_SAMPLES = 30
+USER_CAR_RANK_REDIS_KEY = "user:car_rank:{unique_id}"
+USER_CAR_RANK_VERSION_REDIS_KEY = "user:car_rank:version"
+EXPIRE_USER_CAR_RANK_REDIS_SEC = 60 * 60 * 24 * 7
+SALARY_SUBMISSION_VERSION_REDIS_KEY = "salary_submission:version"
+SALARY_SUBMISSION_LATEST_REDIS_KEY = "salary_submission:latest"
+SALARY_WRITE_BUFFER_STREAM_KEY = "salary_write_buffer:stream"
+SALARY_WRITE_BUFFER_PENDING_KEY = "salary_write_buffer:pending"
+SALARY_WRITE_BUFFER_GROUP = "salary_writer"
+SALARY_WRITE_BUFFER_BLOCK_MS = 1_000
+SALARY_WRITE_BUFFER_CLAIM_IDLE_MS = 60_000
+SALARY_WRITE_BUFFER_RETRY_SEC = 5
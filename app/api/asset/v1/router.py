@@ -1,12 +1,10 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Path, status
+from fastapi import APIRouter, Depends, Header, Path, Response, status
 from pydantic import UUID4
 
 from app.api.asset.v1.constant import SALARY_THOUSAND_WON
 from app.api.asset.v1.schemas.asset_schema import (
-    JobItem,
-    JobResponseData,
     JobSuccessResponse,
     UserCarRankData,
     UserCarRankGetResponse,
@@ -16,23 +14,34 @@ from app.api.asset.v1.schemas.asset_schema import (
     UserSalaryResponse,
     UserSalaryResponseData,
 )
-from app.common.docs.responses import COMMON_ERROR_RESPONSES
-from app.module.asset.errors.asset_error import NoMatchUserProfile, NoUserProfileSaveRate, SalaryStatNotFound
-from app.module.asset.model import SalaryStat, UserProfile
+from app.common.dependencies.rate_limiter import profile_rate_limit_guard, salary_rate_limit_guard
+from app.common.docs.responses import COMMON_ERROR_RESPONSES, RATE_LIMIT_ERROR_RESPONSES
+from app.module.asset.errors.asset_error import SalaryStatNotFound
 from app.module.asset.services.asset_service import AssetService
 
 asset_router = APIRouter(prefix="/v1")
 
 
 @asset_router.get(
-    "/jobs", summary="직무 데이터 반환", response_model=JobSuccessResponse, responses=COMMON_ERROR_RESPONSES
+    "/jobs",
+    summary="직무 데이터 반환",
+    response_model=JobSuccessResponse,
+    responses={
+        **COMMON_ERROR_RESPONSES,
+        status.HTTP_304_NOT_MODIFIED: {"description": "If-None-Match의 ETag와 직무 목록이 같아 본문 없이 응답"},
+    },
 )
 async def get_jobs(
+    if_none_match: str | None = Header(None, alias="If-None-Match"),
     asset_service: AssetService = Depends(),
-) -> JobSuccessResponse:
-    jobs = await asset_service.get_jobs() or []
+) -> Response:
+    snapshot = await asset_service.get_job_catalog()
+    headers = {"ETag": snapshot.etag, "Cache-Control": "no-cache"}
 
-    return JobSuccessResponse(data=JobResponseData(items=[JobItem.model_validate(job) for job in jobs]))
+    if snapshot.matches(if_none_match):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=snapshot.body, media_type="application/json", headers=headers)
 
 
 @asset_router.post(
@@ -40,7 +49,8 @@ async def get_jobs(
     summary="사용자 정보 입력 후 연봉 비교 결과 반환",
     status_code=status.HTTP_201_CREATED,
     response_model=UserSalaryResponse,
-    responses=COMMON_ERROR_RESPONSES,
+    responses={**COMMON_ERROR_RESPONSES, **RATE_LIMIT_ERROR_RESPONSES},
+    dependencies=[Depends(salary_rate_limit_guard)],
 )
 async def submit_user_salary(
     request_data: UserSalaryPostRequest,
@@ -48,11 +58,11 @@ async def submit_user_salary(
 ) -> UserSalaryResponse:
     await asset_service.save_user_salary(request_data)
 
-    job_stat: SalaryStat | None = await asset_service.get_job_salary(request_data.job_id, request_data.experience)
-    if not job_stat:
+    job_salary_avg: int | None = await asset_service.get_job_salary(request_data.job_id, request_data.experience)
+    if not job_salary_avg:
         raise SalaryStatNotFound
 
-    job_salary_thousand = job_stat.avg // SALARY_THOUSAND_WON  # 천만원 단위
+    job_salary_thousand = job_salary_avg // SALARY_THOUSAND_WON  # 천만원 단위
 
     return UserSalaryResponse(
         data=UserSalaryResponseData(
@@ -66,17 +76,15 @@ async def submit_user_salary(
     status_code=status.HTTP_201_CREATED,
     response_model=UserCarRankResponse,
     summary="사용자 소비 패턴 입력 후 소비 등급 반환",
-    responses=COMMON_ERROR_RESPONSES,
+    responses={**COMMON_ERROR_RESPONSES, **RATE_LIMIT_ERROR_RESPONSES},
+    dependencies=[Depends(profile_rate_limit_guard)],
 )
 async def submit_user_profile(
     request_data: UserProfilePostRequest,
     asset_service: AssetService = Depends(),
 ) -> UserCarRankResponse:
-    await asset_service.save_user_profile(request_data)
-
-    car = await asset_service.get_user_car(request_data.unique_id, request_data.save_rate)
-    percentage = await asset_service.get_user_percentage(request_data.unique_id, request_data.save_rate)
-    return UserCarRankResponse(data=UserCarRankData(car=car, percentage=percentage))
+    car_rank: UserCarRankData = await asset_service.save_user_profile(request_data)
+    return UserCarRankResponse(data=car_rank)
 
 
 @asset_router.get(
@@ -89,14 +97,6 @@ async def user_profile_link(
     uniqueId: Annotated[UUID4, Path(description="유저 고유 UUID")],
     asset_service: AssetService = Depends(),
 ) -> UserCarRankGetResponse:
-    user_profile: UserProfile | None = await asset_service.get_user_profile(uniqueId)
-    if user_profile is None:
-        raise NoMatchUserProfile()
-
-    if user_profile.save_rate is None:
-        raise NoUserProfileSaveRate()
-
-    car: str = await asset_service.get_user_car(uniqueId, user_profile.save_rate)
-    percentage: int = await asset_service.get_user_percentage(uniqueId, user_profile.save_rate)
+    car_rank: UserCarRankData = await asset_service.get_shared_car_rank(uniqueId)
 
-    return UserCarRankGetResponse(data=UserCarRankData(car=car, percentage=percentage))
+    return UserCarRankGetResponse(data=car_rank)
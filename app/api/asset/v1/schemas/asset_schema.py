@@ -1,5 +1,6 @@
 from pydantic import UUID4, BaseModel, ConfigDict, Field
 
+from app.api.asset.v1.constant import MAX_EXPERIENCE_YEAR, MAX_SALARY_MANWON
 from app.common.schemas.base_schema import BaseRequestModel, SuccessGetResponse, SuccessPostResponse
 
 
@@ -30,8 +31,8 @@ class JobSuccessResponse(SuccessGetResponse):
 class UserSalaryPostRequest(BaseRequestModel):
     unique_id: UUID4
     job_id: int
-    experience: int = Field(..., ge=0, le=10)
-    salary: int = Field(..., gt=0, le=100_000)
+    experience: int = Field(..., ge=0, le=MAX_EXPERIENCE_YEAR)
+    salary: int = Field(..., gt=0, le=MAX_SALARY_MANWON)
 
     model_config = ConfigDict(
         from_attributes=True,
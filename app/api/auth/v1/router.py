@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends, status
 
 from app.api.auth.v1.schemas.user_schema import UserEmailRequest
-from app.common.docs.responses import COMMON_ERROR_RESPONSES
+from app.common.dependencies.rate_limiter import email_rate_limit_guard
+from app.common.docs.responses import COMMON_ERROR_RESPONSES, RATE_LIMIT_ERROR_RESPONSES
 from app.common.schemas.base_schema import SuccessPostResponse
 from app.module.auth.response import AUTH_ERROR_RESPONSES
 from app.module.auth.services.user_service import UserService
@@ -17,7 +18,9 @@ auth_router = APIRouter(prefix="/v1")
     responses={
         **COMMON_ERROR_RESPONSES,
         **AUTH_ERROR_RESPONSES,
+        **RATE_LIMIT_ERROR_RESPONSES,
     },
+    dependencies=[Depends(email_rate_limit_guard)],
 )
 async def submit_user_email(
     request_data: UserEmailRequest,
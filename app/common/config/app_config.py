@@ -1,14 +1,20 @@
+import asyncio
 from abc import ABC, abstractmethod
 from os import getenv
 
 from dotenv import load_dotenv
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.asset.v1.router import asset_router
 from app.api.auth.v1.router import auth_router
+from app.common.config.lifespan import lifespan
+from app.common.dependencies.metrics_guard import metrics_access_guard
 from app.common.enums import EnvironmentType
 from app.common.exception_handlers.handler_register import register_exception_handlers
+from app.common.metrics.constant import METRICS_CONTENT_TYPE, METRICS_PATH
+from app.common.metrics.metrics import render_metrics
+from app.common.middleware.idempotency import IdempotencyMiddleware
 from app.common.middleware.logger import LoggingMiddleware
 from app.common.response import CustomJSONResponse
 
@@ -37,6 +43,8 @@ class BaseAppConfig(AppConfig):
         return app
 
     def setup_middleware(self, app: FastAPI) -> None:
+        # 가장 안쪽에 두어 재응답도 요청 로그/지표에 남게 한다
+        app.add_middleware(IdempotencyMiddleware)
         app.add_middleware(
             CORSMiddleware,
             allow_origins=self.cors_origins(),
@@ -55,6 +63,11 @@ class BaseAppConfig(AppConfig):
         async def health():
             return {"status": "ok"}
 
+        @app.get(METRICS_PATH, include_in_schema=False, dependencies=[Depends(metrics_access_guard)])
+        async def metrics():
+            content = await asyncio.to_thread(render_metrics)
+            return Response(content=content, media_type=METRICS_CONTENT_TYPE)
+
     @abstractmethod
     def cors_origins(self) -> list[str]:
         pass
@@ -62,7 +75,13 @@ class BaseAppConfig(AppConfig):
 
 class ProductionAppConfig(BaseAppConfig):
     def setup_app(self) -> FastAPI:
-        return FastAPI(docs_url=None, redoc_url=None, openapi_url=None, default_response_class=CustomJSONResponse)
+        return FastAPI(
+            docs_url=None,
+            redoc_url=None,
+            openapi_url=None,
+            default_response_class=CustomJSONResponse,
+            lifespan=lifespan,
+        )
 
     def cors_origins(self) -> list[str]:
         return ["https://www.olass.co.kr"]
@@ -70,7 +89,7 @@ class ProductionAppConfig(BaseAppConfig):
 
 class DevelopmentAppConfig(BaseAppConfig):
     def setup_app(self) -> FastAPI:
-        return FastAPI(default_response_class=CustomJSONResponse)
+        return FastAPI(default_response_class=CustomJSONResponse, lifespan=lifespan)
 
     def cors_origins(self) -> list[str]:
         return ["*"]
@@ -0,0 +1,54 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
+from typing import AsyncIterator
+
+from fastapi import FastAPI
+
+from app.common.logger.config import attach_cloudwatch_handlers
+from app.common.metrics.constant import METRICS_SNAPSHOT_DIR
+from app.common.metrics.metrics import run_metrics_snapshot_writer
+from app.common.metrics.registry import remove_snapshot
+from app.module.asset.caches.salary_stat_table import refresh_salary_stat_table, run_salary_stat_table_refresher
+from app.module.asset.logger import asset_logger
+from app.module.asset.services.salary_write_behind_service import run_salary_write_buffer_consumer
+from database.dependency import close_redis_pool, describe_pool_capacity, init_redis_pool
+from main_config import settings
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # CloudWatch 연결(boto3 자격 증명 탐색, retention 설정)은 기동을 막지 않도록 스레드에서 진행한다
+    cloudwatch_attach = asyncio.create_task(asyncio.to_thread(attach_cloudwatch_handlers))
+    init_redis_pool()
+    asset_logger.info(
+        "[PoolCapacity] workers=%d %s",
+        settings.web_concurrency,
+        " ".join(
+            f"{name}={capacity['per_worker']}/worker,{capacity['per_node']}/node"
+            for name, capacity in describe_pool_capacity().items()
+        ),
+    )
+
+    try:
+        await refresh_salary_stat_table()
+    except Exception as e:
+        # 적재에 실패해도 서버는 띄우고, 테이블이 적재되기 전까지는 DB 조회로 대체된다
+        asset_logger.warning("[SalaryStatTable][InitialLoadFailed] %s", e)
+
+    salary_stat_refresher = asyncio.create_task(run_salary_stat_table_refresher())
+    metrics_snapshot_writer = asyncio.create_task(run_metrics_snapshot_writer())
+    background_tasks = [salary_stat_refresher, metrics_snapshot_writer]
+    if settings.salary_write_behind_enabled:
+        background_tasks.append(asyncio.create_task(run_salary_write_buffer_consumer()))
+
+    try:
+        yield
+    finally:
+        for task in background_tasks:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+        remove_snapshot(METRICS_SNAPSHOT_DIR)
+        await close_redis_pool()
+        if not cloudwatch_attach.done():
+            cloudwatch_attach.cancel()
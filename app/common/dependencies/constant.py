@@ -0,0 +1,5 @@
+REDIS_KEY_RATE_LIMIT = "rate_limit:{name}:{client_ip}"
+
+RATE_LIMIT_NAME_SALARY_SUBMIT = "salary_submit"
+RATE_LIMIT_NAME_PROFILE_SUBMIT = "profile_submit"
+RATE_LIMIT_NAME_EMAIL_SUBMIT = "email_submit"
@@ -0,0 +1,22 @@
+import secrets
+
+from fastapi import Header, HTTPException, status
+
+from app.common.enums import EnvironmentType
+from main_config import settings
+
+
+def metrics_access_guard(authorization: str | None = Header(None, alias="Authorization")) -> None:
+    """
+    /metrics 접근 제한
+    dev/local은 항상 허용하고, prod는 METRICS_TOKEN이 설정되어 있고 Bearer 토큰이 일치할 때만 허용한다.
+    그 외에는 엔드포인트가 없는 것처럼 404로 응답한다.
+    """
+    if settings.environment != EnvironmentType.PROD:
+        return
+
+    token = settings.metrics_token
+    if token and authorization and secrets.compare_digest(authorization, f"Bearer {token}"):
+        return
+
+    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
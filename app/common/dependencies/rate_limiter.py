@@ -0,0 +1,97 @@
+import math
+import uuid
+
+from fastapi import Depends, Header, HTTPException, Request, Response, status
+
+from app.common.dependencies.constant import (
+    RATE_LIMIT_NAME_EMAIL_SUBMIT,
+    RATE_LIMIT_NAME_PROFILE_SUBMIT,
+    RATE_LIMIT_NAME_SALARY_SUBMIT,
+    REDIS_KEY_RATE_LIMIT,
+)
+from app.common.middleware.logger import middleware_logger
+from app.common.redis_repository.rate_limit_redis_repository import RateLimitRedisRepository, RateLimitResult
+from main_config import settings
+
+
+class RateLimiter:
+    """
+    클라이언트 IP 기준 슬라이딩 윈도우 rate limit 의존성 (라우트별 정책)
+    """
+
+    def __init__(self, name: str, max_calls: int, period: int):
+        self.name = name
+        self.max_calls = max_calls
+        self.period = period
+
+    async def __call__(
+        self,
+        request: Request,
+        response: Response,
+        x_forwarded_for: str | None = Header(None, alias="X-Forwarded-For"),
+        x_real_ip: str | None = Header(None, alias="X-Real-IP"),
+        redis_repo: RateLimitRedisRepository = Depends(),
+    ) -> None:
+        client_ip = self._parse_client_ip(request, x_forwarded_for, x_real_ip)
+
+        if not client_ip:
+            middleware_logger.error(
+                "[RateLimiter][ClientIPParseFailed] 클라이언트 IP를 추출하지 못했습니다. request_url=%s",
+                request.url.path,
+            )
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="클라이언트 IP를 확인할 수 없습니다.",
+            )
+
+        key = REDIS_KEY_RATE_LIMIT.format(name=self.name, client_ip=client_ip)
+        result = await redis_repo.hit(key, uuid.uuid4().hex, self.max_calls, self.period)
+        headers = self._build_headers(result)
+
+        if not result.allowed:
+            middleware_logger.warning(
+                "[RateLimiter][RateLimitExceeded] name=%s, client_ip=%s, max_calls=%d, period=%ds",
+                self.name,
+                client_ip,
+                self.max_calls,
+                self.period,
+            )
+            headers["Retry-After"] = headers["X-RateLimit-Reset"]
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="잠시 후 다시 시도해 주세요.",
+                headers=headers,
+            )
+
+        response.headers.update(headers)
+
+    def _build_headers(self, result: RateLimitResult) -> dict[str, str]:
+        return {
+            "X-RateLimit-Limit": str(self.max_calls),
+            "X-RateLimit-Remaining": str(result.remaining),
+            "X-RateLimit-Reset": str(max(math.ceil(result.reset_ms / 1000), 1)),
+        }
+
+    def _parse_client_ip(self, request: Request, x_forwarded_for: str | None, x_real_ip: str | None) -> str | None:
+        """
+        nginx가 $remote_addr로 덮어쓰는 X-Real-IP를 우선 사용한다.
+        X-Forwarded-For의 앞쪽 값은 클라이언트가 임의로 보낼 수 있으므로 프록시가 붙인 마지막 값만 사용한다.
+        """
+        if x_real_ip:
+            return x_real_ip.strip()
+        elif x_forwarded_for:
+            return x_forwarded_for.split(",")[-1].strip()
+        elif request.client:
+            return request.client.host
+        return None
+
+
+salary_rate_limit_guard = RateLimiter(
+    RATE_LIMIT_NAME_SALARY_SUBMIT, settings.rate_limit_salary_max_calls, settings.salary_rate_limit_period
+)
+profile_rate_limit_guard = RateLimiter(
+    RATE_LIMIT_NAME_PROFILE_SUBMIT, settings.rate_limit_profile_max_calls, settings.rate_limit_period
+)
+email_rate_limit_guard = RateLimiter(
+    RATE_LIMIT_NAME_EMAIL_SUBMIT, settings.rate_limit_email_max_calls, settings.rate_limit_period
+)
@@ -67,3 +67,20 @@ COMMON_ERROR_RESPONSES: Dict[int | str, Dict[str, Any]] = {
         },
     },
 }
+
+RATE_LIMIT_ERROR_RESPONSES: Dict[int | str, Dict[str, Any]] = {
+    HTTPStatus.TOO_MANY_REQUESTS.value: {
+        "model": ErrorResponse,
+        "description": "요청 횟수 제한을 초과했습니다. Retry-After(초) 이후 다시 시도합니다.",
+        "content": {
+            "application/json": {
+                "example": {
+                    "code": 429,
+                    "message": "잠시 후 다시 시도해 주세요.",
+                    "error": {"type": "HTTPException", "details": {"message": "잠시 후 다시 시도해 주세요."}},
+                    "success": False,
+                }
+            }
+        },
+    },
+}
@@ -33,6 +33,17 @@ class EnvironmentType(StrEnum):
             raise ValueError(f"{key} 환경변수가 설정되지 않았습니다.")
         return url
 
+    @property
+    def replica_db_url(self) -> str | None:
+        """환경별 읽기 전용 replica URL (설정하지 않으면 모든 조회가 primary로 간다)"""
+        env_keys = {
+            EnvironmentType.LOCAL: "LOCAL_MYSQL_REPLICA_URL",
+            EnvironmentType.TEST: "LOCAL_MYSQL_REPLICA_URL",
+            EnvironmentType.DEV: "DEV_MYSQL_REPLICA_URL",
+            EnvironmentType.PROD: "PROD_MYSQL_REPLICA_URL",
+        }
+        return getenv(env_keys[self]) or None
+
     @property
     def redis_host(self) -> str:
         """환경별 Redis 호스트"""
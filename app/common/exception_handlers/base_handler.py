@@ -76,4 +76,5 @@ async def http_exception_handler(request: Request, exc: HTTPException):
                 details=exc.detail if isinstance(exc.detail, dict) else {"message": str(exc.detail)},
             ),
         ).model_dump(),
+        headers=exc.headers,
     )
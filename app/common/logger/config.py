@@ -1,16 +1,22 @@
+import atexit
 import logging
 from logging import Logger
-from typing import cast
-
-import boto3
-import watchtower
-from botocore.exceptions import NoCredentialsError
-from mypy_boto3_logs.client import CloudWatchLogsClient
+from logging.handlers import QueueHandler, QueueListener
+from queue import Full, Queue
+from typing import TYPE_CHECKING, NamedTuple, cast
 
+from app.common.logger.constant import AWS_LOG_REGION, LOG_QUEUE_MAX_SIZE
 from app.common.logger.enums import LogTag
 
+if TYPE_CHECKING:
+    from mypy_boto3_logs.client import CloudWatchLogsClient
+
+
+class TaggedFormatter(logging.Formatter):
+    """
+    [태그] 접두어를 포맷 시점에 붙인다. extra={"tag": ...}가 없으면 레벨로 태그를 정한다.
+    """
 
-class TaggedLogger(logging.Logger):
     _LEVEL_TAG_MAP = {
         logging.DEBUG: LogTag.DEBUG.value,
         logging.INFO: LogTag.INFO.value,
@@ -19,19 +25,48 @@ class TaggedLogger(logging.Logger):
         logging.CRITICAL: LogTag.CRITICAL.value,
     }
 
-    def makeRecord(self, name, level, fn, lno, msg, args, exc_info, func=None, extra=None, sinfo=None):
-        tag = None
-        if extra and isinstance(extra, dict) and "tag" in extra:
-            tag = extra["tag"]
-        else:
-            tag = self._LEVEL_TAG_MAP.get(level, LogTag.INFO.value)
+    def format(self, record: logging.LogRecord) -> str:
+        tag = getattr(record, "tag", None) or self._LEVEL_TAG_MAP.get(record.levelno, LogTag.INFO.value)
+        return f"[{tag}] {super().format(record)}"
+
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    이벤트 루프에서는 레코드를 큐에 넣기만 한다. 큐가 가득 차면 기다리지 않고 버린 뒤 개수를 센다.
+    """
+
+    def __init__(self, log_queue: Queue) -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
 
-        msg = f"[{tag}] {msg}"
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 같은 프로세스 내 큐이므로 메시지 합성/traceback 포맷은 리스너 스레드의 핸들러에 맡긴다
+        return record
 
-        return super().makeRecord(name, level, fn, lno, msg, args, exc_info, func, extra, sinfo)
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except Full:
+            self.dropped += 1
+
+
+class CloudWatchTarget(NamedTuple):
+    logger_name: str
+    log_group: str
+    level: str
+    retention_days: int
+    listener: QueueListener
 
 
-logging.setLoggerClass(TaggedLogger)
+_queue_handlers: dict[str, DroppingQueueHandler] = {}
+_cloudwatch_targets: list[CloudWatchTarget] = []
+
+
+def get_dropped_log_counts() -> dict[str, int]:
+    """
+    로거별로 큐가 가득 차 버려진 로그 개수
+    """
+    return {name: handler.dropped for name, handler in _queue_handlers.items()}
 
 
 def create_logger(
@@ -39,38 +74,72 @@ def create_logger(
     level: str = LogTag.INFO.value,
     cloudwatch_group: str | None = None,
     retention_days: int = 14,
+    queue_size: int = LOG_QUEUE_MAX_SIZE,
 ) -> Logger:
+    """
+    임포트 시점에는 stdout 출력만 구성한다. CloudWatch 핸들러는 네트워크 호출이 필요하므로
+    attach_cloudwatch_handlers()가 서버 기동 후 백그라운드에서 붙인다.
+    """
     logger = logging.getLogger(name)
     if logger.handlers:
         return logger
 
     logger.setLevel(level)
 
+    # 실제 출력 핸들러(stdout, CloudWatch)는 리스너 스레드에서만 호출된다
     ch = logging.StreamHandler()
-    ch.setFormatter(logging.Formatter("%(message)s"))
-    logger.addHandler(ch)
+    ch.setFormatter(TaggedFormatter("%(message)s"))
+
+    log_queue: Queue = Queue(maxsize=queue_size)
+    queue_handler = DroppingQueueHandler(log_queue)
+    logger.addHandler(queue_handler)
+    _queue_handlers[name] = queue_handler
+
+    listener = QueueListener(log_queue, ch, respect_handler_level=True)
+    listener.start()
+    # 종료 시 큐에 남은 로그를 모두 내보낸 뒤 스레드를 정리한다
+    atexit.register(listener.stop)
 
     if cloudwatch_group:
+        _cloudwatch_targets.append(CloudWatchTarget(name, cloudwatch_group, level, retention_days, listener))
+
+    return logger
+
+
+def attach_cloudwatch_handlers() -> None:
+    """
+    create_logger로 등록된 로거에 CloudWatch 핸들러를 붙이고 보존 기간을 설정한다.
+    boto3 자격 증명 탐색/API 호출이 블로킹이므로 이벤트 루프 밖(스레드)에서 호출한다.
+    """
+    if not _cloudwatch_targets:
+        return
+
+    import boto3
+    import watchtower
+    from botocore.exceptions import NoCredentialsError
+
+    session = boto3.Session(region_name=AWS_LOG_REGION)
+
+    while _cloudwatch_targets:
+        target = _cloudwatch_targets.pop(0)
+        logger = logging.getLogger(target.logger_name)
         try:
-            session = boto3.Session(region_name="ap-northeast-2")
             cw_client = session.client("logs")
-
             cw = watchtower.CloudWatchLogHandler(
                 boto3_client=cw_client,
-                log_group=cloudwatch_group,
+                log_group=target.log_group,
                 create_log_group=True,
                 stream_name="{strftime:%Y-%m-%d}",
                 send_interval=10,
             )
-            cw.setLevel(level)
-            cw.setFormatter(ch.formatter)
-            logger.addHandler(cw)
+            cw.setLevel(target.level)
+            cw.setFormatter(TaggedFormatter("%(message)s"))
+            # 리스너 스레드는 매 레코드마다 handlers 튜플을 읽으므로 교체만으로 반영된다
+            target.listener.handlers = (*target.listener.handlers, cw)
 
-            logs_client = cast(CloudWatchLogsClient, boto3.client("logs", region_name="ap-northeast-2"))
-            logs_client.put_retention_policy(logGroupName=cloudwatch_group, retentionInDays=retention_days)
+            logs_client = cast("CloudWatchLogsClient", cw_client)
+            logs_client.put_retention_policy(logGroupName=target.log_group, retentionInDays=target.retention_days)
         except NoCredentialsError:
             logger.warning("AWS 자격 증명 없어서 CloudWatch 로그 미적용")
         except Exception as e:
             logger.warning(f"CloudWatch retention 설정 실패: {e}")
-
-    return logger
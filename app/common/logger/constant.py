@@ -1,2 +1,5 @@
 SLOW_LATENCY_MS = 300
-EXCLUDE_PATHS = ["/health"]
+EXCLUDE_PATHS = frozenset({"/health", "/metrics"})
+LOG_QUEUE_MAX_SIZE = 10_000
+AWS_LOG_REGION = "ap-northeast-2"
+REPEATED_QUERY_WARN_COUNT = 2
@@ -0,0 +1,13 @@
+METRICS_PATH = "/metrics"
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# uvicorn --workers 사용 시 워커별 스냅샷 파일을 모아 합산한다
+METRICS_SNAPSHOT_DIR = "/tmp/olass-metrics"
+METRICS_FLUSH_INTERVAL_SEC = 5
+METRICS_STALE_SEC = 60
+
+LATENCY_BUCKETS_SEC = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+POOL_WAIT_BUCKETS_SEC = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+WRITE_BUFFER_LAG_BUCKETS_SEC = (0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+UNMATCHED_ROUTE = "unmatched"
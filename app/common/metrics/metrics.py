@@ -0,0 +1,89 @@
+import asyncio
+
+from app.common.logger.config import get_dropped_log_counts
+from app.common.metrics.constant import (
+    LATENCY_BUCKETS_SEC,
+    METRICS_FLUSH_INTERVAL_SEC,
+    METRICS_SNAPSHOT_DIR,
+    METRICS_STALE_SEC,
+    POOL_WAIT_BUCKETS_SEC,
+    WRITE_BUFFER_LAG_BUCKETS_SEC,
+)
+from app.common.metrics.registry import Counter, Gauge, Histogram, MetricsRegistry, read_snapshots, write_snapshot
+
+metrics_registry = MetricsRegistry()
+
+REQUEST_LATENCY = metrics_registry.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "라우트 템플릿/상태 코드별 요청 처리 시간",
+        ("method", "route", "status"),
+        LATENCY_BUCKETS_SEC,
+    )
+)
+DB_CHECKOUT_REQUESTS = metrics_registry.register(
+    Counter(
+        "http_requests_db_checkout_total",
+        "DB 커넥션 체크아웃 여부별 완료된 요청 수 (캐시로만 응답한 요청은 false)",
+        ("route", "db_checkout"),
+    )
+)
+CACHE_REQUESTS = metrics_registry.register(
+    Counter("cache_requests_total", "캐시 조회 결과 (hit/miss)", ("cache", "result"))
+)
+DB_POOL_WAIT = metrics_registry.register(
+    Histogram(
+        "db_pool_checkout_wait_seconds", "DB 커넥션 풀에서 커넥션을 얻기까지 걸린 시간", (), POOL_WAIT_BUCKETS_SEC
+    )
+)
+DB_POOL_EVENTS = metrics_registry.register(
+    Counter("db_pool_events_total", "DB 커넥션 풀 이벤트 수 (connect/checkout/checkin/invalidate)", ("role", "event"))
+)
+IDEMPOTENCY_REQUESTS = metrics_registry.register(
+    Counter(
+        "idempotency_requests_total",
+        "Idempotency-Key 요청 처리 결과 (stored/replayed/in_progress/mismatch/bypassed)",
+        ("result",),
+    )
+)
+SALARY_WRITE_BUFFER_EVENTS = metrics_registry.register(
+    Counter(
+        "salary_write_buffer_events_total",
+        "연봉 쓰기 버퍼 이벤트 수 (enqueued/fallback/flushed/dropped)",
+        ("event",),
+    )
+)
+SALARY_WRITE_BUFFER_LAG = metrics_registry.register(
+    Histogram(
+        "salary_write_buffer_lag_seconds",
+        "연봉 제출이 버퍼에 들어간 뒤 DB에 반영되기까지 걸린 시간",
+        (),
+        WRITE_BUFFER_LAG_BUCKETS_SEC,
+    )
+)
+metrics_registry.register(
+    Gauge(
+        "log_records_dropped",
+        "로그 큐가 가득 차 버려진 로그 개수",
+        ("logger",),
+        lambda: [((name,), count) for name, count in get_dropped_log_counts().items()],
+    )
+)
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    CACHE_REQUESTS.inc(cache, "hit" if hit else "miss")
+
+
+def render_metrics() -> str:
+    """
+    모든 워커의 스냅샷을 합산해 출력. 요청을 받은 워커는 자신의 최신 값을 먼저 기록한다.
+    """
+    write_snapshot(metrics_registry, METRICS_SNAPSHOT_DIR)
+    return metrics_registry.render(read_snapshots(METRICS_SNAPSHOT_DIR, METRICS_STALE_SEC))
+
+
+async def run_metrics_snapshot_writer(interval: int = METRICS_FLUSH_INTERVAL_SEC) -> None:
+    while True:
+        await asyncio.to_thread(write_snapshot, metrics_registry, METRICS_SNAPSHOT_DIR)
+        await asyncio.sleep(interval)
@@ -0,0 +1,187 @@
+import bisect
+import json
+import os
+import time
+from collections import defaultdict
+from typing import Any, Callable, Iterable, TypeVar
+
+LabelValues = tuple[str, ...]
+GaugeCollector = Callable[[], Iterable[tuple[LabelValues, float]]]
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str, labelnames: LabelValues = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.values: dict[LabelValues, float] = defaultdict(float)
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        self.values[labels] += amount
+
+    def collect(self) -> list[tuple[LabelValues, float]]:
+        return list(self.values.items())
+
+
+class Histogram:
+    """
+    라벨별로 [구간별 개수(+Inf 포함)..., 합계]를 리스트 하나에 저장한다. 누적 개수는 출력할 때 계산한다.
+    """
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: LabelValues = (), buckets: tuple[float, ...] = ()
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = tuple(sorted(buckets))
+        self.values: dict[LabelValues, list[float]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        series = self.values.get(labels)
+        if series is None:
+            series = self.values[labels] = [0] * (len(self.buckets) + 2)
+        series[bisect.bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def collect(self) -> list[tuple[LabelValues, list[float]]]:
+        return [(labels, list(series)) for labels, series in self.values.items()]
+
+
+class Gauge:
+    """
+    조회 시점에 collector를 호출해 현재 값을 읽는 게이지 (풀 사용량 등)
+    """
+
+    def __init__(self, name: str, documentation: str, labelnames: LabelValues, collector: GaugeCollector) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.collector = collector
+
+    def collect(self) -> list[tuple[LabelValues, float]]:
+        return list(self.collector())
+
+
+Metric = Counter | Histogram | Gauge
+M = TypeVar("M", Counter, Histogram, Gauge)
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self.metrics: dict[str, Metric] = {}
+
+    def register(self, metric: M) -> M:
+        self.metrics[metric.name] = metric
+        return metric
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        워커 하나의 현재 값을 JSON 직렬화 가능한 형태로 반환
+        """
+        return {
+            name: [[list(labels), value] for labels, value in metric.collect()] for name, metric in self.metrics.items()
+        }
+
+    def render(self, snapshots: Iterable[dict[str, Any]]) -> str:
+        """
+        여러 워커의 스냅샷을 합산해 Prometheus text format으로 출력
+        """
+        merged: dict[str, dict[LabelValues, Any]] = {name: {} for name in self.metrics}
+        for snapshot in snapshots:
+            for name, series in snapshot.items():
+                if name not in merged:
+                    continue
+                for labels, value in series:
+                    merged[name][tuple(labels)] = _merge_value(merged[name].get(tuple(labels)), value)
+
+        lines: list[str] = []
+        for name, metric in self.metrics.items():
+            metric_type = {Counter: "counter", Histogram: "histogram", Gauge: "gauge"}[type(metric)]
+            lines.append(f"# HELP {name} {metric.documentation}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for labels, value in sorted(merged[name].items()):
+                label_pairs = list(zip(metric.labelnames, labels))
+                if isinstance(metric, Histogram):
+                    lines.extend(_render_histogram(name, label_pairs, metric.buckets, value))
+                else:
+                    lines.append(f"{name}{_format_labels(label_pairs)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _merge_value(current: Any, value: Any) -> Any:
+    if current is None:
+        return value
+    if isinstance(value, list):
+        return [a + b for a, b in zip(current, value)]
+    return current + value
+
+
+def _render_histogram(
+    name: str, label_pairs: list[tuple[str, str]], buckets: tuple[float, ...], series: list[float]
+) -> list[str]:
+    lines = []
+    cumulative = 0.0
+    for bound, count in zip((*buckets, float("inf")), series[:-1]):
+        cumulative += count
+        le = "+Inf" if bound == float("inf") else _format_value(bound)
+        lines.append(f"{name}_bucket{_format_labels([*label_pairs, ('le', le)])} {_format_value(cumulative)}")
+    lines.append(f"{name}_sum{_format_labels(label_pairs)} {_format_value(series[-1])}")
+    lines.append(f"{name}_count{_format_labels(label_pairs)} {_format_value(cumulative)}")
+    return lines
+
+
+def _format_labels(label_pairs: list[tuple[str, str]]) -> str:
+    if not label_pairs:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape_label_value(value)}"' for key, value in label_pairs) + "}"
+
+
+def _escape_label_value(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def write_snapshot(registry: MetricsRegistry, directory: str) -> None:
+    """
+    현재 워커의 스냅샷을 {pid}.json으로 원자적으로 저장
+    """
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{os.getpid()}.json")
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(registry.snapshot(), f)
+    os.replace(tmp_path, path)
+
+
+def read_snapshots(directory: str, stale_sec: int) -> list[dict[str, Any]]:
+    """
+    최근 stale_sec 이내에 갱신된 워커 스냅샷 목록 (종료된 워커의 파일은 제외)
+    """
+    if not os.path.isdir(directory):
+        return []
+
+    now = time.time()
+    snapshots = []
+    for file_name in os.listdir(directory):
+        if not file_name.endswith(".json"):
+            continue
+        path = os.path.join(directory, file_name)
+        try:
+            if now - os.path.getmtime(path) > stale_sec:
+                continue
+            with open(path) as f:
+                snapshots.append(json.load(f))
+        except (OSError, ValueError):
+            continue
+    return snapshots
+
+
+def remove_snapshot(directory: str) -> None:
+    try:
+        os.remove(os.path.join(directory, f"{os.getpid()}.json"))
+    except FileNotFoundError:
+        pass
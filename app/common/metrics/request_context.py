@@ -0,0 +1,77 @@
+from collections import Counter
+from contextvars import ContextVar
+
+SPAN_POOL = "pool"
+SPAN_DB = "db"
+SPAN_REDIS = "redis"
+SPAN_SERIALIZE = "serialize"
+SPAN_HANDLER = "handler"
+
+NS_PER_MS = 1_000_000
+
+
+class RequestStats:
+    """
+    요청 하나의 구간별 소요 시간과 SQL 통계. LoggingMiddleware가 요청마다 만들고
+    SQLAlchemy 이벤트 훅, 커넥션 풀, Redis 클라이언트, 응답 직렬화가 채운다.
+    """
+
+    __slots__ = ("query_count", "query_time_ns", "statements", "span_ns", "db_checkouts")
+
+    def __init__(self) -> None:
+        self.db_checkouts = 0
+        self.query_count = 0
+        self.query_time_ns = 0
+        self.statements: Counter[str] = Counter()
+        self.span_ns: dict[str, int] = {}
+
+    def record_query(self, statement: str, elapsed_ns: int) -> None:
+        self.query_count += 1
+        self.query_time_ns += elapsed_ns
+        self.statements[statement] += 1
+
+    def record_db_checkout(self, elapsed_ns: int) -> None:
+        self.db_checkouts += 1
+        self.add_span(SPAN_POOL, elapsed_ns)
+
+    def add_span(self, name: str, elapsed_ns: int) -> None:
+        self.span_ns[name] = self.span_ns.get(name, 0) + elapsed_ns
+
+    def repeated_statements(self, threshold: int) -> list[tuple[str, int]]:
+        """같은 형태(바인딩 파라미터 제외)의 SQL이 threshold번 이상 실행된 목록"""
+        return [(statement, count) for statement, count in self.statements.items() if count >= threshold]
+
+    def phases_ms(self, total_ns: int) -> dict[str, float]:
+        """
+        구간별 소요 시간(ms). handler는 전체 시간에서 나머지 구간을 뺀 애플리케이션 코드 시간이다.
+        """
+        phases = {SPAN_POOL: self.span_ns.get(SPAN_POOL, 0), SPAN_DB: self.query_time_ns}
+        phases[SPAN_REDIS] = self.span_ns.get(SPAN_REDIS, 0)
+        phases[SPAN_SERIALIZE] = self.span_ns.get(SPAN_SERIALIZE, 0)
+        phases[SPAN_HANDLER] = max(total_ns - sum(phases.values()), 0)
+        return {name: elapsed_ns / NS_PER_MS for name, elapsed_ns in phases.items()}
+
+    def server_timing(self, total_ns: int) -> str:
+        """Server-Timing 헤더 값 (예: pool;dur=0.1, db;dur=3.2;desc="2 queries", ...)"""
+        entries = []
+        for name, ms in self.phases_ms(total_ns).items():
+            desc = f';desc="{self.query_count} queries"' if name == SPAN_DB else ""
+            entries.append(f"{name};dur={ms:.1f}{desc}")
+        return ", ".join(entries)
+
+
+request_stats: ContextVar[RequestStats | None] = ContextVar("request_stats", default=None)
+
+
+def record_span(name: str, elapsed_ns: int) -> None:
+    """현재 요청이 있으면 구간 시간을 더한다 (요청 밖에서는 무시)"""
+    stats = request_stats.get()
+    if stats is not None:
+        stats.add_span(name, elapsed_ns)
+
+
+def record_db_checkout(elapsed_ns: int) -> None:
+    """현재 요청이 DB 커넥션을 체크아웃했음을 기록 (풀 대기 시간 포함)"""
+    stats = request_stats.get()
+    if stats is not None:
+        stats.record_db_checkout(elapsed_ns)
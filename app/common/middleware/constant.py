@@ -0,0 +1,13 @@
+# 재시도 시 같은 응답을 돌려줄 POST 경로 (Idempotency-Key 헤더가 있을 때만 적용)
+IDEMPOTENT_PATHS = frozenset({"/api/asset/v1/salary", "/api/asset/v1/profile", "/api/user/v1/email"})
+IDEMPOTENCY_KEY_HEADER = b"idempotency-key"
+IDEMPOTENCY_REPLAYED_HEADER = b"idempotent-replayed"
+IDEMPOTENCY_KEY_MAX_LENGTH = 255
+
+IDEMPOTENCY_RESPONSE_REDIS_KEY = "idempotency:{path}:{key}:response"
+IDEMPOTENCY_LOCK_REDIS_KEY = "idempotency:{path}:{key}:lock"
+EXPIRE_IDEMPOTENCY_RESPONSE_SEC = 60 * 60 * 24
+# 처리 중 워커가 죽어도 잠금이 풀리도록 요청 처리 시간보다 넉넉하게 둔다
+IDEMPOTENCY_LOCK_TTL_MS = 30_000
+IDEMPOTENCY_WAIT_TIMEOUT_SEC = 10
+IDEMPOTENCY_POLL_INTERVAL_SEC = 0.05
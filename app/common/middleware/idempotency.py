@@ -0,0 +1,196 @@
+import asyncio
+import hashlib
+import uuid
+from time import monotonic
+
+from fastapi import status
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.common.metrics.metrics import IDEMPOTENCY_REQUESTS
+from app.common.middleware.constant import (
+    EXPIRE_IDEMPOTENCY_RESPONSE_SEC,
+    IDEMPOTENCY_KEY_HEADER,
+    IDEMPOTENCY_KEY_MAX_LENGTH,
+    IDEMPOTENCY_LOCK_TTL_MS,
+    IDEMPOTENCY_POLL_INTERVAL_SEC,
+    IDEMPOTENCY_REPLAYED_HEADER,
+    IDEMPOTENCY_WAIT_TIMEOUT_SEC,
+    IDEMPOTENT_PATHS,
+)
+from app.common.middleware.logger import middleware_logger
+from app.common.redis_repository.idempotency_redis_repository import IdempotencyRedisRepository, IdempotentResponse
+from app.common.response import CustomJSONResponse
+from app.common.schemas.base_schema import ErrorDetail, ErrorResponse
+from database.dependency import get_redis_pool
+
+
+class IdempotencyMiddleware:
+    """
+    Idempotency-Key 헤더가 있는 POST 요청의 첫 응답을 Redis에 저장하고, 같은 키의 재시도에는 저장된 응답을 돌려준다.
+    같은 키로 동시에 들어온 요청은 첫 요청이 끝날 때까지 기다린다. Redis 장애 시에는 그냥 통과시킨다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        paths: frozenset[str] = IDEMPOTENT_PATHS,
+        repository: IdempotencyRedisRepository | None = None,
+    ) -> None:
+        self.app = app
+        self.paths = paths
+        self._repository = repository
+
+    @property
+    def repository(self) -> IdempotencyRedisRepository:
+        # Redis 풀은 lifespan에서 만들어지므로 첫 요청 때 생성한다
+        if self._repository is None:
+            self._repository = IdempotencyRedisRepository(get_redis_pool())
+        return self._repository
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        key = self._get_idempotency_key(scope)
+        if key is None:
+            await self.app(scope, receive, send)
+            return
+        if not key or len(key) > IDEMPOTENCY_KEY_MAX_LENGTH:
+            await self._error(status.HTTP_400_BAD_REQUEST, "Idempotency-Key 형식이 올바르지 않습니다.")(
+                scope, receive, send
+            )
+            return
+
+        path = scope["path"]
+        body, receive = await self._buffer_body(receive)
+        fingerprint = hashlib.sha256(body).hexdigest()
+        token = uuid.uuid4().hex
+
+        try:
+            cached = await self._claim(path, key, token)
+        except asyncio.TimeoutError:
+            IDEMPOTENCY_REQUESTS.inc("in_progress")
+            await self._error(status.HTTP_409_CONFLICT, "같은 Idempotency-Key 요청을 처리 중입니다.")(
+                scope, receive, send
+            )
+            return
+        except Exception as e:
+            IDEMPOTENCY_REQUESTS.inc("bypassed")
+            middleware_logger.warning("[Idempotency][ClaimFailed] path=%s error=%s", path, e)
+            await self.app(scope, receive, send)
+            return
+
+        if cached is not None:
+            if cached.fingerprint != fingerprint:
+                IDEMPOTENCY_REQUESTS.inc("mismatch")
+                await self._error(
+                    status.HTTP_422_UNPROCESSABLE_ENTITY, "같은 Idempotency-Key가 다른 요청 본문에 사용되었습니다."
+                )(scope, receive, send)
+                return
+            IDEMPOTENCY_REQUESTS.inc("replayed")
+            await self._replay(cached, send)
+            return
+
+        await self._run_and_store(scope, receive, send, path, key, token, fingerprint)
+
+    async def _claim(self, path: str, key: str, token: str) -> IdempotentResponse | None:
+        """
+        저장된 응답이 있으면 반환하고, 없으면 잠금을 얻은 뒤 None을 반환한다.
+        다른 요청이 처리 중이면 응답이 저장되거나 잠금이 풀릴 때까지 기다린다.
+        """
+        deadline = monotonic() + IDEMPOTENCY_WAIT_TIMEOUT_SEC
+        while True:
+            claim = await self.repository.claim(path, key, token, IDEMPOTENCY_LOCK_TTL_MS)
+            if claim.response is not None or claim.acquired:
+                return claim.response
+            if monotonic() > deadline:
+                raise asyncio.TimeoutError
+            await asyncio.sleep(IDEMPOTENCY_POLL_INTERVAL_SEC)
+
+    async def _run_and_store(
+        self, scope: Scope, receive: Receive, send: Send, path: str, key: str, token: str, fingerprint: str
+    ) -> None:
+        start_message: Message | None = None
+        chunks: list[bytes] = []
+
+        async def send_and_capture(message: Message) -> None:
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                start_message = message
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+            await send(message)
+
+        response = None
+        try:
+            await self.app(scope, receive, send_and_capture)
+            # 5xx와 429는 다시 시도하면 결과가 달라질 수 있으므로 저장하지 않는다
+            if start_message is not None and self._is_storable(start_message["status"]):
+                response = IdempotentResponse.build(
+                    fingerprint, start_message["status"], list(start_message.get("headers", [])), b"".join(chunks)
+                )
+        finally:
+            try:
+                await self.repository.complete(path, key, token, response, EXPIRE_IDEMPOTENCY_RESPONSE_SEC)
+                if response is not None:
+                    IDEMPOTENCY_REQUESTS.inc("stored")
+            except Exception as e:
+                middleware_logger.warning("[Idempotency][StoreFailed] path=%s error=%s", path, e)
+
+    @staticmethod
+    def _is_storable(status_code: int) -> bool:
+        return status_code < status.HTTP_500_INTERNAL_SERVER_ERROR and status_code != status.HTTP_429_TOO_MANY_REQUESTS
+
+    @staticmethod
+    async def _replay(cached: IdempotentResponse, send: Send) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": cached.status_code,
+                "headers": cached.raw_headers() + [(IDEMPOTENCY_REPLAYED_HEADER, b"true")],
+            }
+        )
+        await send({"type": "http.response.body", "body": cached.raw_body()})
+
+    @staticmethod
+    async def _buffer_body(receive: Receive) -> tuple[bytes, Receive]:
+        """지문 계산을 위해 본문을 미리 읽고, 앱에는 같은 본문을 다시 전달하는 receive를 돌려준다"""
+        chunks = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] != "http.request":
+                break
+            chunks.append(message.get("body", b""))
+            more_body = message.get("more_body", False)
+        body = b"".join(chunks)
+
+        body_sent = False
+
+        async def replay_receive() -> Message:
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        return body, replay_receive
+
+    @staticmethod
+    def _get_idempotency_key(scope: Scope) -> str | None:
+        for header, value in scope["headers"]:
+            if header == IDEMPOTENCY_KEY_HEADER:
+                return value.decode("latin-1").strip()
+        return None
+
+    @staticmethod
+    def _error(status_code: int, message: str) -> CustomJSONResponse:
+        return CustomJSONResponse(
+            status_code=status_code,
+            content=ErrorResponse(
+                code=status_code,
+                message=message,
+                error=ErrorDetail(type="IdempotencyError", details={"message": message}),
+            ),
+        )
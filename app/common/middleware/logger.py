@@ -1,13 +1,16 @@
-import time
 import uuid
+from time import perf_counter_ns
 
-from starlette.requests import Request
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.common.enums import EnvironmentType
 from app.common.logger.config import create_logger
-from app.common.logger.constant import SLOW_LATENCY_MS
+from app.common.logger.constant import EXCLUDE_PATHS, REPEATED_QUERY_WARN_COUNT, SLOW_LATENCY_MS
 from app.common.logger.enums import LogTag
-from app.common.logger.mixin import ExcludePathsMiddleware
+from app.common.metrics.constant import UNMATCHED_ROUTE
+from app.common.metrics.metrics import DB_CHECKOUT_REQUESTS, REQUEST_LATENCY
+from app.common.metrics.request_context import NS_PER_MS, RequestStats, request_stats
 from main_config import settings
 
 env_enum: EnvironmentType = settings.environment
@@ -15,31 +18,82 @@ cloudwatch_group = f"olass-{env_enum.log_env}-middleware"
 
 middleware_logger = create_logger(name=__name__, level=env_enum.log_level, cloudwatch_group=cloudwatch_group)
 
+IS_DEBUG_ENV = env_enum != EnvironmentType.PROD
+SERVER_TIMING_ENABLED = IS_DEBUG_ENV or settings.server_timing_enabled
 
-class LoggingMiddleware(ExcludePathsMiddleware):
-    async def custom_dispatch(self, request: Request, call_next):
-        request_id = request.headers.get("X-Request-ID") or str(uuid.uuid4())
-        start = time.time()
+REQUEST_ID_HEADER = b"x-request-id"
+NS_PER_SEC = 1_000_000_000
 
-        middleware_logger.info(
-            f"id={request_id} method={request.method} path={request.url.path}", extra={"tag": LogTag.REQUEST.value}
-        )
+
+class LoggingMiddleware:
+    """
+    요청/응답 로깅 ASGI 미들웨어 (BaseHTTPMiddleware의 태스크/스트림 래핑 없이 send만 감싼다)
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in EXCLUDE_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        request_id = self._get_request_id(scope)
+        method, path = scope["method"], scope["path"]
+        status_code = None
+        stats = RequestStats()
+        stats_token = request_stats.set(stats)
+        start = perf_counter_ns()
+
+        middleware_logger.info("id=%s method=%s path=%s", request_id, method, path, extra={"tag": LogTag.REQUEST.value})
+
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers["X-Request-ID"] = request_id
+                if SERVER_TIMING_ENABLED:
+                    headers["Server-Timing"] = stats.server_timing(perf_counter_ns() - start)
+            await send(message)
 
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send_with_request_id)
         except Exception as e:
-            middleware_logger.error(f"id={request_id} path={request.url.path}", exc_info=e)
+            middleware_logger.error("id=%s path=%s", request_id, path, exc_info=e)
             raise
+        finally:
+            elapsed_ns = perf_counter_ns() - start
+            request_stats.reset(stats_token)
+            # 경로 파라미터로 라벨이 늘어나지 않도록 실제 경로 대신 라우트 템플릿을 쓴다
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            REQUEST_LATENCY.observe(elapsed_ns / NS_PER_SEC, method, route, str(status_code or 500))
+            DB_CHECKOUT_REQUESTS.inc(route, "true" if stats.db_checkouts else "false")
 
-        latency = int((time.time() - start) * 1000)  # ms 계산을 위해 1000 곱함
+        latency = elapsed_ns // NS_PER_MS
 
         if latency > SLOW_LATENCY_MS:
-            middleware_logger.warning(
-                f"SLOWREQUEST: latency_ms={latency} method={request.method} path={request.url.path}"
-            )
+            phases = " ".join(f"{name}_ms={ms:.1f}" for name, ms in stats.phases_ms(elapsed_ns).items())
+            middleware_logger.warning("SLOWREQUEST: latency_ms=%d method=%s path=%s %s", latency, method, path, phases)
 
         middleware_logger.info(
-            f"id={request_id} status={response.status_code} latency_ms={latency}", extra={"tag": LogTag.RESPONSE.value}
+            "id=%s status=%s latency_ms=%d queries=%d db_ms=%.1f",
+            request_id,
+            status_code,
+            latency,
+            stats.query_count,
+            stats.query_time_ns / NS_PER_MS,
+            extra={"tag": LogTag.RESPONSE.value},
         )
-        response.headers["X-Request-ID"] = request_id
-        return response
+
+        if IS_DEBUG_ENV:
+            # 같은 형태의 SQL이 한 요청에서 반복되면 N+1 조회 의심
+            for statement, count in stats.repeated_statements(REPEATED_QUERY_WARN_COUNT):
+                middleware_logger.warning("N+1 의심: path=%s count=%d statement=%s", path, count, statement)
+
+    @staticmethod
+    def _get_request_id(scope: Scope) -> str:
+        for key, value in scope["headers"]:
+            if key == REQUEST_ID_HEADER:
+                return value.decode("latin-1")
+        return str(uuid.uuid4())
@@ -26,3 +26,9 @@ class AbstractRedisRepository(ABC):
         """
         단일 값 추가/수정
         """
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> int:
+        """
+        키 삭제 (여러 개 가능)
+        """
@@ -16,6 +16,9 @@ class GeneralRedisRepository(AbstractRedisRepository, Generic[T]):
     async def set(self, key: str, value: T, expire: int, nx: bool | None = None) -> bool | None:
         return await self.redis.set(key, self._serialize(value), ex=expire, nx=nx)  # type: ignore
 
+    async def delete(self, *keys: str) -> int:
+        return await self.redis.delete(*keys)
+
     def _serialize(self, value: T) -> str:
         return str(value)
 
@@ -24,6 +27,9 @@ class GeneralRedisRepository(AbstractRedisRepository, Generic[T]):
 
 
 class IntRedisRepository(GeneralRedisRepository[int]):
+    async def incr(self, key: str) -> int:
+        return await self.redis.incr(key)
+
     def _deserialize(self, value: str) -> int:
         return int(value)
 
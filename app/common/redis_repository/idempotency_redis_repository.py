@@ -0,0 +1,90 @@
+import base64
+
+from fastapi import Depends
+from pydantic import BaseModel
+from redis.asyncio import Redis
+
+from app.common.middleware.constant import IDEMPOTENCY_LOCK_REDIS_KEY, IDEMPOTENCY_RESPONSE_REDIS_KEY
+from app.common.redis_repository.general_redis_repository import GeneralRedisRepository
+from database.dependency import get_redis_pool
+
+# 저장된 응답이 있으면 돌려주고, 없으면 처리 잠금을 시도한다 (1 round trip)
+# 반환값: {1, 응답} 재응답 / {2, ""} 잠금 획득 / {0, ""} 다른 요청이 처리 중
+CLAIM_LUA = """
+local cached = redis.call('GET', KEYS[1])
+if cached then
+    return {1, cached}
+end
+if redis.call('SET', KEYS[2], ARGV[1], 'NX', 'PX', ARGV[2]) then
+    return {2, ''}
+end
+return {0, ''}
+"""
+
+# 응답을 저장(ARGV[2]가 비어 있으면 생략)하고, 내가 건 잠금일 때만 푼다
+COMPLETE_LUA = """
+if ARGV[2] ~= '' then
+    redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+end
+if redis.call('GET', KEYS[2]) == ARGV[1] then
+    redis.call('DEL', KEYS[2])
+end
+return 1
+"""
+
+CLAIM_REPLAY = 1
+CLAIM_ACQUIRED = 2
+
+
+class IdempotentResponse(BaseModel):
+    fingerprint: str
+    status_code: int
+    headers: list[tuple[str, str]]
+    body: str  # base64
+
+    @classmethod
+    def build(
+        cls, fingerprint: str, status_code: int, headers: list[tuple[bytes, bytes]], body: bytes
+    ) -> "IdempotentResponse":
+        return cls(
+            fingerprint=fingerprint,
+            status_code=status_code,
+            headers=[(key.decode("latin-1"), value.decode("latin-1")) for key, value in headers],
+            body=base64.b64encode(body).decode(),
+        )
+
+    def raw_headers(self) -> list[tuple[bytes, bytes]]:
+        return [(key.encode("latin-1"), value.encode("latin-1")) for key, value in self.headers]
+
+    def raw_body(self) -> bytes:
+        return base64.b64decode(self.body)
+
+
+class IdempotencyClaim(BaseModel):
+    acquired: bool
+    response: IdempotentResponse | None = None
+
+
+class IdempotencyRedisRepository(GeneralRedisRepository[str]):
+    def __init__(self, redis: Redis = Depends(get_redis_pool)) -> None:
+        super().__init__(redis)
+        self.claim_script = redis.register_script(CLAIM_LUA)
+        self.complete_script = redis.register_script(COMPLETE_LUA)
+
+    @staticmethod
+    def _keys(path: str, key: str) -> list[str]:
+        return [
+            IDEMPOTENCY_RESPONSE_REDIS_KEY.format(path=path, key=key),
+            IDEMPOTENCY_LOCK_REDIS_KEY.format(path=path, key=key),
+        ]
+
+    async def claim(self, path: str, key: str, token: str, lock_ttl_ms: int) -> IdempotencyClaim:
+        status, cached = await self.claim_script(keys=self._keys(path, key), args=[token, lock_ttl_ms])
+        if status == CLAIM_REPLAY:
+            return IdempotencyClaim(acquired=False, response=IdempotentResponse.model_validate_json(cached))
+        return IdempotencyClaim(acquired=status == CLAIM_ACQUIRED)
+
+    async def complete(self, path: str, key: str, token: str, response: IdempotentResponse | None, expire: int) -> None:
+        """응답을 저장하고 잠금을 푼다. response가 None이면(5xx 등) 저장 없이 잠금만 풀어 재시도를 허용"""
+        payload = response.model_dump_json() if response is not None else ""
+        await self.complete_script(keys=self._keys(path, key), args=[token, payload, expire])
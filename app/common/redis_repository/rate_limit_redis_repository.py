@@ -0,0 +1,57 @@
+from fastapi import Depends
+from pydantic import BaseModel
+from redis.asyncio import Redis
+
+from app.common.redis_repository.general_redis_repository import GeneralRedisRepository
+from database.dependency import get_redis_pool
+
+# 슬라이딩 윈도우 로그: ZSET에 요청 시각(ms)을 쌓고 윈도우 밖 기록을 지운 뒤 개수로 판정한다.
+# 정리/판정/기록을 한 번에 수행해 동시 요청 간 경쟁 없이 1 round trip으로 끝난다.
+# 반환값: {허용 여부(1/0), 남은 횟수, 가장 오래된 기록이 윈도우를 벗어나기까지 남은 ms}
+SLIDING_WINDOW_LUA = """
+local key = KEYS[1]
+local max_calls = tonumber(ARGV[1])
+local window_ms = tonumber(ARGV[2])
+local member = ARGV[3]
+
+local time = redis.call('TIME')
+local now_ms = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now_ms - window_ms)
+local count = redis.call('ZCARD', key)
+
+local allowed = 0
+if count < max_calls then
+    redis.call('ZADD', key, now_ms, member)
+    redis.call('PEXPIRE', key, window_ms)
+    count = count + 1
+    allowed = 1
+end
+
+local reset_ms = window_ms
+local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+if oldest[2] then
+    reset_ms = tonumber(oldest[2]) + window_ms - now_ms
+end
+
+return {allowed, max_calls - count, reset_ms}
+"""
+
+
+class RateLimitResult(BaseModel):
+    allowed: bool
+    remaining: int
+    reset_ms: int
+
+
+class RateLimitRedisRepository(GeneralRedisRepository[str]):
+    def __init__(self, redis: Redis = Depends(get_redis_pool)) -> None:
+        super().__init__(redis)
+        # 스크립트 본문은 최초 1회만 SCRIPT LOAD 되고 이후에는 EVALSHA로 호출된다
+        self.sliding_window_script = redis.register_script(SLIDING_WINDOW_LUA)
+
+    async def hit(self, key: str, member: str, max_calls: int, period_sec: int) -> RateLimitResult:
+        allowed, remaining, reset_ms = await self.sliding_window_script(
+            keys=[key], args=[max_calls, period_sec * 1000, member]
+        )
+        return RateLimitResult(allowed=bool(allowed), remaining=max(int(remaining), 0), reset_ms=int(reset_ms))
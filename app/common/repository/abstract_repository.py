@@ -1,16 +1,38 @@
 from abc import ABC, abstractmethod
-from typing import Any, Generic, Optional, TypeVar
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Generic, Iterator, Optional, Sequence, TypeVar
 
 from fastapi import Depends
-from sqlalchemy import select
-from sqlalchemy.exc import IntegrityError
+from pydantic import BaseModel
+from sqlalchemy import Result, func, select
+from sqlalchemy.dialects.mysql import Insert, insert
+from sqlalchemy.exc import DBAPIError, IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from database.constant import MYSQL_FOREIGN_KEY_VIOLATION_CODE, REPLICA_BIND_ARGUMENT
 from database.dependency import get_mysql_session_router
+from main_config import settings
 
 T = TypeVar("T")
 
 
+class BulkWriteResult(BaseModel):
+    """
+    일괄 쓰기 결과. MySQL affected rows 기준이라 ON DUPLICATE KEY UPDATE에서 값이 바뀌지 않은 행은
+    inserted로 집계된다 (갱신 컬럼에 updated_at을 넣으면 기존 행은 항상 updated로 센다).
+    """
+
+    inserted: int = 0
+    updated: int = 0
+    batches: int = 0
+
+
+def is_foreign_key_violation(error: IntegrityError) -> bool:
+    """참조하는 부모 행이 없어 실패한 INSERT/UPDATE인지 확인"""
+    args: tuple[Any, ...] = getattr(error.orig, "args", ())
+    return bool(args) and args[0] == MYSQL_FOREIGN_KEY_VIOLATION_CODE
+
+
 class BaseRepository(ABC, Generic[T]):
     def __init__(self, session: AsyncSession = Depends(get_mysql_session_router)):
         self.session = session
@@ -26,6 +48,137 @@ class BaseRepository(ABC, Generic[T]):
             await self.session.rollback()
             raise e
 
+    async def execute_and_commit(self, stmt: Any) -> int:
+        """INSERT ... ON DUPLICATE KEY UPDATE 같은 단일 쓰기 문장을 실행하고 커밋. 영향받은 행 수를 반환"""
+        try:
+            result = await self.session.execute(stmt)
+            await self.session.commit()
+        except IntegrityError as e:
+            await self.session.rollback()
+            raise e
+        return result.rowcount  # type: ignore[attr-defined]
+
+    async def save_many(
+        self, model: type[T], rows: Sequence[T | dict[str, Any]], batch_size: int | None = None
+    ) -> BulkWriteResult:
+        """
+        batch_size개씩 다중 행 INSERT로 저장하고 배치마다 커밋한다.
+        실패하면 해당 배치만 롤백되고 앞서 커밋된 배치는 유지된다.
+        """
+        result = BulkWriteResult()
+        for chunk in self._chunk_rows(model, rows, batch_size):
+            result.inserted += await self.execute_and_commit(insert(model).values(chunk))
+            result.batches += 1
+        return result
+
+    async def upsert_many(
+        self,
+        model: type[T],
+        rows: Sequence[T | dict[str, Any]],
+        update_columns: Sequence[str],
+        batch_size: int | None = None,
+        version_column: str | None = None,
+    ) -> BulkWriteResult:
+        """
+        batch_size개씩 다중 행 INSERT ... ON DUPLICATE KEY UPDATE로 저장하고 배치마다 커밋한다.
+        유니크 키가 겹치는 행은 update_columns만 새 값으로 갱신한다.
+        version_column을 주면 그 값이 기존 행보다 작은(늦게 도착한 오래된) 행은 갱신하지 않는다.
+        """
+        result = BulkWriteResult()
+        for chunk in self._chunk_rows(model, rows, batch_size):
+            stmt = insert(model).values(chunk)
+            stmt = stmt.on_duplicate_key_update(self._duplicate_key_updates(stmt, update_columns, version_column))
+            affected = await self.execute_and_commit(stmt)
+            # 새 행은 1, 값이 바뀐 기존 행은 2로 집계된다
+            updated = max(affected - len(chunk), 0)
+            result.inserted += len(chunk) - updated
+            result.updated += updated
+            result.batches += 1
+        return result
+
+    @staticmethod
+    def _duplicate_key_updates(
+        stmt: Insert, update_columns: Sequence[str], version_column: str | None = None
+    ) -> list[tuple[str, Any]]:
+        """
+        ON DUPLICATE KEY UPDATE 대입 목록
+        version_column이 있으면 새 값이 같거나 더 클 때만 각 컬럼을 갱신한다.
+        MySQL은 대입을 순서대로 적용해 뒤의 식이 갱신된 값을 보므로 version_column은 마지막에 둔다.
+        """
+        if version_column is None:
+            return [(column, stmt.inserted[column]) for column in update_columns]
+
+        table = stmt.table
+        is_newer = stmt.inserted[version_column] >= table.c[version_column]
+        updates: list[tuple[str, Any]] = [
+            (column, func.if_(is_newer, stmt.inserted[column], table.c[column]))
+            for column in update_columns
+            if column != version_column
+        ]
+        updates.append((version_column, func.greatest(stmt.inserted[version_column], table.c[version_column])))
+        return updates
+
+    @staticmethod
+    def _chunk_rows(
+        model: type[T], rows: Sequence[T | dict[str, Any]], batch_size: int | None
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        모델/딕셔너리를 기본값이 채워진 컬럼 딕셔너리로 바꿔 batch_size개씩 나눈다.
+        다중 행 INSERT는 모든 행의 컬럼이 같아야 하므로 딕셔너리도 모델을 거쳐 기본값을 채운다.
+        """
+        size = batch_size or settings.db_bulk_write_batch_size
+        columns = [column.key for column in model.__table__.columns]  # type: ignore[attr-defined]
+        values = []
+        for row in rows:
+            dumped = (row if isinstance(row, model) else model(**row)).model_dump()  # type: ignore
+            values.append({column: dumped.get(column) for column in columns})
+        for start in range(0, len(values), size):
+            yield values[start : start + size]
+
+    @asynccontextmanager
+    async def unit_of_work(self) -> AsyncIterator[None]:
+        """
+        블록 안에서 stage/flush로 쌓은 변경을 블록이 끝날 때 한 번에 커밋하고, 예외가 나면 전부 롤백한다.
+        같은 요청의 레포지토리는 세션을 공유하므로 어느 레포지토리에서 열어도 같은 트랜잭션이다.
+        """
+        try:
+            yield
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+
+    def stage(self, instance: T) -> T:
+        """커밋하지 않고 세션에만 추가 (unit_of_work 종료 시 함께 INSERT)"""
+        self.session.add(instance)
+        return instance
+
+    async def stage_and_flush(self, instance: T) -> T:
+        """커밋 없이 바로 INSERT해 자동 증가 PK 등을 채운다"""
+        self.session.add(instance)
+        await self.session.flush()
+        return instance
+
+    async def execute_read(self, stmt: Any) -> Result[Any]:
+        """
+        읽기 전용 조회. replica가 설정되어 있고 이 요청에서 아직 쓰기가 없었으면 replica에서 실행한다.
+        """
+        return await self._execute_idempotent(stmt, bind_arguments={REPLICA_BIND_ARGUMENT: True})
+
+    async def _execute_idempotent(self, stmt: Any, bind_arguments: dict[str, Any] | None = None) -> Result[Any]:
+        """
+        멱등 조회 실행. 트랜잭션의 첫 문장에서 커넥션이 끊겨 있었으면(DB 재시작, idle timeout)
+        롤백 후 새 커넥션으로 한 번만 재시도한다. 진행 중인 트랜잭션은 재시도하지 않는다.
+        """
+        first_use = not self.session.in_transaction()
+        try:
+            return await self.session.execute(stmt, bind_arguments=bind_arguments)
+        except DBAPIError as e:
+            if not (first_use and e.connection_invalidated):
+                raise
+            await self.session.rollback()
+            return await self.session.execute(stmt, bind_arguments=bind_arguments)
+
     @abstractmethod
     async def save(self, instance: T, refresh: bool = False) -> Optional[T]:
         """인스턴스 저장 후 커밋하고 리턴"""
@@ -39,5 +192,5 @@ class BaseRepository(ABC, Generic[T]):
     # 공통 조회 헬퍼: id 하나로 조회
     async def _get_by_id(self, model: type[T], id_: Any) -> Optional[T]:
         stmt = select(model).where(getattr(model, "id") == id_)  # type: ignore
-        result = await self.session.execute(stmt)
+        result = await self._execute_idempotent(stmt)
         return result.scalar_one_or_none()
@@ -1,23 +1,43 @@
+from functools import lru_cache
+from time import perf_counter_ns
 from typing import Any
 
+import orjson
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
-from app.common.schemas.base_schema import BaseResponseModel, to_camel
+from app.common.metrics.request_context import SPAN_SERIALIZE, record_span
+from app.common.schemas.base_schema import to_camel
+
+
+@lru_cache(maxsize=1024)
+def camel_key(key: str) -> str:
+    """응답 키는 몇 종류 안 되므로 변환 결과를 재사용한다"""
+    return to_camel(key) if "_" in key else key
 
 
 def convert_keys(obj: Any) -> Any:
-    if isinstance(obj, BaseResponseModel):
-        return obj.model_dump(by_alias=True)
-    elif isinstance(obj, BaseModel):
-        return obj.model_dump(by_alias=True)
+    if isinstance(obj, BaseModel):
+        # alias(camelCase) 매핑은 pydantic이 모델 클래스 생성 시 미리 계산해 둔다
+        return obj.model_dump(mode="json", by_alias=True)
     elif isinstance(obj, dict):
-        return {to_camel(k) if isinstance(k, str) else k: convert_keys(v) for k, v in obj.items()}
+        return {camel_key(k) if isinstance(k, str) else k: convert_keys(v) for k, v in obj.items()}
     elif isinstance(obj, list):
         return [convert_keys(i) for i in obj]
     return obj
 
 
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
 class CustomJSONResponse(JSONResponse):
     def render(self, content: Any) -> bytes:
-        return super().render(convert_keys(content))
+        start = perf_counter_ns()
+        try:
+            if isinstance(content, BaseModel):
+                # 모델은 dict를 거치지 않고 pydantic-core가 바로 JSON 바이트로 직렬화한다
+                return content.model_dump_json(by_alias=True).encode()
+            return dumps(convert_keys(content))
+        finally:
+            record_span(SPAN_SERIALIZE, perf_counter_ns() - start)
@@ -26,7 +26,8 @@ class BaseResponseModel(BaseModel):
 
     def model_dump(self, **kwargs):
         """기본 응답은 camelCase로 직렬화되도록 보장"""
-        return super().model_dump(by_alias=True, **kwargs)
+        kwargs.setdefault("by_alias", True)
+        return super().model_dump(**kwargs)
 
 
 class SuccessGetResponse(BaseResponseModel):
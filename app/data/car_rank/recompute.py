@@ -0,0 +1,39 @@
+import asyncio
+
+from app.module.asset.repositories.salary_histogram_redis_repository import SalaryHistogramRedisRepository
+from app.module.asset.repositories.user_car_rank_redis_repository import UserCarRankRedisRepository
+from app.module.asset.repositories.user_profile_repository import UserProfileRepository
+from app.module.asset.repositories.user_salary_repository import UserSalaryRepository
+from app.module.asset.services.car_rank_service import CarRankService
+from app.module.asset.services.percentile_service import SalaryPercentileService
+from database.config import mysql_session_factory
+from database.dependency import close_redis_pool, get_redis_pool
+
+# user_profile에 저장된 차량 등급/상위 퍼센트를 현재 SalaryStat과 연봉 히스토그램 기준으로 다시 계산한다.
+# SalaryStat이 바뀐 뒤(wanted 수집 시 자동 실행)나 히스토그램 재구축 후, 컬럼 추가 직후 기존 행을 채울 때 실행한다.
+# 저장된 퍼센트는 계산 시점의 히스토그램 기준이라 다른 사용자의 제출이 쌓이면 조금씩 어긋나므로,
+# 분포를 다시 맞추려면 주기적으로 직접 실행한다.
+
+
+async def recompute_car_ranks() -> int:
+    async with mysql_session_factory() as session:
+        car_rank_service = CarRankService(
+            percentile_service=SalaryPercentileService(
+                histogram_repo=SalaryHistogramRedisRepository(get_redis_pool()),
+                user_salary_repo=UserSalaryRepository(session),
+            ),
+            user_profile_repo=UserProfileRepository(session),
+            car_rank_cache_repo=UserCarRankRedisRepository(get_redis_pool()),
+        )
+        return await car_rank_service.recompute_all()
+
+
+async def main():
+    updated = await recompute_car_ranks()
+    await close_redis_pool()
+
+    print(f"차량 등급/퍼센트 재계산 완료: {updated}개 프로필")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
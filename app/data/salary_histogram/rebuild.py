@@ -0,0 +1,30 @@
+import asyncio
+
+from app.module.asset.repositories.salary_histogram_redis_repository import SalaryHistogramRedisRepository
+from app.module.asset.repositories.user_salary_repository import UserSalaryRepository
+from app.module.asset.services.percentile_service import SalaryPercentileService
+from database.config import mysql_session_factory
+from database.dependency import close_redis_pool, get_redis_pool
+
+# user_salary 전체를 MySQL에서 구간별로 집계해 Redis 연봉 히스토그램을 다시 만든다.
+# 제출 시 증감으로 유지되는 값의 오차(동시 재제출, 쓰기 버퍼 유실 등)를 바로잡는다. wanted 수집 시 자동 실행된다.
+
+
+async def rebuild_salary_histogram() -> int:
+    async with mysql_session_factory() as session:
+        percentile_service = SalaryPercentileService(
+            histogram_repo=SalaryHistogramRedisRepository(get_redis_pool()),
+            user_salary_repo=UserSalaryRepository(session),
+        )
+        return await percentile_service.rebuild()
+
+
+async def main():
+    rebuilt = await rebuild_salary_histogram()
+    await close_redis_pool()
+
+    print(f"연봉 히스토그램 재구축 완료: {rebuilt}개 (job_id, experience)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
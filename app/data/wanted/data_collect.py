@@ -12,14 +12,19 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select, WebDriverWait
 from webdriver_manager.chrome import ChromeDriverManager
 
+from app.api.asset.v1.constant import JOB_ETAG_REDIS_KEY, JOB_REDIS_KEY, SALARY_STAT_VERSION_REDIS_KEY
 from app.common.enums import EnvironmentType
+from app.common.redis_repository.general_redis_repository import GeneralRedisRepository, IntRedisRepository
+from app.data.car_rank.recompute import recompute_car_ranks
 from app.data.excel import load_excel
+from app.data.salary_histogram.rebuild import rebuild_salary_histogram
 from app.data.wanted.source.dto import JobData, TooltipData
 from app.module.asset.model import Job, JobGroup, SalaryStat
 from app.module.asset.repositories.job_group_repository import JobGroupRepository
 from app.module.asset.repositories.job_repository import JobRepository
 from app.module.asset.repositories.salary_stat_repository import SalaryStatRepository
-from database.dependency import get_mysql_session_router
+from database.config import mysql_session_factory
+from database.dependency import close_redis_pool, get_redis_pool
 
 load_dotenv()
 
@@ -78,9 +83,15 @@ async def get_wanted_job_num_preset(number: int, driver: webdriver.Chrome) -> Jo
     return JobData(job_group=job_group, job=job, tooltip_data=tooltip_data_list)
 
 
+def get_job_name(preset_data: JobData) -> str:
+    # 직군 전체 직무는 직군마다 이름이 같으므로 직군명을 붙여 구분한다
+    if preset_data.job == "전체":
+        return f"{preset_data.job_group} 전체"
+    return preset_data.job
+
+
 async def main():
     wanted_job_rows = load_excel("./etc/wanted_job.xlsx")
-    session = get_mysql_session_router()
     chrome_options = Options()
     chrome_options.add_argument("--headless")
     chrome_options.add_argument("--no-sandbox")
@@ -104,10 +115,8 @@ async def main():
         # TODO: 일회성 chrome driver 설치하여 저장함. 별도 자동화 필요
         driver = webdriver.Chrome(service=Service("/usr/local/bin/chromedriver"), options=chrome_options)
 
-    job_group_repo = JobGroupRepository(session)
-    job_repo = JobRepository(session)
-    salary_stat_repo = SalaryStatRepository(session)
-
+    # 스크래핑을 먼저 끝내고 DB에는 일괄로 저장한다
+    preset_data_list: list[JobData] = []
     for wanted_job_row in wanted_job_rows:
         preset_data: JobData | None = await get_wanted_job_num_preset(wanted_job_row[0], driver)
 
@@ -115,45 +124,75 @@ async def main():
             print(wanted_job_row[0])
             continue
 
-        job_group_name = preset_data.job_group
-        job_name = preset_data.job
-        tooltip_data_list: list[TooltipData] = preset_data.tooltip_data
+        print(f"job_group_name={preset_data.job_group}, job_name={preset_data.job}")
+        preset_data_list.append(preset_data)
+
+    driver.quit()
 
-        print(f"{job_group_name=}, {job_name=}")
+    async with mysql_session_factory() as session:
+        job_group_repo = JobGroupRepository(session)
+        job_repo = JobRepository(session)
+        salary_stat_repo = SalaryStatRepository(session)
 
-        job_group: JobGroup | None = await job_group_repo.get_by_name(job_group_name)
-        if not job_group:
-            cur_job_group = JobGroup(name=job_group_name)
-            job_group = await job_group_repo.save(cur_job_group)
+        # 직군은 수가 적어 한 건씩 조회/저장
+        job_group_ids: dict[str, int] = {}
+        for job_group_name in dict.fromkeys(preset_data.job_group for preset_data in preset_data_list):
+            job_group: JobGroup | None = await job_group_repo.get_by_name(job_group_name)
             if not job_group:
-                continue
-
-        assert job_group.id is not None
-        job = await job_repo.find_by_group_and_name(job_group.id, job_name)
-        if not job:
-            if job_name == "전체":
-                job_name = f"{job_group_name} 전체"
-
-            new_job = Job(group_id=job_group.id, name=job_name)
-            job = await job_repo.save(new_job)
-            if not job:
-                continue
-
-        assert job.id  # SQLModel 특성상, 데이터 타입 존재 확인 필요
-        for tooltip_data in tooltip_data_list:
-            tooltip_data: TooltipData
-
-            avg = int(tooltip_data.salary) * 10_000  # 천만원 단위 곱
-            salary_stat = await salary_stat_repo.get_by_job_id_experience(job.id, tooltip_data.experience)
-            if not salary_stat:
-                salary_stat = SalaryStat(
-                    job_id=job.id,
-                    experience=tooltip_data.experience,
-                    avg=avg,
-                )
-                await salary_stat_repo.save(salary_stat)
-
-    driver.quit()
+                job_group = await job_group_repo.save(JobGroup(name=job_group_name))
+            if job_group and job_group.id:
+                job_group_ids[job_group_name] = job_group.id
+
+        preset_data_list = [preset_data for preset_data in preset_data_list if preset_data.job_group in job_group_ids]
+        job_keys = [
+            (job_group_ids[preset_data.job_group], get_job_name(preset_data)) for preset_data in preset_data_list
+        ]
+
+        job_result = await job_repo.bulk_upsert([Job(group_id=group_id, name=name) for group_id, name in job_keys])
+        job_ids = {(job.group_id, job.name): job.id for job in await job_repo.gets()}
+
+        salary_stats = [
+            SalaryStat(
+                job_id=job_ids[job_key],
+                experience=tooltip_data.experience,
+                avg=int(tooltip_data.salary) * 10_000,  # 천만원 단위 곱
+            )
+            for job_key, preset_data in zip(job_keys, preset_data_list)
+            for tooltip_data in preset_data.tooltip_data
+        ]
+        # 평균 연봉이 그대로인 행은 쓰지 않는다. upsert가 updated_at을 갱신하면 모든 행이 바뀐 것으로 집계돼
+        # 수집할 때마다 SalaryStat 버전과 등급 재계산이 돌게 된다
+        current_avgs = {(stat.job_id, stat.experience): stat.avg for stat in await salary_stat_repo.gets()}
+        changed_salary_stats = [
+            stat for stat in salary_stats if current_avgs.get((stat.job_id, stat.experience)) != stat.avg
+        ]
+        salary_stat_result = await salary_stat_repo.bulk_upsert(changed_salary_stats)
+
+    print(f"{job_result=}, {salary_stat_result=}")
+    is_job_catalog_changed = job_result.inserted > 0
+    is_salary_stat_changed = len(changed_salary_stats) > 0
+
+    job_cache_repo = GeneralRedisRepository(get_redis_pool())
+    salary_stat_version_repo = IntRedisRepository(get_redis_pool())
+
+    # 직무 목록이 바뀌었으면 /jobs 캐시를 비워 다음 요청에서 새로 채우도록 한다
+    if is_job_catalog_changed:
+        await job_cache_repo.delete(JOB_ETAG_REDIS_KEY, JOB_REDIS_KEY)
+
+    # SalaryStat 버전을 올려 각 워커의 메모리 테이블이 다시 적재되도록 한다
+    if is_salary_stat_changed:
+        await salary_stat_version_repo.incr(SALARY_STAT_VERSION_REDIS_KEY)
+
+    # 주기 수집 때마다 연봉 히스토그램을 DB 기준으로 다시 만든다
+    histogram_rebuilt = await rebuild_salary_histogram()
+    print(f"{histogram_rebuilt=}")
+
+    # 평균 연봉이 바뀌었으면 프로필에 저장된 등급/퍼센트를 새 통계/히스토그램 기준으로 다시 계산한다
+    if is_salary_stat_changed:
+        car_rank_updated = await recompute_car_ranks()
+        print(f"{car_rank_updated=}")
+
+    await close_redis_pool()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,68 @@
+import hashlib
+
+from pydantic import BaseModel, ConfigDict
+
+from app.api.asset.v1.schemas.asset_schema import JobItem, JobResponseData, JobSuccessResponse
+from app.module.asset.model import Job
+
+
+class JobCatalogSnapshot(BaseModel):
+    """
+    직무 목록 응답을 camelCase JSON 바이트로 미리 직렬화해 둔 불변 스냅샷
+    etag는 body의 해시이므로 직무 목록이 바뀌면 함께 바뀐다.
+    """
+
+    body: bytes
+    etag: str
+
+    model_config = ConfigDict(frozen=True)
+
+    @classmethod
+    def from_jobs(cls, jobs: list[Job]) -> "JobCatalogSnapshot":
+        response = JobSuccessResponse(data=JobResponseData(items=[JobItem.model_validate(job) for job in jobs]))
+        body = response.model_dump_json(by_alias=True).encode()
+        return cls(body=body, etag=cls.make_etag(body))
+
+    @staticmethod
+    def make_etag(body: bytes) -> str:
+        return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+    def matches(self, if_none_match: str | None) -> bool:
+        """If-None-Match 헤더 값(콤마 구분, weak 표기 포함)이 현재 etag와 일치하는지 확인"""
+        if not if_none_match:
+            return False
+
+        for tag in if_none_match.split(","):
+            tag = tag.strip()
+            if tag == "*" or tag.removeprefix("W/") == self.etag:
+                return True
+        return False
+
+
+class JobCatalogSnapshotHolder:
+    """
+    워커 프로세스 단위로 마지막 스냅샷을 보관한다.
+    Redis의 etag와 같으면 본문을 다시 받지 않고 그대로 재사용한다.
+    """
+
+    def __init__(self) -> None:
+        self._snapshot: JobCatalogSnapshot | None = None
+
+    def get(self, etag: str) -> JobCatalogSnapshot | None:
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.etag == etag:
+            return snapshot
+        return None
+
+    def set(self, snapshot: JobCatalogSnapshot) -> None:
+        self._snapshot = snapshot
+
+    def clear(self) -> None:
+        self._snapshot = None
+
+
+job_catalog_snapshot_holder = JobCatalogSnapshotHolder()
+
+
+def get_job_catalog_snapshot_holder() -> JobCatalogSnapshotHolder:
+    return job_catalog_snapshot_holder
@@ -0,0 +1,115 @@
+import asyncio
+from array import array
+from typing import Any, Sequence
+
+from app.api.asset.v1.constant import (
+    MAX_EXPERIENCE_YEAR,
+    SALARY_STAT_VERSION_CHECK_SEC,
+    SALARY_STAT_VERSION_REDIS_KEY,
+)
+from app.common.metrics.metrics import record_cache
+from app.common.redis_repository.general_redis_repository import IntRedisRepository
+from app.module.asset.logger import asset_logger
+from app.module.asset.model import SalaryStat
+from app.module.asset.repositories.salary_stat_repository import SalaryStatRepository
+from database.config import mysql_session_factory
+from database.dependency import get_redis_pool
+
+EXPERIENCE_SLOTS = MAX_EXPERIENCE_YEAR + 1
+EMPTY_AVG = -1
+
+
+class SalaryStatTable:
+    """
+    (job_id, experience) -> 평균 연봉을 배열 하나에 담은 워커 단위 조회 테이블
+    index = job_id * EXPERIENCE_SLOTS + experience 로 O(1) 조회하며,
+    Redis의 SalaryStat 버전이 바뀌었을 때만 DB에서 다시 적재한다.
+    """
+
+    def __init__(self) -> None:
+        self._avg: array = array("q")
+        self._rows = 0
+        self.version: int | None = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.version is not None
+
+    def load(self, stats: Sequence[SalaryStat], version: int) -> None:
+        rows: list[tuple[int, int, int]] = [
+            (stat.job_id, stat.experience, stat.avg)
+            for stat in stats
+            if stat.job_id is not None and stat.experience is not None and 0 <= stat.experience < EXPERIENCE_SLOTS
+        ]
+        max_job_id = max((job_id for job_id, _, _ in rows), default=-1)
+
+        avg = array("q", [EMPTY_AVG]) * ((max_job_id + 1) * EXPERIENCE_SLOTS)
+        for job_id, experience, stat_avg in rows:
+            avg[job_id * EXPERIENCE_SLOTS + experience] = stat_avg
+
+        # 새 배열을 만든 뒤 한 번에 교체하므로 조회 중인 요청은 이전 배열을 그대로 본다
+        self._avg = avg
+        self._rows = len(rows)
+        self.version = version
+
+    def get_avg(self, job_id: int, experience: int) -> int | None:
+        if 0 <= experience < EXPERIENCE_SLOTS:
+            index = job_id * EXPERIENCE_SLOTS + experience
+            if 0 <= index < len(self._avg) and self._avg[index] != EMPTY_AVG:
+                self.hits += 1
+                record_cache("salary_stat_table", True)
+                return self._avg[index]
+
+        self.misses += 1
+        record_cache("salary_stat_table", False)
+        return None
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "loaded": self.is_loaded,
+            "version": self.version,
+            "rows": self._rows,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    async def refresh(self, salary_stat_repo: SalaryStatRepository, version_repo: IntRedisRepository) -> bool:
+        """Redis 버전이 적재된 버전과 다를 때만 다시 적재하고, 적재 여부를 반환"""
+        version = await version_repo.get(SALARY_STAT_VERSION_REDIS_KEY) or 0
+        if version == self.version:
+            return False
+
+        stats = await salary_stat_repo.gets()
+        self.load(stats, version)
+        return True
+
+
+salary_stat_table = SalaryStatTable()
+
+
+def get_salary_stat_table() -> SalaryStatTable:
+    return salary_stat_table
+
+
+async def refresh_salary_stat_table(version_repo: IntRedisRepository | None = None) -> None:
+    version_repo = version_repo or IntRedisRepository(get_redis_pool())
+
+    async with mysql_session_factory() as session:
+        refreshed = await salary_stat_table.refresh(SalaryStatRepository(session), version_repo)
+
+    if refreshed:
+        asset_logger.info("[SalaryStatTable][Refreshed] %s", salary_stat_table.stats())
+
+
+async def run_salary_stat_table_refresher(interval_sec: int = SALARY_STAT_VERSION_CHECK_SEC) -> None:
+    """SalaryStat 버전을 주기적으로 확인해 바뀌었을 때만 테이블을 다시 적재"""
+    version_repo = IntRedisRepository(get_redis_pool())
+
+    while True:
+        await asyncio.sleep(interval_sec)
+        try:
+            await refresh_salary_stat_table(version_repo)
+        except Exception as e:
+            asset_logger.warning("[SalaryStatTable][RefreshFailed] %s", e)
@@ -1,7 +1,7 @@
 from typing import Optional
 from uuid import uuid4
 
-from sqlalchemy import BINARY, Column, ForeignKey, UniqueConstraint
+from sqlalchemy import BINARY, BigInteger, Column, ForeignKey, UniqueConstraint
 from sqlmodel import Field, Relationship
 
 from app.common.mixin.timestamp import TimestampMixin
@@ -52,6 +52,16 @@ class UserSalary(TimestampMixin, table=True):
     job_id: int = Field(foreign_key="job.id")
     experience: int = Field(description="경력")
     salary: int = Field(description="연봉")
+    version: int = Field(
+        default=0,
+        sa_column=Column(
+            "version",
+            BigInteger,
+            nullable=False,
+            server_default="0",
+            comment="제출 순번 (Redis INCR). 더 작은 값의 upsert는 무시",
+        ),
+    )
 
     job: Job | None = Relationship(back_populates="salary")
     profile: Optional["UserProfile"] = Relationship(back_populates="salary")
@@ -75,5 +85,7 @@ class UserProfile(TimestampMixin, table=True):
     save_rate: int | None = Field(nullable=True, description="저축률")
     has_car: bool | None = Field(nullable=True, description="자동차 보유")
     is_monthly_rent: bool | None = Field(nullable=True, description="월세 여부")
+    car_rank: str | None = Field(default=None, max_length=32, nullable=True, description="차량 등급 (저장 시 계산)")
+    percentage: int | None = Field(default=None, nullable=True, description="상위 퍼센트 (저장 시 계산)")
 
     salary: UserSalary | None = Relationship(back_populates="profile")
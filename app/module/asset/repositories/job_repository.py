@@ -1,6 +1,8 @@
+from typing import Sequence
+
 from sqlalchemy.future import select
 
-from app.common.repository.abstract_repository import BaseRepository
+from app.common.repository.abstract_repository import BaseRepository, BulkWriteResult
 from app.module.asset.model import Job
 
 
@@ -14,7 +16,7 @@ class JobRepository(BaseRepository):
 
     async def gets(self) -> list[Job]:
         stmt = select(Job)
-        result = await self.session.execute(stmt)
+        result = await self.execute_read(stmt)
         jobs = result.scalars().all()
         return jobs
 
@@ -22,3 +24,7 @@ class JobRepository(BaseRepository):
         stmt = select(Job).where(Job.group_id == group_id, Job.name == name)
         res = await self.session.execute(stmt)
         return res.scalars().first()
+
+    async def bulk_upsert(self, instances: Sequence[Job], batch_size: int | None = None) -> BulkWriteResult:
+        """(group_id, name)이 이미 있으면 updated_at만 갱신"""
+        return await self.upsert_many(Job, instances, ("updated_at",), batch_size)
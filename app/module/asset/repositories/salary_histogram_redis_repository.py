@@ -0,0 +1,54 @@
+from app.api.asset.v1.constant import SALARY_HISTOGRAM_REDIS_KEY
+from app.common.redis_repository.general_redis_repository import GeneralRedisRepository
+
+HISTOGRAM_REBUILD_SUFFIX = ":rebuild"
+
+
+class SalaryHistogramRedisRepository(GeneralRedisRepository[str]):
+    """
+    (job_id, experience)별 연봉 구간 히스토그램
+    Redis Hash 하나에 field=구간 번호, value=인원 수로 저장한다.
+    """
+
+    @staticmethod
+    def _key(job_id: int | str, experience: int | str) -> str:
+        return SALARY_HISTOGRAM_REDIS_KEY.format(job_id=job_id, experience=experience)
+
+    async def increment(self, job_id: int, experience: int, bucket: int, amount: int = 1) -> int:
+        return await self.redis.hincrby(self._key(job_id, experience), str(bucket), amount)  # type: ignore[misc]
+
+    async def move(self, source: tuple[int, int, int], target: tuple[int, int, int]) -> None:
+        """(job_id, experience, 구간) source에서 한 명을 빼 target에 더한다 (MULTI/EXEC로 함께 반영)"""
+        source_job_id, source_experience, source_bucket = source
+        target_job_id, target_experience, target_bucket = target
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.hincrby(self._key(source_job_id, source_experience), str(source_bucket), -1)
+        pipe.hincrby(self._key(target_job_id, target_experience), str(target_bucket), 1)
+        await pipe.execute()
+
+    async def get_histogram(self, job_id: int, experience: int) -> dict[int, int]:
+        histogram = await self.redis.hgetall(self._key(job_id, experience))  # type: ignore[misc]
+        return {int(bucket): int(count) for bucket, count in histogram.items()}
+
+    async def replace_all(self, histograms: dict[tuple[int, int], dict[int, int]]) -> None:
+        """
+        임시 키에 새로 쓴 뒤 RENAME으로 교체해 재구축 중에도 조회가 끊기지 않게 한다.
+        새 집계에 없는 (job_id, experience)의 기존 키는 지운다.
+        """
+        new_keys = {self._key(job_id, experience) for job_id, experience in histograms}
+        stale_keys = [
+            key
+            async for key in self.redis.scan_iter(match=self._key("*", "*"))  # type: ignore[arg-type]
+            if key not in new_keys and not key.endswith(HISTOGRAM_REBUILD_SUFFIX)
+        ]
+
+        pipe = self.redis.pipeline(transaction=False)
+        for (job_id, experience), histogram in histograms.items():
+            key = self._key(job_id, experience)
+            tmp_key = f"{key}{HISTOGRAM_REBUILD_SUFFIX}"
+            pipe.delete(tmp_key)
+            pipe.hset(tmp_key, mapping={str(bucket): count for bucket, count in histogram.items()})
+            pipe.rename(tmp_key, key)
+        if stale_keys:
+            pipe.delete(*stale_keys)
+        await pipe.execute()
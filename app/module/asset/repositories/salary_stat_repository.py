@@ -1,6 +1,8 @@
+from typing import Sequence
+
 from sqlalchemy.future import select
 
-from app.common.repository.abstract_repository import BaseRepository
+from app.common.repository.abstract_repository import BaseRepository, BulkWriteResult
 from app.module.asset.model import SalaryStat
 
 
@@ -12,9 +14,14 @@ class SalaryStatRepository(BaseRepository):
     async def get(self, stat_id: int) -> SalaryStat | None:
         return await self._get_by_id(SalaryStat, stat_id)
 
+    async def gets(self) -> list[SalaryStat]:
+        stmt = select(SalaryStat)
+        result = await self.execute_read(stmt)
+        return list(result.scalars().all())
+
     async def get_by_job_id_experience(self, job_id: int, experience: int) -> SalaryStat | None:
         stmt = select(SalaryStat).where(SalaryStat.job_id == job_id, SalaryStat.experience == experience)
-        result = await self.session.execute(stmt)
+        result = await self.execute_read(stmt)
         return result.scalars().first()
 
     async def upsert_by_age_group(self, salary_stat: SalaryStat) -> SalaryStat | None:
@@ -28,3 +35,7 @@ class SalaryStatRepository(BaseRepository):
         else:
             self.session.add(salary_stat)
             return await self.commit_and_optional_refresh(salary_stat)
+
+    async def bulk_upsert(self, instances: Sequence[SalaryStat], batch_size: int | None = None) -> BulkWriteResult:
+        """(job_id, experience)가 이미 있으면 평균 연봉을 갱신"""
+        return await self.upsert_many(SalaryStat, instances, ("avg", "updated_at"), batch_size)
@@ -0,0 +1,196 @@
+import json
+import uuid
+from datetime import datetime
+
+from fastapi import Depends
+from pydantic import BaseModel
+from redis.asyncio import Redis
+from redis.exceptions import ResponseError
+
+from app.api.asset.v1.constant import (
+    SALARY_SUBMISSION_LATEST_REDIS_KEY,
+    SALARY_SUBMISSION_VERSION_REDIS_KEY,
+    SALARY_WRITE_BUFFER_GROUP,
+    SALARY_WRITE_BUFFER_PENDING_KEY,
+    SALARY_WRITE_BUFFER_STREAM_KEY,
+)
+from app.common.redis_repository.general_redis_repository import GeneralRedisRepository
+from app.module.asset.model import UserSalary
+from database.dependency import get_redis_pool
+
+# 제출마다 순번(INCR)을 발급해 payload에 넣고, UUID별 마지막 제출(latest 해시)을 새 값으로 바꾼다.
+# 적체량이 한도 미만이면 pending 해시와 스트림에 함께 기록하고, 한도 이상이면(또는 max_backlog가 0이면)
+# 호출 측이 DB에 바로 저장하므로 그보다 먼저 적재된 pending 값은 지운다.
+# 발급과 pending 기록이 한 스크립트라 pending에는 항상 가장 큰 순번의 제출이 남는다
+# 반환값: {순번, 적재 여부(1/0), 이전 제출 payload(없으면 nil)}
+SUBMIT_LUA = """
+local stream = KEYS[1]
+local pending = KEYS[2]
+local version_key = KEYS[3]
+local latest = KEYS[4]
+local max_backlog = tonumber(ARGV[1])
+local uid = ARGV[2]
+
+local version = redis.call('INCR', version_key)
+local submission = cjson.decode(ARGV[3])
+submission['version'] = version
+local payload = cjson.encode(submission)
+
+local previous = redis.call('HGET', latest, uid)
+redis.call('HSET', latest, uid, payload)
+
+if max_backlog <= 0 or redis.call('XLEN', stream) >= max_backlog then
+    redis.call('HDEL', pending, uid)
+    return {version, 0, previous}
+end
+
+redis.call('HSET', pending, uid, payload)
+redis.call('XADD', stream, '*', 'uid', uid, 'payload', payload)
+return {version, 1, previous}
+"""
+
+# DB에 반영한 항목을 ack 후 스트림에서 지우고, 그 사이 새 제출로 덮이지 않은 pending 값만 지운다
+# ARGV: group, (entry_id, uid, payload) 반복 / 반환값: 남은 적체량
+ACK_LUA = """
+local stream = KEYS[1]
+local pending = KEYS[2]
+local group = ARGV[1]
+
+for i = 2, #ARGV, 3 do
+    redis.call('XACK', stream, group, ARGV[i])
+    redis.call('XDEL', stream, ARGV[i])
+    if redis.call('HGET', pending, ARGV[i + 1]) == ARGV[i + 2] then
+        redis.call('HDEL', pending, ARGV[i + 1])
+    end
+end
+
+return redis.call('XLEN', stream)
+"""
+
+
+class SalarySubmitResult(BaseModel):
+    version: int
+    enqueued: bool
+    # 같은 UUID의 직전 제출 (처음 제출이면 None)
+    previous: UserSalary | None = None
+
+
+class SalaryBufferEntry(BaseModel):
+    entry_id: str
+    uid: str
+    payload: str
+
+    @property
+    def enqueued_at_ms(self) -> int:
+        # 스트림 ID는 "{적재 시각 ms}-{순번}" 형태다
+        return int(self.entry_id.split("-")[0])
+
+    def to_user_salary(self) -> UserSalary:
+        return SalaryWriteBufferRedisRepository.deserialize_salary(self.uid, self.payload)
+
+
+class SalaryWriteBufferRedisRepository(GeneralRedisRepository[str]):
+    """
+    연봉 제출 쓰기 버퍼
+    스트림(소비자 그룹)으로 DB 반영을 미루고, 반영 전 조회를 위해 UUID별 최신 제출을 pending 해시에 둔다.
+    버퍼를 끈 경우에도 DB 반영 순서를 정하는 제출 순번은 여기서 발급한다.
+    """
+
+    def __init__(self, redis: Redis = Depends(get_redis_pool)) -> None:
+        super().__init__(redis)
+        self.submit_script = redis.register_script(SUBMIT_LUA)
+        self.ack_script = redis.register_script(ACK_LUA)
+
+    async def submit(self, user_salary: UserSalary, max_backlog: int) -> SalarySubmitResult:
+        """
+        제출 순번을 발급하고 적체량이 max_backlog 미만이면 적재한다.
+        적재하지 않았으면(enqueued=False) 호출 측에서 발급된 순번으로 바로 DB에 저장한다.
+        이전 제출은 latest 해시에서 읽으므로, 이 해시가 생기기 전에만 제출한 UUID는 처음 제출로 본다
+        (그 차이는 주기적인 히스토그램 재구축에서 바로잡힌다).
+        """
+        uid = uuid.UUID(bytes=user_salary.id).hex
+        version, enqueued, previous = await self.submit_script(
+            keys=[
+                SALARY_WRITE_BUFFER_STREAM_KEY,
+                SALARY_WRITE_BUFFER_PENDING_KEY,
+                SALARY_SUBMISSION_VERSION_REDIS_KEY,
+                SALARY_SUBMISSION_LATEST_REDIS_KEY,
+            ],
+            args=[max_backlog, uid, self.serialize_salary(user_salary)],
+        )
+        return SalarySubmitResult(
+            version=version,
+            enqueued=bool(enqueued),
+            previous=self.deserialize_salary(uid, previous) if previous is not None else None,
+        )
+
+    async def get_pending(self, unique_id: uuid.UUID) -> UserSalary | None:
+        payload = await self.redis.hget(SALARY_WRITE_BUFFER_PENDING_KEY, unique_id.hex)  # type: ignore[misc]
+        if payload is None:
+            return None
+        return self.deserialize_salary(unique_id.hex, payload)
+
+    async def get_pending_payloads(self, uids: list[str]) -> list[str | None]:
+        """uids 순서대로 pending 해시의 현재 값 (이미 반영돼 지워졌으면 None)"""
+        return await self.redis.hmget(SALARY_WRITE_BUFFER_PENDING_KEY, uids)  # type: ignore[misc]
+
+    async def ensure_group(self) -> None:
+        try:
+            await self.redis.xgroup_create(
+                SALARY_WRITE_BUFFER_STREAM_KEY, SALARY_WRITE_BUFFER_GROUP, id="0", mkstream=True
+            )
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def read_batch(self, consumer: str, count: int, block_ms: int, claim_idle_ms: int) -> list[SalaryBufferEntry]:
+        """
+        claim_idle_ms 넘게 ack되지 않은 항목(죽은 워커가 가져간 항목 등)을 먼저 회수하고,
+        없으면 새 항목을 block_ms까지 기다려 읽는다.
+        """
+        _, claimed, *_ = await self.redis.xautoclaim(
+            SALARY_WRITE_BUFFER_STREAM_KEY,
+            SALARY_WRITE_BUFFER_GROUP,
+            consumer,
+            min_idle_time=claim_idle_ms,
+            start_id="0-0",
+            count=count,
+        )
+        entries = [(entry_id, fields) for entry_id, fields in claimed if fields]
+        if not entries:
+            response = await self.redis.xreadgroup(
+                SALARY_WRITE_BUFFER_GROUP, consumer, {SALARY_WRITE_BUFFER_STREAM_KEY: ">"}, count=count, block=block_ms
+            )
+            entries = response[0][1] if response else []
+
+        return [
+            SalaryBufferEntry(entry_id=entry_id, uid=fields["uid"], payload=fields["payload"])
+            for entry_id, fields in entries
+        ]
+
+    async def ack(self, entries: list[SalaryBufferEntry]) -> int:
+        """반영한 항목을 정리하고 남은 적체량을 반환"""
+        args: list[str] = [SALARY_WRITE_BUFFER_GROUP]
+        for entry in entries:
+            args += [entry.entry_id, entry.uid, entry.payload]
+        return await self.ack_script(keys=[SALARY_WRITE_BUFFER_STREAM_KEY, SALARY_WRITE_BUFFER_PENDING_KEY], args=args)
+
+    @staticmethod
+    def serialize_salary(user_salary: UserSalary) -> str:
+        # 제출 순번을 함께 남겨 DB 반영 시 더 최신 제출인지 비교한다 (적재 시 SUBMIT_LUA가 발급한 값으로 바뀜)
+        return json.dumps(
+            {
+                "job_id": user_salary.job_id,
+                "experience": user_salary.experience,
+                "salary": user_salary.salary,
+                "updated_at": user_salary.updated_at.isoformat(),
+                "version": user_salary.version,
+            }
+        )
+
+    @staticmethod
+    def deserialize_salary(uid: str, payload: str) -> UserSalary:
+        data = json.loads(payload)
+        if "updated_at" in data:
+            data["updated_at"] = datetime.fromisoformat(data["updated_at"])
+        return UserSalary(id=uuid.UUID(uid).bytes, **data)
@@ -0,0 +1,74 @@
+import uuid
+
+from fastapi import Depends
+from redis.asyncio import Redis
+
+from app.api.asset.v1.constant import (
+    EXPIRE_USER_CAR_RANK_REDIS_SEC,
+    USER_CAR_RANK_REDIS_KEY,
+    USER_CAR_RANK_VERSION_REDIS_KEY,
+)
+from app.api.asset.v1.schemas.asset_schema import UserCarRankData
+from app.common.redis_repository.general_redis_repository import GeneralRedisRepository
+from database.dependency import get_redis_pool
+
+# 현재 캐시 버전으로 저장 (버전 조회와 저장을 한 번에) / ARGV: 저장할 "{car}|{percentage}", 만료(초)
+WARM_LUA = """
+local version = redis.call('GET', KEYS[2]) or '0'
+redis.call('SET', KEYS[1], version .. '|' .. ARGV[1], 'EX', ARGV[2])
+"""
+
+
+class UserCarRankRedisRepository(GeneralRedisRepository[tuple[int, UserCarRankData]]):
+    """
+    공유 링크 결과(UserCarRankData) 캐시
+    "{캐시 버전}|{car}|{percentage}" 형태로 저장하고, 조회 시 버전 키와 함께 MGET 한 번으로 읽는다.
+    등급 일괄 재계산 후 버전을 올리면 이전 값은 지우지 않아도 모두 무효가 된다.
+    """
+
+    def __init__(self, redis: Redis = Depends(get_redis_pool)) -> None:
+        super().__init__(redis)
+        self.warm_script = redis.register_script(WARM_LUA)
+
+    @staticmethod
+    def _key(unique_id: uuid.UUID) -> str:
+        return USER_CAR_RANK_REDIS_KEY.format(unique_id=unique_id.hex)
+
+    async def get_car_rank(self, unique_id: uuid.UUID) -> tuple[UserCarRankData | None, int]:
+        """(캐시된 값, 현재 버전). 값이 없거나 이전 버전이면 None이고, 채울 때는 함께 받은 버전을 넘긴다"""
+        cached, version = await self.redis.mget(self._key(unique_id), USER_CAR_RANK_VERSION_REDIS_KEY)
+        current_version = int(version) if version is not None else 0
+        if cached is None:
+            return None, current_version
+
+        cached_version, car_rank = self._deserialize(cached)
+        if cached_version != current_version:
+            return None, current_version
+        return car_rank, current_version
+
+    async def set_car_rank(self, unique_id: uuid.UUID, version: int, car_rank: UserCarRankData) -> None:
+        """조회 미스 후 채우기. DB를 읽기 전에 받은 버전으로 저장해 그 사이 재계산된 값은 다음 조회에서 다시 읽는다"""
+        await self.set(self._key(unique_id), (version, car_rank), EXPIRE_USER_CAR_RANK_REDIS_SEC)
+
+    async def warm_car_rank(self, unique_id: uuid.UUID, car_rank: UserCarRankData) -> None:
+        """프로필 저장 직후 새로 계산한 값을 현재 버전으로 미리 저장"""
+        await self.warm_script(
+            keys=[self._key(unique_id), USER_CAR_RANK_VERSION_REDIS_KEY],
+            args=[f"{car_rank.car}|{car_rank.percentage}", EXPIRE_USER_CAR_RANK_REDIS_SEC],
+        )
+
+    async def delete_car_ranks(self, unique_ids: list[uuid.UUID]) -> int:
+        if not unique_ids:
+            return 0
+        return await self.delete(*(self._key(unique_id) for unique_id in unique_ids))
+
+    async def bump_version(self) -> int:
+        return await self.redis.incr(USER_CAR_RANK_VERSION_REDIS_KEY)
+
+    def _serialize(self, value: tuple[int, UserCarRankData]) -> str:
+        version, car_rank = value
+        return f"{version}|{car_rank.car}|{car_rank.percentage}"
+
+    def _deserialize(self, value: str) -> tuple[int, UserCarRankData]:
+        version, car, percentage = value.split("|")
+        return int(version), UserCarRankData(car=car, percentage=int(percentage))
@@ -1,8 +1,11 @@
-from sqlalchemy import select
+from typing import Any, Sequence
+
+from sqlalchemy import Row, and_, select, update
 from sqlalchemy.dialects.mysql import insert
 
 from app.common.repository.abstract_repository import BaseRepository
-from app.module.asset.model import UserProfile
+from app.module.asset.model import SalaryStat, UserProfile, UserSalary
+from database.config import mysql_replica_engine
 
 
 class UserProfileRepository(BaseRepository):
@@ -18,6 +21,78 @@ class UserProfileRepository(BaseRepository):
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_car_rank_by_salary_id(self, salary_id: bytes) -> Row[Any] | None:
+        """
+        공유 링크용 조회
+        프로필 저장 시 함께 저장한 (save_rate, car_rank, percentage)를 salary_id 유니크 인덱스로 한 번 읽는다.
+        replica에서 먼저 읽는다.
+        """
+        stmt = select(UserProfile.save_rate, UserProfile.car_rank, UserProfile.percentage).where(
+            UserProfile.salary_id == salary_id
+        )
+        return await self._first_from_replica(stmt)
+
+    async def get_car_rank_row(self, salary_id: bytes) -> Row[Any] | None:
+        """
+        등급 계산용 단일 조회
+        UserProfile, UserSalary, 대응하는 SalaryStat을 한 번의 JOIN으로 읽어
+        ORM 엔티티 대신 (id, save_rate, job_id, experience, salary, avg) 행을 반환한다.
+        """
+        stmt = self._car_rank_source_stmt().where(UserProfile.salary_id == salary_id)
+        return await self._first_from_replica(stmt)
+
+    async def get_car_rank_rows(self, after_id: int, limit: int) -> Sequence[Row[Any]]:
+        """일괄 재계산용. 저축률이 있는 프로필을 id 순으로 after_id 다음부터 limit개 읽는다 (primary)"""
+        stmt = (
+            self._car_rank_source_stmt()
+            .where(UserProfile.id > after_id, UserProfile.save_rate.is_not(None))  # type: ignore[union-attr]
+            .order_by(UserProfile.id)
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return result.all()
+
+    async def get_car_rank_rows_by_salary_ids(self, salary_ids: Sequence[bytes]) -> Sequence[Row[Any]]:
+        """연봉을 저장한 직후 재계산용. 저축률이 있는 해당 프로필만 primary에서 읽는다"""
+        stmt = self._car_rank_source_stmt().where(
+            UserProfile.salary_id.in_(salary_ids), UserProfile.save_rate.is_not(None)  # type: ignore[attr-defined]
+        )
+        result = await self.session.execute(stmt)
+        return result.all()
+
+    async def update_car_ranks(self, values: Sequence[dict[str, Any]]) -> int:
+        """{"id", "car_rank", "percentage"} 목록을 PK 기준 executemany UPDATE로 반영하고 커밋"""
+        if not values:
+            return 0
+        await self.session.execute(update(UserProfile), values)
+        await self.session.commit()
+        return len(values)
+
+    @staticmethod
+    def _car_rank_source_stmt() -> Any:
+        return (
+            select(
+                UserProfile.id,
+                UserProfile.save_rate,
+                UserSalary.job_id,
+                UserSalary.experience,
+                UserSalary.salary,
+                SalaryStat.avg,
+            )
+            .join(UserSalary, UserSalary.id == UserProfile.salary_id)
+            .outerjoin(
+                SalaryStat,
+                and_(SalaryStat.job_id == UserSalary.job_id, SalaryStat.experience == UserSalary.experience),
+            )
+        )
+
+    async def _first_from_replica(self, stmt: Any) -> Row[Any] | None:
+        row = (await self.execute_read(stmt)).first()
+        if row is None and mysql_replica_engine is not None:
+            # 방금 저장한 프로필이 replica에 아직 반영되지 않았을 수 있으므로 primary에서 한 번 더 확인
+            row = (await self.session.execute(stmt)).first()
+        return row
+
     async def upsert(self, instance: UserProfile) -> UserProfile | None:
         stmt = insert(UserProfile).values(
             salary_id=instance.salary_id,
@@ -25,6 +100,8 @@ class UserProfileRepository(BaseRepository):
             save_rate=instance.save_rate,
             has_car=instance.has_car,
             is_monthly_rent=instance.is_monthly_rent,
+            car_rank=instance.car_rank,
+            percentage=instance.percentage,
         )
 
         stmt = stmt.on_duplicate_key_update(
@@ -32,10 +109,11 @@ class UserProfileRepository(BaseRepository):
             save_rate=stmt.inserted.save_rate,
             has_car=stmt.inserted.has_car,
             is_monthly_rent=stmt.inserted.is_monthly_rent,
+            car_rank=stmt.inserted.car_rank,
+            percentage=stmt.inserted.percentage,
             updated_at=stmt.inserted.updated_at,
         )
 
-        await self.session.execute(stmt)
-        await self.session.commit()
+        await self.execute_and_commit(stmt)
 
-        return await self.get_by_salary_id(instance.salary_id)
+        return instance
@@ -1,11 +1,18 @@
 import uuid
+from typing import Sequence
 
+from sqlalchemy import func, update
 from sqlalchemy.dialects.mysql import insert
 from sqlalchemy.future import select
 
-from app.common.repository.abstract_repository import BaseRepository
+from app.common.repository.abstract_repository import BaseRepository, BulkWriteResult
 from app.module.asset.model import UserSalary
 
+# 연봉 제출 upsert 시 갱신하는 컬럼 / 더 최신 제출인지 비교하는 컬럼 (Redis에서 발급한 제출 순번)
+# user_id는 이메일 가입으로만 연결되므로 재제출로 덮어쓰지 않는다
+SUBMISSION_UPDATE_COLUMNS = ("job_id", "experience", "salary", "updated_at", "version")
+SUBMISSION_VERSION_COLUMN = "version"
+
 
 class UserSalaryRepository(BaseRepository):
     async def save(self, instance: UserSalary, refresh=True) -> UserSalary | None:
@@ -16,14 +23,44 @@ class UserSalaryRepository(BaseRepository):
         return await self._get_by_id(UserSalary, salary_id)
 
     async def get_by_uuid(self, uid: uuid.UUID) -> UserSalary | None:
-        stmt = select(UserSalary).where(UserSalary.id == uid.bytes)
+        """
+        PK 조회라 세션 identity map을 사용한다.
+        같은 요청(세션)에서 이미 읽은 UserSalary는 다시 쿼리하지 않는다.
+        """
+        return await self.session.get(UserSalary, uid.bytes)
+
+    async def link_user(self, uid: uuid.UUID, user_id: int) -> bool:
+        """
+        아직 유저가 연결되지 않은 연봉 기록에만 user_id를 연결 (커밋은 unit_of_work에서)
+        기록이 없거나 이미 연결되어 있으면 False
+        """
+        stmt = (
+            update(UserSalary)
+            .where(UserSalary.id == uid.bytes, UserSalary.user_id.is_(None))  # type: ignore[union-attr]
+            .values(user_id=user_id)
+        )
         result = await self.session.execute(stmt)
-        return result.scalars().first()
+        return result.rowcount == 1  # type: ignore[attr-defined]
+
+    async def get_salary_bucket_counts(self, bucket_size: int, max_bucket: int) -> list[tuple[int, int, int, int]]:
+        """
+        (job_id, experience, 연봉 구간, 인원 수) 집계
+        구간은 salary // bucket_size 이며 max_bucket을 넘는 값은 마지막 구간에 모은다.
+        """
+        bucket = func.least(func.floor(UserSalary.salary / bucket_size), max_bucket)
+        stmt = (
+            select(UserSalary.job_id, UserSalary.experience, bucket, func.count())
+            .group_by(UserSalary.job_id, UserSalary.experience, bucket)
+            .order_by(UserSalary.job_id, UserSalary.experience)
+        )
+        result = await self.execute_read(stmt)
+        return [(job_id, experience, int(bucket_no), count) for job_id, experience, bucket_no, count in result.all()]
 
     async def upsert(self, instance: UserSalary) -> UserSalary | None:
         """
         Insert or update UserSalary record.
         If a record with the same id exists, update it; otherwise insert a new record.
+        기존 행보다 제출 순번(version)이 작은 값은 무시한다 (쓰기 버퍼 반영과 순서가 뒤바뀐 경우).
         """
         stmt = insert(UserSalary).values(
             id=instance.id,
@@ -31,17 +68,26 @@ class UserSalaryRepository(BaseRepository):
             job_id=instance.job_id,
             experience=instance.experience,
             salary=instance.salary,
+            updated_at=instance.updated_at,
+            version=instance.version,
         )
 
         stmt = stmt.on_duplicate_key_update(
-            user_id=stmt.inserted.user_id,
-            job_id=stmt.inserted.job_id,
-            experience=stmt.inserted.experience,
-            salary=stmt.inserted.salary,
-            updated_at=stmt.inserted.updated_at,
+            self._duplicate_key_updates(stmt, SUBMISSION_UPDATE_COLUMNS, SUBMISSION_VERSION_COLUMN)
         )
 
-        await self.session.execute(stmt)
-        await self.session.commit()
+        await self.execute_and_commit(stmt)
+
+        return instance
 
-        return await self.get_by_uuid(uuid.UUID(bytes=instance.id))
+    async def upsert_submissions(
+        self, instances: Sequence[UserSalary], batch_size: int | None = None
+    ) -> BulkWriteResult:
+        """
+        쓰기 버퍼에 쌓인 연봉 제출 반영. 같은 제출이 다시 반영돼도(at-least-once) 결과가 같고,
+        그 사이 이메일 가입으로 연결된 user_id는 덮어쓰지 않는다.
+        제출 순번(version)이 기존 행보다 작은 제출은 늦게 도착해도 최신 값을 덮지 않는다.
+        """
+        return await self.upsert_many(
+            UserSalary, instances, SUBMISSION_UPDATE_COLUMNS, batch_size, version_column=SUBMISSION_VERSION_COLUMN
+        )
@@ -1,17 +1,34 @@
 import uuid
 
 from fastapi import Depends
-
-from app.api.asset.v1.constant import SALARY_THOUSAND_WON
-from app.api.asset.v1.schemas.asset_schema import UserProfilePostRequest, UserSalaryPostRequest
-from app.common.redis_repository.general_redis_repository import ListRedisRepository
-from app.module.asset.enums import CarRank
-from app.module.asset.errors.asset_error import NoMatchJobSalary, NoMatchUserSalary
-from app.module.asset.model import Job, SalaryStat, UserProfile, UserSalary
+from sqlalchemy.exc import IntegrityError
+
+from app.api.asset.v1.constant import EXPIRE_JOB_REDIS_SEC, JOB_ETAG_REDIS_KEY, JOB_REDIS_KEY, SALARY_THOUSAND_WON
+from app.api.asset.v1.schemas.asset_schema import UserCarRankData, UserProfilePostRequest, UserSalaryPostRequest
+from app.common.metrics.metrics import SALARY_WRITE_BUFFER_EVENTS, record_cache
+from app.common.redis_repository.general_redis_repository import GeneralRedisRepository
+from app.common.repository.abstract_repository import is_foreign_key_violation
+from app.module.asset.caches.job_catalog_snapshot import (
+    JobCatalogSnapshot,
+    JobCatalogSnapshotHolder,
+    get_job_catalog_snapshot_holder,
+)
+from app.module.asset.caches.salary_stat_table import SalaryStatTable, get_salary_stat_table
+from app.module.asset.errors.asset_error import NoMatchUserProfile, NoMatchUserSalary, NoUserProfileSaveRate
+from app.module.asset.model import SalaryStat, UserProfile, UserSalary
 from app.module.asset.repositories.job_repository import JobRepository
 from app.module.asset.repositories.salary_stat_repository import SalaryStatRepository
+from app.module.asset.repositories.salary_write_buffer_redis_repository import (
+    SalarySubmitResult,
+    SalaryWriteBufferRedisRepository,
+)
+from app.module.asset.repositories.user_car_rank_redis_repository import UserCarRankRedisRepository
 from app.module.asset.repositories.user_profile_repository import UserProfileRepository
 from app.module.asset.repositories.user_salary_repository import UserSalaryRepository
+from app.module.asset.services.car_rank_service import CarRankService
+from app.module.asset.services.percentile_service import SalaryPercentileService
+from app.module.asset.services.salary_write_behind_service import flush_pending_salary
+from main_config import settings
 
 
 class AssetService:
@@ -21,45 +38,105 @@ class AssetService:
         user_profile_repo: UserProfileRepository = Depends(),
         salary_stat_repo: SalaryStatRepository = Depends(),
         job_repo: JobRepository = Depends(),
-        job_cache_repo: ListRedisRepository = Depends(),
+        job_cache_repo: GeneralRedisRepository[str] = Depends(GeneralRedisRepository),
+        job_catalog_holder: JobCatalogSnapshotHolder = Depends(get_job_catalog_snapshot_holder),
+        salary_stat_table: SalaryStatTable = Depends(get_salary_stat_table),
+        percentile_service: SalaryPercentileService = Depends(),
+        car_rank_service: CarRankService = Depends(),
+        salary_write_buffer_repo: SalaryWriteBufferRedisRepository = Depends(),
+        car_rank_cache_repo: UserCarRankRedisRepository = Depends(),
     ):
         self.user_salary_repo = user_salary_repo
         self.user_profile_repo = user_profile_repo
         self.salary_stat_repo = salary_stat_repo
         self.job_repo = job_repo
         self.job_cache_repo = job_cache_repo
-
-    async def get_jobs(self) -> list[Job] | None:
-        return await self.job_repo.gets()
-
-    async def get_job_salary(self, job_id: int, experience: int) -> SalaryStat | None:
-        return await self.salary_stat_repo.get_by_job_id_experience(job_id, experience)
-
-    async def get_user_car(self, user_profile_id: uuid.UUID, save_rate: int) -> str:
-        user_salary: UserSalary | None = await self.user_salary_repo.get_by_uuid(user_profile_id)
-        if not user_salary:
-            raise NoMatchUserSalary()
-
-        user_total_asset = int(user_salary.salary * (save_rate * 0.01) * 5 * 0.3)  # 유저 연봉 * 저축률 * 5년 * 30%
-
-        return CarRank.get_car_rank(user_total_asset)
-
-    async def get_user_percentage(self, user_profile_id: uuid.UUID, save_rate: int) -> int:
-        user_salary: UserSalary | None = await self.user_salary_repo.get_by_uuid(user_profile_id)
-        if not user_salary:
-            raise NoMatchUserSalary()
-
-        job_salary: SalaryStat | None = await self.salary_stat_repo.get_by_job_id_experience(
-            user_salary.job_id, user_salary.experience
-        )
-        if not job_salary:
-            raise NoMatchJobSalary()
-
-        user_asset = int(user_salary.salary * save_rate * 0.01)
-
-        percentage = 100 - int((user_asset / job_salary.avg) * 100)
-
-        return max(0, min(percentage, 100))
+        self.job_catalog_holder = job_catalog_holder
+        self.salary_stat_table = salary_stat_table
+        self.percentile_service = percentile_service
+        self.car_rank_service = car_rank_service
+        self.salary_write_buffer_repo = salary_write_buffer_repo
+        self.car_rank_cache_repo = car_rank_cache_repo
+
+    async def get_job_catalog(self) -> JobCatalogSnapshot:
+        """
+        직무 목록 스냅샷 조회
+        1. Redis etag가 워커에 보관된 스냅샷과 같으면 그대로 반환 (etag 한 번 조회)
+        2. 다르면 Redis에 저장된 직렬화 본문을 받아 보관
+        3. Redis에도 없을 때만 DB에서 읽어 스냅샷을 만들고 Redis에 채운다
+        """
+        etag = await self.job_cache_repo.get(JOB_ETAG_REDIS_KEY)
+        if etag is not None:
+            snapshot = self.job_catalog_holder.get(etag)
+            record_cache("job_catalog_local", snapshot is not None)
+            if snapshot is not None:
+                return snapshot
+
+            body = await self.job_cache_repo.get(JOB_REDIS_KEY)
+            if body is not None:
+                record_cache("job_catalog_redis", True)
+                snapshot = JobCatalogSnapshot(body=body.encode(), etag=etag)
+                self.job_catalog_holder.set(snapshot)
+                return snapshot
+
+        record_cache("job_catalog_redis", False)
+
+        jobs = await self.job_repo.gets()
+        snapshot = JobCatalogSnapshot.from_jobs(jobs)
+
+        await self.job_cache_repo.set(JOB_REDIS_KEY, snapshot.body.decode(), EXPIRE_JOB_REDIS_SEC)
+        await self.job_cache_repo.set(JOB_ETAG_REDIS_KEY, snapshot.etag, EXPIRE_JOB_REDIS_SEC)
+        self.job_catalog_holder.set(snapshot)
+        return snapshot
+
+    async def invalidate_job_cache(self) -> None:
+        await self.job_cache_repo.delete(JOB_ETAG_REDIS_KEY, JOB_REDIS_KEY)
+        self.job_catalog_holder.clear()
+
+    async def get_job_salary(self, job_id: int, experience: int) -> int | None:
+        """
+        직무/경력별 평균 연봉 조회
+        워커 메모리 테이블이 적재되어 있으면 DB를 조회하지 않고, 적재 전에만 DB로 조회한다.
+        """
+        if self.salary_stat_table.is_loaded:
+            return self.salary_stat_table.get_avg(job_id, experience)
+
+        job_salary: SalaryStat | None = await self.salary_stat_repo.get_by_job_id_experience(job_id, experience)
+        return job_salary.avg if job_salary else None
+
+    async def get_shared_car_rank(self, unique_id: uuid.UUID) -> UserCarRankData:
+        """
+        공유 링크 조회
+        Redis 캐시(프로필 저장 시 미리 채움)를 먼저 보고, 없으면 프로필/연봉 저장 시 함께 저장한 등급/퍼센트를
+        salary_id 유니크 인덱스 조회 한 번으로 읽어 캐시에 채운다. MySQL에는 쓰지 않는다.
+        값이 없는 행(컬럼 추가 후 아직 재계산되지 않은 프로필)만 읽기 조회로 계산해 반환한다.
+        """
+        cached, cache_version = await self.car_rank_cache_repo.get_car_rank(unique_id)
+        record_cache("user_car_rank", cached is not None)
+        if cached is not None:
+            return cached
+
+        row = await self.user_profile_repo.get_car_rank_by_salary_id(unique_id.bytes)
+        if row is None:
+            raise NoMatchUserProfile()
+
+        if row.save_rate is None:
+            raise NoUserProfileSaveRate()
+
+        if row.car_rank is not None and row.percentage is not None:
+            car_rank = UserCarRankData(car=row.car_rank, percentage=row.percentage)
+        else:
+            car_rank = await self._calc_car_rank(unique_id)
+
+        await self.car_rank_cache_repo.set_car_rank(unique_id, cache_version, car_rank)
+        return car_rank
+
+    async def _calc_car_rank(self, unique_id: uuid.UUID) -> UserCarRankData:
+        row = await self.user_profile_repo.get_car_rank_row(unique_id.bytes)
+        if row is None:
+            raise NoMatchUserProfile()
+
+        return await self.car_rank_service.calc(row.job_id, row.experience, row.salary, row.save_rate, row.avg)
 
     async def get_user_profile(self, unique_id: uuid.UUID) -> UserProfile | None:
         salary_id = unique_id.bytes
@@ -74,20 +151,67 @@ class AssetService:
         data["salary"] = data["salary"] * SALARY_THOUSAND_WON
         user_salary = UserSalary(**data)
 
-        saved = await self.user_salary_repo.upsert(user_salary)
-        return bool(saved)
-
-    async def save_user_profile(self, user_profile_request: UserProfilePostRequest) -> bool:
+        submitted = await self._submit_user_salary(user_salary)
+        if submitted.enqueued:
+            # 프로필 등급/퍼센트는 쓰기 버퍼 소비자가 DB에 반영하면서 다시 계산한다
+            await self.percentile_service.record_submission(user_salary, submitted.previous)
+            return True
+
+        if not await self.user_salary_repo.upsert(user_salary):
+            return False
+        await self.percentile_service.record_submission(user_salary, submitted.previous)
+        # 이미 프로필이 있으면 새 연봉 기준으로 등급/퍼센트를 다시 계산해 둔다 (공유 링크는 저장된 값만 읽음)
+        await self.car_rank_service.refresh([user_salary.id])
+        return True
+
+    async def _submit_user_salary(self, user_salary: UserSalary) -> SalarySubmitResult:
+        """
+        Redis에서 제출 순번과 이전 제출(히스토그램 구간 이동용)을 한 번에 받아 온다. MySQL은 조회하지 않는다.
+        쓰기 버퍼가 켜져 있으면 Redis Stream에 적재까지 하고(DB 반영은 백그라운드 소비자),
+        꺼져 있거나 적체량이 한도를 넘으면 enqueued=False로 돌려줘 호출 측이 바로 DB에 저장한다.
+        """
+        max_backlog = settings.salary_write_buffer_max_backlog if settings.salary_write_behind_enabled else 0
+        submitted = await self.salary_write_buffer_repo.submit(user_salary, max_backlog)
+        user_salary.version = submitted.version
+        if settings.salary_write_behind_enabled:
+            SALARY_WRITE_BUFFER_EVENTS.inc("enqueued" if submitted.enqueued else "fallback")
+        return submitted
+
+    async def save_user_profile(self, user_profile_request: UserProfilePostRequest) -> UserCarRankData:
+        """
+        프로필 저장
+        등급/퍼센트를 계산해 같은 upsert 문장으로 함께 저장하고, 계산한 결과를 반환한다.
+        """
         data = user_profile_request.model_dump()
         uid: uuid.UUID = data.pop("unique_id")
 
-        user_salary = await self.user_salary_repo.get_by_uuid(uid)
-        if not user_salary:
-            raise NoMatchUserSalary()
+        user_salary = await self._get_user_salary(uid)
+        job_salary_avg = await self.get_job_salary(user_salary.job_id, user_salary.experience)
+        car_rank = await self.car_rank_service.calc(
+            user_salary.job_id, user_salary.experience, user_salary.salary, data["save_rate"], job_salary_avg
+        )
 
-        data["salary_id"] = uid.bytes
+        user_profile = UserProfile(**data, salary_id=uid.bytes, car_rank=car_rank.car, percentage=car_rank.percentage)
 
-        user_profile = UserProfile(**data)
+        try:
+            await self.user_profile_repo.upsert(user_profile)
+        except IntegrityError as e:
+            # 조회 후 저장 사이에 연봉 기록이 지워진 경우
+            if not is_foreign_key_violation(e):
+                raise e
+            raise NoMatchUserSalary()
 
-        saved = await self.user_profile_repo.upsert(user_profile)
-        return bool(saved)
+        # 첫 공유 링크 조회부터 캐시에 적중하도록 미리 채운다
+        await self.car_rank_cache_repo.warm_car_rank(uid, car_rank)
+        return car_rank
+
+    async def _get_user_salary(self, uid: uuid.UUID) -> UserSalary:
+        """등급 계산에 쓸 연봉 제출. 아직 쓰기 버퍼에만 있으면 먼저 DB에 반영한 값을 쓴다"""
+        user_salary: UserSalary | None = None
+        if settings.salary_write_behind_enabled:
+            user_salary = await flush_pending_salary(uid, self.salary_write_buffer_repo, self.user_salary_repo)
+        if user_salary is None:
+            user_salary = await self.user_salary_repo.get_by_uuid(uid)
+        if user_salary is None:
+            raise NoMatchUserSalary()
+        return user_salary
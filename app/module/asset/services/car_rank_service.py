@@ -0,0 +1,103 @@
+import uuid
+from typing import Any, Sequence
+
+from fastapi import Depends
+
+from app.api.asset.v1.schemas.asset_schema import UserCarRankData
+from app.module.asset.enums import CarRank
+from app.module.asset.errors.asset_error import NoMatchJobSalary
+from app.module.asset.logger import asset_logger
+from app.module.asset.repositories.user_car_rank_redis_repository import UserCarRankRedisRepository
+from app.module.asset.repositories.user_profile_repository import UserProfileRepository
+from app.module.asset.services.percentile_service import SalaryPercentileService
+from main_config import settings
+
+
+class CarRankService:
+    """
+    차량 등급/상위 퍼센트 계산
+    프로필 저장과 연봉 저장(바로 저장, 쓰기 버퍼 반영) 시 계산해 user_profile에 저장하고, 공유 링크는 저장된 값만 읽는다.
+    SalaryStat이 바뀌면 recompute_all로 일괄 재계산한다.
+    퍼센트는 저장 시점의 히스토그램 기준이라, 그 뒤 다른 사용자의 제출로 분포가 바뀐 것은
+    해당 프로필이 다시 저장되거나 재계산(app/data/car_rank/recompute.py)되기 전까지 반영되지 않는다.
+    """
+
+    def __init__(
+        self,
+        percentile_service: SalaryPercentileService = Depends(),
+        user_profile_repo: UserProfileRepository = Depends(),
+        car_rank_cache_repo: UserCarRankRedisRepository = Depends(),
+    ):
+        self.percentile_service = percentile_service
+        self.user_profile_repo = user_profile_repo
+        self.car_rank_cache_repo = car_rank_cache_repo
+
+    async def calc(
+        self, job_id: int, experience: int, salary: int, save_rate: int, job_salary_avg: int | None
+    ) -> UserCarRankData:
+        car = self.calc_car(salary, save_rate)
+        percentage = await self.calc_percentage(job_id, experience, salary, save_rate, job_salary_avg)
+        return UserCarRankData(car=car, percentage=percentage)
+
+    @staticmethod
+    def calc_car(salary: int, save_rate: int) -> str:
+        user_total_asset = int(salary * (save_rate * 0.01) * 5 * 0.3)  # 유저 연봉 * 저축률 * 5년 * 30%
+
+        return CarRank.get_car_rank(user_total_asset)
+
+    async def calc_percentage(
+        self, job_id: int, experience: int, salary: int, save_rate: int, job_salary_avg: int | None
+    ) -> int:
+        """
+        같은 직무/경력 안에서 연봉 기준 상위 퍼센트
+        히스토그램 표본이 부족하면 평균 연봉 대비 자산 비율로 추정한다.
+        """
+        top_percentage = await self.percentile_service.get_top_percentage(job_id, experience, salary)
+        if top_percentage is not None:
+            return top_percentage
+
+        if not job_salary_avg:
+            raise NoMatchJobSalary()
+
+        user_asset = int(salary * save_rate * 0.01)
+
+        percentage = 100 - int((user_asset / job_salary_avg) * 100)
+
+        return max(0, min(percentage, 100))
+
+    async def calc_row(self, row: Any) -> dict[str, Any]:
+        """UserProfileRepository.get_car_rank_row(s) 행으로 계산해 update_car_ranks 입력 형태로 반환"""
+        car_rank = await self.calc(row.job_id, row.experience, row.salary, row.save_rate, row.avg)
+        return {"id": row.id, "car_rank": car_rank.car, "percentage": car_rank.percentage}
+
+    async def refresh(self, salary_ids: Sequence[bytes]) -> int:
+        """연봉을 저장한 직후 호출. 해당 연봉의 프로필(저축률이 있는 것만) 등급/퍼센트를 다시 계산해 저장한다"""
+        rows = await self.user_profile_repo.get_car_rank_rows_by_salary_ids(salary_ids)
+        updated = await self.user_profile_repo.update_car_ranks(await self._calc_rows(rows))
+        await self.car_rank_cache_repo.delete_car_ranks([uuid.UUID(bytes=salary_id) for salary_id in salary_ids])
+        return updated
+
+    async def recompute_all(self, batch_size: int | None = None) -> int:
+        """
+        저축률이 있는 모든 프로필의 등급/퍼센트를 id 순으로 batch_size개씩 다시 계산해 저장한다.
+        끝나면 공유 링크 캐시 버전을 올려 이전에 캐시된 값을 모두 무효화한다. 갱신한 행 수를 반환
+        """
+        size = batch_size or settings.db_bulk_write_batch_size
+        after_id = 0
+        updated = 0
+        while rows := await self.user_profile_repo.get_car_rank_rows(after_id, size):
+            updated += await self.user_profile_repo.update_car_ranks(await self._calc_rows(rows))
+            after_id = rows[-1].id
+        await self.car_rank_cache_repo.bump_version()
+        return updated
+
+    async def _calc_rows(self, rows: Sequence[Any]) -> list[dict[str, Any]]:
+        """평균 연봉 통계가 없어 계산할 수 없는 행은 이전 값이 남지 않도록 비운다"""
+        values = []
+        for row in rows:
+            try:
+                values.append(await self.calc_row(row))
+            except NoMatchJobSalary:
+                asset_logger.warning("[CarRank][NoSalaryStat] profile_id=%s job_id=%s", row.id, row.job_id)
+                values.append({"id": row.id, "car_rank": None, "percentage": None})
+        return values
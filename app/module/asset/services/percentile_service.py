@@ -0,0 +1,82 @@
+from collections import defaultdict
+
+from fastapi import Depends
+
+from app.api.asset.v1.constant import (
+    MAX_SALARY_MANWON,
+    PERCENTILE_MIN_SAMPLES,
+    SALARY_HISTOGRAM_BUCKET_MANWON,
+    SALARY_THOUSAND_WON,
+)
+from app.module.asset.model import UserSalary
+from app.module.asset.repositories.salary_histogram_redis_repository import SalaryHistogramRedisRepository
+from app.module.asset.repositories.user_salary_repository import UserSalaryRepository
+
+BUCKET_SIZE_WON = SALARY_HISTOGRAM_BUCKET_MANWON * SALARY_THOUSAND_WON
+MAX_BUCKET = MAX_SALARY_MANWON // SALARY_HISTOGRAM_BUCKET_MANWON
+
+
+class SalaryPercentileService:
+    """
+    (job_id, experience)별 연봉 히스토그램으로 상위 퍼센트를 계산한다.
+    저장 시 구간 하나만 증가시키고, 조회는 구간 누적합이라 user_salary 행 수와 무관하게 O(구간 수)이다.
+    """
+
+    def __init__(
+        self,
+        histogram_repo: SalaryHistogramRedisRepository = Depends(),
+        user_salary_repo: UserSalaryRepository = Depends(),
+    ):
+        self.histogram_repo = histogram_repo
+        self.user_salary_repo = user_salary_repo
+
+    @staticmethod
+    def to_bucket(salary: int) -> int:
+        """원 단위 연봉을 히스토그램 구간 번호로 변환"""
+        return min(salary // BUCKET_SIZE_WON, MAX_BUCKET)
+
+    async def record(self, job_id: int, experience: int, salary: int) -> None:
+        await self.histogram_repo.increment(job_id, experience, self.to_bucket(salary))
+
+    async def record_submission(self, current: UserSalary, previous: UserSalary | None) -> None:
+        """
+        연봉 제출을 히스토그램에 반영
+        같은 uuid의 재제출이면 이전 제출의 구간에서 빼고 새 구간에 더해 한 사람을 한 번만 센다.
+        """
+        if previous is None:
+            await self.record(current.job_id, current.experience, current.salary)
+            return
+
+        source = (previous.job_id, previous.experience, self.to_bucket(previous.salary))
+        target = (current.job_id, current.experience, self.to_bucket(current.salary))
+        if source != target:
+            await self.histogram_repo.move(source, target)
+
+    async def get_top_percentage(self, job_id: int, experience: int, salary: int) -> int | None:
+        """
+        같은 직무/경력 안에서 연봉 기준 상위 몇 %인지 반환
+        같은 구간은 절반을 위로 보고, 표본이 PERCENTILE_MIN_SAMPLES 미만이면 None을 반환한다.
+        """
+        histogram = await self.histogram_repo.get_histogram(job_id, experience)
+
+        total = sum(histogram.values())
+        if total < PERCENTILE_MIN_SAMPLES:
+            return None
+
+        user_bucket = self.to_bucket(salary)
+        above = sum(count for bucket, count in histogram.items() if bucket > user_bucket)
+        same = histogram.get(user_bucket, 0)
+
+        percentage = round((above + same / 2) / total * 100)
+        return max(0, min(percentage, 100))
+
+    async def rebuild(self) -> int:
+        """MySQL 집계로 전체 히스토그램을 다시 만들고, 재구축한 (job_id, experience) 개수를 반환"""
+        rows = await self.user_salary_repo.get_salary_bucket_counts(BUCKET_SIZE_WON, MAX_BUCKET)
+
+        histograms: dict[tuple[int, int], dict[int, int]] = defaultdict(dict)
+        for job_id, experience, bucket, count in rows:
+            histograms[(job_id, experience)][bucket] = count
+
+        await self.histogram_repo.replace_all(histograms)
+        return len(histograms)
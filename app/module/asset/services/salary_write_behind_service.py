@@ -0,0 +1,153 @@
+import asyncio
+import os
+import socket
+import time
+import uuid
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.asset.v1.constant import (
+    SALARY_WRITE_BUFFER_BLOCK_MS,
+    SALARY_WRITE_BUFFER_CLAIM_IDLE_MS,
+    SALARY_WRITE_BUFFER_RETRY_SEC,
+)
+from app.common.metrics.metrics import SALARY_WRITE_BUFFER_EVENTS, SALARY_WRITE_BUFFER_LAG, metrics_registry
+from app.common.metrics.registry import Gauge
+from app.module.asset.logger import asset_logger
+from app.module.asset.model import UserSalary
+from app.module.asset.repositories.salary_histogram_redis_repository import SalaryHistogramRedisRepository
+from app.module.asset.repositories.salary_write_buffer_redis_repository import (
+    SalaryBufferEntry,
+    SalaryWriteBufferRedisRepository,
+)
+from app.module.asset.repositories.user_car_rank_redis_repository import UserCarRankRedisRepository
+from app.module.asset.repositories.user_profile_repository import UserProfileRepository
+from app.module.asset.repositories.user_salary_repository import UserSalaryRepository
+from app.module.asset.services.car_rank_service import CarRankService
+from app.module.asset.services.percentile_service import SalaryPercentileService
+from database.config import mysql_session_factory
+from database.dependency import get_redis_pool
+from main_config import settings
+
+
+class SalaryWriteBehindService:
+    """
+    쓰기 버퍼 소비자. 스트림에서 읽은 제출을 UUID별 최신 값만 남겨 다중 행 upsert로 반영하고 ack한다.
+    DB 반영에 실패하면 ack하지 않으므로 다음 회수 때 다시 시도된다 (at-least-once).
+    """
+
+    def __init__(self, buffer_repo: SalaryWriteBufferRedisRepository, consumer: str) -> None:
+        self.buffer_repo = buffer_repo
+        self.consumer = consumer
+        self.backlog = 0
+
+    async def drain_once(self, batch_size: int) -> int:
+        """한 배치를 반영하고 처리한 항목 수를 반환"""
+        entries = await self.buffer_repo.read_batch(
+            self.consumer, batch_size, SALARY_WRITE_BUFFER_BLOCK_MS, SALARY_WRITE_BUFFER_CLAIM_IDLE_MS
+        )
+        if not entries:
+            return 0
+
+        salaries = await self._latest_salaries(entries)
+        if salaries:
+            async with mysql_session_factory() as session:
+                user_salary_repo = UserSalaryRepository(session)
+                await self._write(user_salary_repo, salaries)
+                # 반영한 연봉의 프로필 등급/퍼센트를 다시 계산해 둔다 (공유 링크는 저장된 값만 읽음)
+                await self._car_rank_service(session, user_salary_repo).refresh([salary.id for salary in salaries])
+
+        self.backlog = await self.buffer_repo.ack(entries)
+
+        now_ms = time.time() * 1000
+        for entry in entries:
+            SALARY_WRITE_BUFFER_LAG.observe(max(now_ms - entry.enqueued_at_ms, 0) / 1000)
+        SALARY_WRITE_BUFFER_EVENTS.inc("flushed", amount=len(entries))
+        return len(entries)
+
+    async def _latest_salaries(self, entries: list[SalaryBufferEntry]) -> list[UserSalary]:
+        """
+        항목의 payload가 아니라 UUID별 pending 해시의 현재 값(가장 최근 제출)을 반영한다.
+        다른 워커가 더 새로운 항목을 먼저 반영해도 오래된 배치가 되돌리지 않는다.
+        pending 값이 없으면 더 새로운 제출이 이미 반영된 것이므로 건너뛴다.
+        """
+        uids = list(dict.fromkeys(entry.uid for entry in entries))
+        payloads = await self.buffer_repo.get_pending_payloads(uids)
+        return [
+            SalaryWriteBufferRedisRepository.deserialize_salary(uid, payload)
+            for uid, payload in zip(uids, payloads)
+            if payload is not None
+        ]
+
+    def _car_rank_service(self, session: AsyncSession, user_salary_repo: UserSalaryRepository) -> CarRankService:
+        return CarRankService(
+            percentile_service=SalaryPercentileService(
+                histogram_repo=SalaryHistogramRedisRepository(get_redis_pool()),
+                user_salary_repo=user_salary_repo,
+            ),
+            user_profile_repo=UserProfileRepository(session),
+            car_rank_cache_repo=UserCarRankRedisRepository(get_redis_pool()),
+        )
+
+    @staticmethod
+    async def _write(user_salary_repo: UserSalaryRepository, salaries: list[UserSalary]) -> None:
+        try:
+            await user_salary_repo.upsert_submissions(salaries)
+            return
+        except IntegrityError:
+            pass
+
+        # 배치 안에 FK 위반(존재하지 않는 job_id 등) 행이 있으면 한 건씩 저장하고 그 행만 버린다
+        for salary in salaries:
+            try:
+                await user_salary_repo.upsert_submissions([salary])
+            except IntegrityError as e:
+                SALARY_WRITE_BUFFER_EVENTS.inc("dropped")
+                asset_logger.warning("[SalaryWriteBuffer][Dropped] uid=%s error=%s", uuid.UUID(bytes=salary.id), e)
+
+
+async def flush_pending_salary(
+    unique_id: uuid.UUID, buffer_repo: SalaryWriteBufferRedisRepository, user_salary_repo: UserSalaryRepository
+) -> UserSalary | None:
+    """
+    아직 DB에 반영되지 않은 제출이 있으면 바로 저장하고 저장한 값을 반환 (없으면 None)
+    연봉 기록을 참조하는 쓰기(프로필, 이메일 가입) 전에 호출한다.
+    """
+    pending = await buffer_repo.get_pending(unique_id)
+    if pending is None:
+        return None
+
+    await user_salary_repo.upsert_submissions([pending])
+    return pending
+
+
+_consumer: SalaryWriteBehindService | None = None
+
+
+async def run_salary_write_buffer_consumer() -> None:
+    global _consumer
+    _consumer = SalaryWriteBehindService(
+        SalaryWriteBufferRedisRepository(get_redis_pool()), consumer=f"{socket.gethostname()}-{os.getpid()}"
+    )
+
+    group_ready = False
+    while True:
+        try:
+            if not group_ready:
+                await _consumer.buffer_repo.ensure_group()
+                group_ready = True
+            await _consumer.drain_once(settings.salary_write_buffer_batch_size)
+        except Exception as e:
+            asset_logger.warning("[SalaryWriteBuffer][DrainFailed] %s", e)
+            await asyncio.sleep(SALARY_WRITE_BUFFER_RETRY_SEC)
+
+
+metrics_registry.register(
+    Gauge(
+        "salary_write_buffer_backlog",
+        "연봉 쓰기 버퍼에 남아 있는 항목 수 (마지막 배치 반영 시점)",
+        (),
+        lambda: [((), _consumer.backlog)] if _consumer is not None else [],
+    )
+)
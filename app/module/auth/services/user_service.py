@@ -3,18 +3,15 @@ import uuid
 from fastapi import Depends
 
 from app.api.auth.v1.schemas.user_schema import UserEmailRequest
-from app.module.asset.model import UserSalary
+from app.module.asset.repositories.salary_write_buffer_redis_repository import SalaryWriteBufferRedisRepository
 from app.module.asset.repositories.user_salary_repository import UserSalaryRepository
+from app.module.asset.services.salary_write_behind_service import flush_pending_salary
 from app.module.auth.enums import UserConsentEventEnum
-from app.module.auth.errors.user_error import (
-    ConsentCreationFailed,
-    SalaryAlreadyLinked,
-    SalaryNotFound,
-    UserCreationFailed,
-)
+from app.module.auth.errors.user_error import SalaryAlreadyLinked, SalaryNotFound, UserCreationFailed
 from app.module.auth.model import User, UserConsent
 from app.module.auth.repositories.user_consent_repository import UserConsentRepository
 from app.module.auth.repositories.user_repository import UserRepository
+from main_config import settings
 
 
 class UserService:
@@ -23,10 +20,12 @@ class UserService:
         user_repo: UserRepository = Depends(),
         user_salary_repo: UserSalaryRepository = Depends(),
         user_consent_repo: UserConsentRepository = Depends(),
+        salary_write_buffer_repo: SalaryWriteBufferRedisRepository = Depends(),
     ):
         self.user_repo = user_repo
         self.user_consent_repo = user_consent_repo
         self.user_salary_repo = user_salary_repo
+        self.salary_write_buffer_repo = salary_write_buffer_repo
 
     async def save_user_with_marketing(self, user_email_request: UserEmailRequest) -> bool:
         data = user_email_request.model_dump()
@@ -34,24 +33,24 @@ class UserService:
         uid: uuid.UUID = data.pop("unique_id")
         email: str = data["email"]
         agree: bool = data["agree"]
-        salary_record: UserSalary | None = await self.user_salary_repo.get_by_uuid(uid)
 
-        if not salary_record:
-            raise SalaryNotFound()
-        if salary_record.user_id:
-            raise SalaryAlreadyLinked()
+        # 연봉 제출이 아직 쓰기 버퍼에만 있으면 연결 전에 반영한다
+        if settings.salary_write_behind_enabled:
+            await flush_pending_salary(uid, self.salary_write_buffer_repo, self.user_salary_repo)
 
-        new_user = User(email=email)
-        user = await self.user_repo.save(new_user, True)
-        if not user:
-            raise UserCreationFailed()
+        # 유저, 동의, 연봉 연결을 한 트랜잭션으로 커밋한다. 중간에 실패하면 유저만 남지 않도록 전부 롤백
+        async with self.user_repo.unit_of_work():
+            user = await self.user_repo.stage_and_flush(User(email=email))
+            if not user.id:
+                raise UserCreationFailed()
 
-        user_consent = UserConsent(user_id=user.id, event=UserConsentEventEnum.MARKETING, agree=agree)
-        consent = await self.user_consent_repo.save(user_consent)
-        if not consent:
-            raise ConsentCreationFailed()
+            self.user_consent_repo.stage(
+                UserConsent(user_id=user.id, event=UserConsentEventEnum.MARKETING, agree=agree)
+            )
 
-        salary_record.user_id = user.id
-        await self.user_salary_repo.save(salary_record)
+            if not await self.user_salary_repo.link_user(uid, user.id):
+                # 실패한 경우에만 원인을 구분하기 위해 조회
+                salary_record = await self.user_salary_repo.get_by_uuid(uid)
+                raise SalaryAlreadyLinked() if salary_record else SalaryNotFound()
 
         return True
@@ -19,8 +19,11 @@ except ValueError:
 
 
 MYSQL_URL = env.db_url
+# false면 체크아웃마다 ping을 보내지 않고 wait_timeout보다 짧은 주기로 커넥션을 교체한다
+DB_POOL_PRE_PING = getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true")
+DB_POOL_RECYCLE_SECOND = 60 * 30
 
-engine = create_async_engine(MYSQL_URL, pool_pre_ping=True, echo=False)
+engine = create_async_engine(MYSQL_URL, pool_pre_ping=DB_POOL_PRE_PING, pool_recycle=DB_POOL_RECYCLE_SECOND, echo=False)
 SessionLocal = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
 
 
@@ -1,11 +1,20 @@
 from os import getenv
+from time import perf_counter_ns
 
 from dotenv import load_dotenv
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import Delete, Insert, Update
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.common.enums import EnvironmentType
-from database.constant import CONNECTION_TIMEOUT_SECOND, DB_MAX_OVERFLOW, DB_POOL_SIZE, POOL_TIMEOUT_SECOND
+from app.common.metrics.metrics import DB_POOL_WAIT, metrics_registry
+from app.common.metrics.registry import Gauge
+from app.common.metrics.request_context import record_db_checkout
+from database.constant import CONNECTION_TIMEOUT_SECOND, PRIMARY_STICKY_KEY, REPLICA_BIND_ARGUMENT
+from database.instrumentation import instrument_engine, instrument_pool
+from main_config import settings
 
 load_dotenv()
 
@@ -14,7 +23,7 @@ ENVIRONMENT = getenv("ENVIRONMENT", None)
 if not ENVIRONMENT:
     raise ValueError("ENVIRONMENT 환경변수가 설정되지 않았습니다.")
 
-QUERY_LOG = getenv("QUERY_LOG", False)
+QUERY_LOG = getenv("QUERY_LOG", "false").lower() in ("1", "true")
 
 
 try:
@@ -23,15 +32,82 @@ except ValueError:
     raise ValueError(f"정의되지 않는 환경 변수 값입니다. {ENVIRONMENT=}")
 
 MYSQL_URL = env.db_url
+MYSQL_REPLICA_URL = env.replica_db_url
 
-mysql_engine = create_async_engine(
-    MYSQL_URL,
-    pool_pre_ping=True,
-    pool_size=DB_POOL_SIZE,
-    max_overflow=DB_MAX_OVERFLOW,
-    pool_timeout=POOL_TIMEOUT_SECOND,
-    connect_args={"connect_timeout": CONNECTION_TIMEOUT_SECOND},
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    커넥션을 얻기까지 기다린 시간(풀 대기 + 신규 연결)을 기록하는 풀
+    """
+
+    def _do_get(self):
+        start = perf_counter_ns()
+        try:
+            return super()._do_get()
+        finally:
+            elapsed_ns = perf_counter_ns() - start
+            DB_POOL_WAIT.observe(elapsed_ns / 1_000_000_000)
+            record_db_checkout(elapsed_ns)
+
+
+def create_mysql_engine(url: str, role: str) -> AsyncEngine:
+    engine = create_async_engine(
+        url,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        pool_size=settings.mysql_pool_size,
+        max_overflow=settings.mysql_max_overflow,
+        pool_timeout=settings.db_pool_timeout_sec,
+        pool_recycle=settings.db_pool_recycle_sec,
+        connect_args={"connect_timeout": CONNECTION_TIMEOUT_SECOND},
+    )
+    instrument_engine(engine.sync_engine, query_log=QUERY_LOG)
+    instrument_pool(engine.sync_engine, role)
+    return engine
+
+
+mysql_engine = create_mysql_engine(MYSQL_URL, "primary")
+mysql_replica_engine = create_mysql_engine(MYSQL_REPLICA_URL, "replica") if MYSQL_REPLICA_URL else None
+
+
+class RoutingSession(Session):
+    """
+    읽기 전용으로 표시된 조회(bind_arguments={"replica": True})만 replica로 보내고 나머지는 primary로 보낸다.
+    세션(=요청)에서 쓰기가 한 번이라도 일어나면 이후 조회도 primary로 고정해 방금 쓴 데이터를 읽을 수 있게 한다.
+    """
+
+    def get_bind(self, mapper=None, *, clause=None, **kw) -> Engine:
+        if self._flushing or isinstance(clause, (Insert, Update, Delete)):
+            self.info[PRIMARY_STICKY_KEY] = True
+            return mysql_engine.sync_engine
+
+        if kw.get(REPLICA_BIND_ARGUMENT) and mysql_replica_engine is not None and not self.info.get(PRIMARY_STICKY_KEY):
+            return mysql_replica_engine.sync_engine
+
+        return mysql_engine.sync_engine
+
+
+mysql_session_factory = sessionmaker(
+    bind=mysql_engine, class_=AsyncSession, sync_session_class=RoutingSession, expire_on_commit=False
 )
 
 
-mysql_session_factory = sessionmaker(bind=mysql_engine, class_=AsyncSession, expire_on_commit=False)
+def _collect_db_pool_stats():
+    engines = {"primary": mysql_engine, "replica": mysql_replica_engine}
+    stats = []
+    for role, engine in engines.items():
+        if engine is None:
+            continue
+        pool = engine.pool
+        stats += [
+            ((role, "checked_out"), pool.checkedout()),  # type: ignore[attr-defined]
+            ((role, "idle"), pool.checkedin()),  # type: ignore[attr-defined]
+            ((role, "overflow"), max(pool.overflow(), 0)),  # type: ignore[attr-defined]
+            ((role, "size"), pool.size()),  # type: ignore[attr-defined]
+        ]
+    return stats
+
+
+metrics_registry.register(
+    Gauge("db_pool_connections", "DB 커넥션 풀 역할/상태별 커넥션 수", ("role", "state"), _collect_db_pool_stats)
+)
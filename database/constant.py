@@ -1,8 +1,17 @@
-DB_POOL_SIZE = 5
-DB_MAX_OVERFLOW = 10
+# 워커당 DB 커넥션 풀 환경별 기본값. Settings(db_pool_size, db_max_overflow)로 덮어쓸 수 있다
+DB_POOL_SIZE_BY_ENV = {"local": 5, "test": 5, "dev": 5, "prod": 10}
+DB_MAX_OVERFLOW_BY_ENV = {"local": 5, "test": 5, "dev": 10, "prod": 10}
+# RDS/MySQL wait_timeout(기본 8시간)보다 짧게 재연결
+DB_POOL_RECYCLE_SECOND = 60 * 30
 
 
 CONNECTION_TIMEOUT_SECOND = 10
 POOL_TIMEOUT_SECOND = 7
 
 REDIS_SOCKET_CONNECTION_TIMEOUT_SECOND = 5
+
+MYSQL_FOREIGN_KEY_VIOLATION_CODE = 1452
+
+# Session.execute(bind_arguments=...)로 replica 조회를 표시하는 키 / 쓰기 후 primary 고정 여부를 담는 Session.info 키
+REPLICA_BIND_ARGUMENT = "replica"
+PRIMARY_STICKY_KEY = "primary_sticky"
@@ -1,13 +1,18 @@
 from os import getenv
+from time import perf_counter_ns
 from typing import AsyncGenerator
 
 from dotenv import load_dotenv
-from redis.asyncio import ConnectionPool, Redis
+from redis.asyncio import BlockingConnectionPool, Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.common.enums import EnvironmentType
-from database.config import mysql_session_factory
-from database.constant import DB_POOL_SIZE, REDIS_SOCKET_CONNECTION_TIMEOUT_SECOND
+from app.common.metrics.metrics import metrics_registry
+from app.common.metrics.registry import Gauge
+from app.common.metrics.request_context import SPAN_REDIS, record_span
+from database.config import mysql_replica_engine, mysql_session_factory
+from database.constant import REDIS_SOCKET_CONNECTION_TIMEOUT_SECOND
+from main_config import settings
 
 load_dotenv()
 
@@ -23,7 +28,28 @@ REDIS_HOST = env.redis_host
 REDIS_PORT = int(getenv("REDIS_PORT", 6379))
 
 
+class InstrumentedRedis(Redis):
+    """
+    명령 실행 시간을 현재 요청의 redis 구간으로 기록하는 클라이언트 (EVALSHA 포함, 파이프라인 제외)
+    """
+
+    async def execute_command(self, *args, **options):
+        start = perf_counter_ns()
+        try:
+            return await super().execute_command(*args, **options)
+        finally:
+            record_span(SPAN_REDIS, perf_counter_ns() - start)
+
+
+# 워커(프로세스)당 하나의 Redis 클라이언트/커넥션 풀을 공유한다
+_redis_client: Redis | None = None
+
+
 async def get_mysql_session_router() -> AsyncGenerator[AsyncSession, None]:
+    """
+    요청 단위 세션. AsyncSession은 첫 쿼리 시점에만 풀에서 커넥션을 체크아웃하므로
+    캐시로만 응답하는 요청은 풀/pre_ping을 거치지 않는다. (세션 생성 시점에 쿼리를 실행하지 말 것)
+    """
     session = mysql_session_factory()
     try:
         yield session
@@ -31,13 +57,78 @@ async def get_mysql_session_router() -> AsyncGenerator[AsyncSession, None]:
         await session.close()
 
 
+def init_redis_pool() -> Redis:
+    """
+    워커 전역 Redis 커넥션 풀 생성 (lifespan 시작 시 호출, 이미 있으면 재사용)
+    """
+    global _redis_client
+    if _redis_client is None:
+        # 커넥션이 모두 사용 중이면 바로 "Too many connections" 오류 대신 반납될 때까지 timeout초 기다린다
+        pool = BlockingConnectionPool(
+            host=REDIS_HOST,
+            port=REDIS_PORT,
+            max_connections=settings.redis_max_connections,
+            timeout=settings.redis_pool_timeout_sec,
+            health_check_interval=settings.redis_health_check_interval_sec,
+            decode_responses=True,
+            socket_connect_timeout=REDIS_SOCKET_CONNECTION_TIMEOUT_SECOND,
+            socket_timeout=REDIS_SOCKET_CONNECTION_TIMEOUT_SECOND,
+        )
+        _redis_client = InstrumentedRedis(connection_pool=pool)
+    return _redis_client
+
+
+async def close_redis_pool() -> None:
+    """
+    워커 전역 Redis 커넥션 풀 종료 (lifespan 종료 시 호출)
+    """
+    global _redis_client
+    if _redis_client is None:
+        return
+    client, _redis_client = _redis_client, None
+    await client.aclose(close_connection_pool=True)
+
+
 def get_redis_pool() -> Redis:
-    pool = ConnectionPool(
-        host=REDIS_HOST,
-        port=REDIS_PORT,
-        max_connections=DB_POOL_SIZE,
-        decode_responses=True,
-        socket_connect_timeout=REDIS_SOCKET_CONNECTION_TIMEOUT_SECOND,
-        socket_timeout=REDIS_SOCKET_CONNECTION_TIMEOUT_SECOND,
+    """
+    공유 Redis 클라이언트 반환. lifespan 밖(배치 스크립트 등)에서는 최초 호출 시 생성한다.
+    """
+    return _redis_client or init_redis_pool()
+
+
+def get_redis_pool_stats() -> dict[str, int]:
+    """
+    공유 커넥션 풀 사용 현황 (사용 중/유휴/최대)
+    """
+    if _redis_client is None:
+        return {"in_use": 0, "idle": 0, "max": settings.redis_max_connections}
+    pool = _redis_client.connection_pool
+    return {
+        "in_use": len(pool._in_use_connections),
+        "idle": len(pool._available_connections),
+        "max": pool.max_connections,
+    }
+
+
+def describe_pool_capacity() -> dict[str, dict[str, int]]:
+    """
+    풀별 최대 커넥션 수를 워커당/노드당(워커 수 곱)으로 계산. DB max_connections 산정에 쓴다.
+    """
+    mysql_per_worker = settings.mysql_pool_size + settings.mysql_max_overflow
+    per_worker = {"mysql_primary": mysql_per_worker}
+    if mysql_replica_engine is not None:
+        per_worker["mysql_replica"] = mysql_per_worker
+    per_worker["redis"] = settings.redis_max_connections
+    return {
+        name: {"per_worker": count, "per_node": count * settings.web_concurrency} for name, count in per_worker.items()
+    }
+
+
+metrics_registry.register(
+    Gauge(
+        "redis_pool_connections",
+        "Redis 커넥션 풀 상태별 커넥션 수",
+        ("state",),
+        lambda: [((state,), count) for state, count in get_redis_pool_stats().items()],
     )
-    return Redis(connection_pool=pool)
+)
@@ -0,0 +1,67 @@
+from time import perf_counter_ns
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.common.logger.enums import LogTag
+from app.common.metrics.metrics import DB_POOL_EVENTS
+from app.common.metrics.request_context import request_stats
+from app.common.middleware.logger import middleware_logger
+
+QUERY_START_KEY = "query_start_ns"
+
+
+def instrument_engine(engine: Engine, query_log: bool = False) -> None:
+    """
+    커서 실행 전후 훅으로 SQL 실행 시간을 현재 요청(contextvar)에 기록한다.
+    query_log가 켜져 있으면 실행된 SQL과 소요 시간을 QUERY 태그로 남긴다.
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault(QUERY_START_KEY, []).append(perf_counter_ns())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed_ns = perf_counter_ns() - conn.info[QUERY_START_KEY].pop()
+
+        stats = request_stats.get()
+        if stats is not None:
+            stats.record_query(statement, elapsed_ns)
+
+        if query_log:
+            middleware_logger.debug(
+                "elapsed_ms=%.2f statement=%s", elapsed_ns / 1_000_000, statement, extra={"tag": LogTag.QUERY.value}
+            )
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(exception_context):
+        # 실패한 SQL은 after_cursor_execute가 호출되지 않으므로 시작 시각을 정리한다
+        conn = exception_context.connection
+        if conn is not None and conn.info.get(QUERY_START_KEY):
+            conn.info[QUERY_START_KEY].pop()
+
+
+def instrument_pool(engine: Engine, role: str) -> None:
+    """
+    커넥션 풀 이벤트를 역할(primary/replica)별로 집계한다.
+    새 연결과 무효화는 드물고 장애 신호이므로 로그도 남긴다.
+    """
+
+    @event.listens_for(engine, "connect")
+    def connect(dbapi_connection, connection_record):
+        DB_POOL_EVENTS.inc(role, "connect")
+        middleware_logger.debug("[DBPool][Connect] role=%s", role)
+
+    @event.listens_for(engine, "checkout")
+    def checkout(dbapi_connection, connection_record, connection_proxy):
+        DB_POOL_EVENTS.inc(role, "checkout")
+
+    @event.listens_for(engine, "checkin")
+    def checkin(dbapi_connection, connection_record):
+        DB_POOL_EVENTS.inc(role, "checkin")
+
+    @event.listens_for(engine, "invalidate")
+    def invalidate(dbapi_connection, connection_record, exception):
+        DB_POOL_EVENTS.inc(role, "invalidate")
+        middleware_logger.warning("[DBPool][Invalidate] role=%s error=%r", role, exception)
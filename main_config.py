@@ -1,13 +1,47 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from app.common.enums import EnvironmentType
+from database.constant import (
+    DB_MAX_OVERFLOW_BY_ENV,
+    DB_POOL_RECYCLE_SECOND,
+    DB_POOL_SIZE_BY_ENV,
+    POOL_TIMEOUT_SECOND,
+)
 
 
 class Settings(BaseSettings):
     environment: EnvironmentType = EnvironmentType.LOCAL
     rate_limit_max_calls: int = 1
+    # POST /salary는 같은 uuid의 수정/재제출과 공용(CGNAT) IP 사용자를 고려해 prod에서 시간당 10회까지 허용
+    rate_limit_salary_max_calls: int = 10
+    rate_limit_salary_period_sec_prod: int = 60 * 60
+    rate_limit_profile_max_calls: int = 5
+    rate_limit_email_max_calls: int = 3
     rate_limit_period_sec_dev: int = 10
     rate_limit_period_sec_prod: int = 60 * 60 * 24
+    # 워커당 커넥션 풀. size/overflow를 비워두면 환경별 기본값을 쓴다
+    db_pool_size: int | None = None
+    db_max_overflow: int | None = None
+    db_pool_timeout_sec: int = POOL_TIMEOUT_SECOND
+    db_pool_recycle_sec: int = DB_POOL_RECYCLE_SECOND
+    # False면 체크아웃마다 보내는 ping을 생략하고 recycle + 끊긴 커넥션 재시도(BaseRepository)에 맡긴다
+    db_pool_pre_ping: bool = True
+    # save_many/upsert_many 한 문장(=한 트랜잭션)에 담는 행 수
+    db_bulk_write_batch_size: int = 500
+    redis_max_connections: int = 50
+    # 풀이 가득 찼을 때 커넥션 반납을 기다리는 최대 시간
+    redis_pool_timeout_sec: int = 2
+    redis_health_check_interval_sec: int = 30
+    # prod에서는 내부 구간 시간을 노출하지 않도록 기본 비활성화 (dev/local은 항상 노출)
+    server_timing_enabled: bool = False
+    # prod /metrics 접근 토큰 (Authorization: Bearer ...). 비워두면 prod에서는 /metrics가 404
+    metrics_token: str | None = None
+    # 켜면 POST /salary는 Redis Stream에 적재 후 바로 응답하고, 백그라운드 소비자가 배치로 DB에 반영한다
+    salary_write_behind_enabled: bool = False
+    salary_write_buffer_max_backlog: int = 10_000
+    salary_write_buffer_batch_size: int = 200
+    # 노드당 uvicorn 워커 수 (uvicorn도 같은 WEB_CONCURRENCY 환경변수를 읽는다)
+    web_concurrency: int = 1
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -24,5 +58,21 @@ class Settings(BaseSettings):
         else:
             return self.rate_limit_period_sec_prod
 
+    @property
+    def salary_rate_limit_period(self) -> int:
+        env = self.environment.lower()
+        if env in ("local", "dev"):
+            return self.rate_limit_period_sec_dev
+        else:
+            return self.rate_limit_salary_period_sec_prod
+
+    @property
+    def mysql_pool_size(self) -> int:
+        return self.db_pool_size if self.db_pool_size is not None else DB_POOL_SIZE_BY_ENV[self.environment]
+
+    @property
+    def mysql_max_overflow(self) -> int:
+        return self.db_max_overflow if self.db_max_overflow is not None else DB_MAX_OVERFLOW_BY_ENV[self.environment]
+
 
 settings = Settings()
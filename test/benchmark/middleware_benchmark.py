@@ -0,0 +1,100 @@
+import asyncio
+import logging
+import time
+import uuid
+from time import perf_counter_ns
+
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from app.common.logger.constant import SLOW_LATENCY_MS
+from app.common.logger.enums import LogTag
+from app.common.middleware.logger import LoggingMiddleware, middleware_logger
+
+# 요청당 LoggingMiddleware 오버헤드 비교: 기존 BaseHTTPMiddleware 구현 vs 현재 ASGI 구현
+# 실행: PYTHONPATH=. ENVIRONMENT=local python test/benchmark/middleware_benchmark.py
+
+NUMBER = 5_000
+
+
+class LegacyLoggingMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        request_id = request.headers.get("X-Request-ID") or str(uuid.uuid4())
+        start = time.time()
+
+        middleware_logger.info(
+            f"id={request_id} method={request.method} path={request.url.path}", extra={"tag": LogTag.REQUEST.value}
+        )
+        response = await call_next(request)
+        latency = int((time.time() - start) * 1000)
+
+        if latency > SLOW_LATENCY_MS:
+            middleware_logger.warning(
+                f"SLOWREQUEST: latency_ms={latency} method={request.method} path={request.url.path}"
+            )
+
+        middleware_logger.info(
+            f"id={request_id} status={response.status_code} latency_ms={latency}", extra={"tag": LogTag.RESPONSE.value}
+        )
+        response.headers["X-Request-ID"] = request_id
+        return response
+
+
+async def ping(request: Request) -> PlainTextResponse:
+    return PlainTextResponse("pong")
+
+
+def build_app(middleware: list[Middleware]) -> Starlette:
+    return Starlette(routes=[Route("/ping", ping)], middleware=middleware)
+
+
+async def run(app: Starlette) -> float:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/ping",
+        "raw_path": b"/ping",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    start = perf_counter_ns()
+    for _ in range(NUMBER):
+        await app(dict(scope), receive, send)
+    return (perf_counter_ns() - start) / NUMBER / 1_000
+
+
+async def main() -> None:
+    apps = {
+        "no middleware": build_app([]),
+        "legacy": build_app([Middleware(LegacyLoggingMiddleware)]),
+        "current": build_app([Middleware(LoggingMiddleware)]),
+    }
+    # 운영처럼 INFO 로그가 꺼진 경우와 켜진 경우(출력은 버림)를 모두 측정
+    middleware_logger.handlers, handlers = [logging.NullHandler()], middleware_logger.handlers
+    for level in (logging.WARNING, logging.INFO):
+        middleware_logger.setLevel(level)
+        for name, app in apps.items():
+            await run(app)  # warm-up
+            print(f"[{logging.getLevelName(level)}] {name:>13}: {await run(app):7.1f} us/request")
+    middleware_logger.handlers = handlers
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
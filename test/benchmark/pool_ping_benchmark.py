@@ -0,0 +1,41 @@
+import asyncio
+from time import perf_counter_ns
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from database.config import MYSQL_URL
+from main_config import settings
+
+# 체크아웃 + 짧은 조회 1회의 요청당 지연 비교: pool_pre_ping vs pool_recycle(ping 생략)
+# pre_ping은 체크아웃마다 왕복이 하나 더 생기므로 DB까지의 RTT만큼 차이가 난다 (로컬 DB에서는 차이가 작다)
+# 실행: PYTHONPATH=. ENVIRONMENT=local python test/benchmark/pool_ping_benchmark.py
+
+NUMBER = 2_000
+
+
+async def run(engine: AsyncEngine) -> float:
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))  # 풀 예열
+
+    start = perf_counter_ns()
+    for _ in range(NUMBER):
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    return (perf_counter_ns() - start) / NUMBER / 1_000
+
+
+async def main() -> None:
+    for label, pre_ping in (("pre_ping", True), ("recycle", False)):
+        engine = create_async_engine(
+            MYSQL_URL, pool_size=1, pool_pre_ping=pre_ping, pool_recycle=settings.db_pool_recycle_sec
+        )
+        try:
+            elapsed_us = await run(engine)
+        finally:
+            await engine.dispose()
+        print(f"{label:>8}: {elapsed_us:8.1f} us/request")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
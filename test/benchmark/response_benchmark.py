@@ -0,0 +1,68 @@
+import json
+import timeit
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from app.api.asset.v1.schemas.asset_schema import JobItem, JobResponseData, JobSuccessResponse
+from app.common.response import CustomJSONResponse
+from app.common.schemas.base_schema import to_camel
+
+# /jobs 응답 직렬화 비교: 기존 CustomJSONResponse(키마다 to_camel + 표준 json) vs 현재 구현
+# 실행: PYTHONPATH=. ENVIRONMENT=local python test/benchmark/response_benchmark.py
+
+JOB_GROUP_COUNT = 20
+JOBS_PER_GROUP = 15
+NUMBER = 2_000
+
+
+def legacy_convert_keys(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(by_alias=True)
+    elif isinstance(obj, dict):
+        return {to_camel(k) if isinstance(k, str) else k: legacy_convert_keys(v) for k, v in obj.items()}
+    elif isinstance(obj, list):
+        return [legacy_convert_keys(i) for i in obj]
+    return obj
+
+
+class LegacyCustomJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return super().render(legacy_convert_keys(content))
+
+
+def build_jobs_response() -> JobSuccessResponse:
+    items = [
+        JobItem(id=group * JOBS_PER_GROUP + job, name=f"직군{group} 직무{job}")
+        for group in range(JOB_GROUP_COUNT)
+        for job in range(JOBS_PER_GROUP)
+    ]
+    return JobSuccessResponse(data=JobResponseData(items=items))
+
+
+def main() -> None:
+    response = build_jobs_response()
+    # FastAPI는 response_model 직렬화 결과(dict)를 응답 클래스에 넘긴다
+    encoded = jsonable_encoder(response)
+
+    legacy = LegacyCustomJSONResponse(encoded)
+    current = CustomJSONResponse(encoded)
+    assert json.loads(legacy.body) == json.loads(current.body) == json.loads(CustomJSONResponse(response).body)
+
+    cases = {
+        "legacy(dict)": lambda: LegacyCustomJSONResponse(encoded),
+        "current(dict)": lambda: CustomJSONResponse(encoded),
+        "current(model)": lambda: CustomJSONResponse(response),
+    }
+    print(
+        f"/jobs payload: {len(current.body):,} bytes, {JOB_GROUP_COUNT * JOBS_PER_GROUP} items, {NUMBER:,} iterations"
+    )
+    for name, case in cases.items():
+        elapsed = timeit.timeit(case, number=NUMBER)
+        print(f"{name:>15}: {elapsed / NUMBER * 1_000_000:8.1f} us/op")
+
+
+if __name__ == "__main__":
+    main()
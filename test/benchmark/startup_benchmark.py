@@ -0,0 +1,40 @@
+import os
+import statistics
+import subprocess
+import sys
+
+# main:app 임포트(= uvicorn 워커가 요청을 받기 전까지의 모듈 로딩) 시간 측정
+# 실행: PYTHONPATH=. ENVIRONMENT=local python test/benchmark/startup_benchmark.py
+
+RUNS = 5
+
+MEASURE_IMPORT = """
+import time
+start = time.perf_counter()
+from main import app
+print(time.perf_counter() - start)
+"""
+
+
+def measure_import() -> float:
+    result = subprocess.run(
+        [sys.executable, "-c", MEASURE_IMPORT],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=os.environ.copy(),
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    measure_import()  # warm-up (.pyc 생성)
+    samples = [measure_import() for _ in range(RUNS)]
+    print(
+        f"import main:app  median={statistics.median(samples) * 1000:.0f}ms "
+        f"min={min(samples) * 1000:.0f}ms max={max(samples) * 1000:.0f}ms ({RUNS} runs)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException
+
+from app.common.dependencies.metrics_guard import metrics_access_guard
+from app.common.enums import EnvironmentType
+from main_config import settings
+
+
+@pytest.fixture
+def prod_env():
+    with patch.object(settings, "environment", EnvironmentType.PROD), patch.object(settings, "metrics_token", "secret"):
+        yield
+
+
+class TestMetricsAccessGuard:
+    def test_dev_is_open(self):
+        # When & Then - 예외 없이 통과
+        with patch.object(settings, "environment", EnvironmentType.DEV):
+            metrics_access_guard(None)
+
+    def test_prod_with_valid_token(self, prod_env):
+        # When & Then
+        metrics_access_guard("Bearer secret")
+
+    @pytest.mark.parametrize("authorization", [None, "Bearer wrong", "secret"])
+    def test_prod_without_valid_token_hidden(self, prod_env, authorization):
+        # When
+        with pytest.raises(HTTPException) as exc_info:
+            metrics_access_guard(authorization)
+
+        # Then - 엔드포인트 존재 자체를 드러내지 않는다
+        assert exc_info.value.status_code == 404
+
+    def test_prod_without_configured_token_disabled(self):
+        # Given - 토큰 미설정
+        with patch.object(settings, "environment", EnvironmentType.PROD), patch.object(settings, "metrics_token", None):
+            # When & Then
+            with pytest.raises(HTTPException):
+                metrics_access_guard("Bearer ")
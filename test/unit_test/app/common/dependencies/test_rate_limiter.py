@@ -0,0 +1,110 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import HTTPException, Response
+
+from app.common.dependencies.rate_limiter import RateLimiter
+from app.common.enums import EnvironmentType
+from app.common.redis_repository.rate_limit_redis_repository import RateLimitRedisRepository, RateLimitResult
+from main_config import Settings
+
+
+@pytest.fixture
+def mock_rate_limit_repo():
+    """RateLimitRedisRepository Mock"""
+    return AsyncMock(spec=RateLimitRedisRepository)
+
+
+@pytest.fixture
+def mock_request():
+    request = MagicMock()
+    request.client.host = "10.0.0.1"
+    request.url.path = "/api/asset/v1/salary"
+    return request
+
+
+@pytest.fixture
+def rate_limiter():
+    return RateLimiter("salary_submit", max_calls=3, period=60)
+
+
+class TestRateLimiter:
+    @pytest.mark.asyncio
+    async def test_allowed_sets_rate_limit_headers(self, rate_limiter, mock_request, mock_rate_limit_repo):
+        # Given
+        mock_rate_limit_repo.hit.return_value = RateLimitResult(allowed=True, remaining=2, reset_ms=59_500)
+        response = Response()
+
+        # When
+        await rate_limiter(mock_request, response, None, None, mock_rate_limit_repo)
+
+        # Then
+        key, _, max_calls, period = mock_rate_limit_repo.hit.call_args[0]
+        assert key == "rate_limit:salary_submit:10.0.0.1"
+        assert (max_calls, period) == (3, 60)
+        assert response.headers["X-RateLimit-Limit"] == "3"
+        assert response.headers["X-RateLimit-Remaining"] == "2"
+        assert response.headers["X-RateLimit-Reset"] == "60"
+
+    @pytest.mark.asyncio
+    async def test_exceeded_raises_429_with_retry_after(self, rate_limiter, mock_request, mock_rate_limit_repo):
+        # Given
+        mock_rate_limit_repo.hit.return_value = RateLimitResult(allowed=False, remaining=0, reset_ms=12_300)
+
+        # When
+        with pytest.raises(HTTPException) as exc_info:
+            await rate_limiter(mock_request, Response(), None, None, mock_rate_limit_repo)
+
+        # Then
+        assert exc_info.value.status_code == 429
+        assert exc_info.value.headers["Retry-After"] == "13"
+        assert exc_info.value.headers["X-RateLimit-Remaining"] == "0"
+
+    @pytest.mark.asyncio
+    async def test_forged_forwarded_for_does_not_change_key(self, rate_limiter, mock_request, mock_rate_limit_repo):
+        # Given - 클라이언트가 매 요청 X-Forwarded-For 앞쪽 값을 바꿔 보내도 nginx가 X-Real-IP를 덮어쓴다
+        mock_rate_limit_repo.hit.return_value = RateLimitResult(allowed=True, remaining=2, reset_ms=60_000)
+
+        # When
+        for forged in ("1.1.1.1", "2.2.2.2"):
+            await rate_limiter(mock_request, Response(), f"{forged}, 203.0.113.7", "203.0.113.7", mock_rate_limit_repo)
+
+        # Then
+        keys = {call.args[0] for call in mock_rate_limit_repo.hit.call_args_list}
+        assert keys == {"rate_limit:salary_submit:203.0.113.7"}
+
+    @pytest.mark.asyncio
+    async def test_forwarded_for_takes_last_hop_without_real_ip(self, rate_limiter, mock_request, mock_rate_limit_repo):
+        # Given - X-Real-IP가 없으면 프록시가 붙인 마지막 값을 사용
+        mock_rate_limit_repo.hit.return_value = RateLimitResult(allowed=True, remaining=2, reset_ms=60_000)
+
+        # When
+        await rate_limiter(mock_request, Response(), "1.2.3.4, 203.0.113.7", None, mock_rate_limit_repo)
+
+        # Then
+        assert mock_rate_limit_repo.hit.call_args[0][0] == "rate_limit:salary_submit:203.0.113.7"
+
+    @pytest.mark.asyncio
+    async def test_unknown_client_ip_raises_400(self, rate_limiter, mock_rate_limit_repo):
+        # Given
+        request = MagicMock(client=None)
+
+        # When
+        with pytest.raises(HTTPException) as exc_info:
+            await rate_limiter(request, Response(), None, None, mock_rate_limit_repo)
+
+        # Then
+        assert exc_info.value.status_code == 400
+        mock_rate_limit_repo.hit.assert_not_called()
+
+
+class TestSalaryRateLimitPolicy:
+    def test_prod_allows_resubmits_within_hour_window(self):
+        # Given
+        prod_settings = Settings(environment=EnvironmentType.PROD)
+
+        # Then - 하루 1회가 아니라 시간 단위 창으로 재제출을 허용
+        assert prod_settings.salary_rate_limit_period == 60 * 60
+        assert prod_settings.rate_limit_salary_max_calls > 1
+        assert prod_settings.rate_limit_max_calls == 1
+        assert prod_settings.rate_limit_period == 60 * 60 * 24
@@ -0,0 +1,111 @@
+import logging
+from queue import Queue
+from unittest.mock import MagicMock, patch
+
+from app.common.logger.config import (
+    DroppingQueueHandler,
+    TaggedFormatter,
+    _cloudwatch_targets,
+    attach_cloudwatch_handlers,
+    create_logger,
+    get_dropped_log_counts,
+)
+from app.common.logger.enums import LogTag
+
+
+def make_record(level: int, msg: str, *args, **extra) -> logging.LogRecord:
+    record = logging.LogRecord("test", level, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+class TestTaggedFormatter:
+    def test_level_tag(self):
+        # Given
+        formatter = TaggedFormatter("%(message)s")
+
+        # When
+        result = formatter.format(make_record(logging.WARNING, "latency_ms=%d", 350))
+
+        # Then
+        assert result == "[WARN] latency_ms=350"
+
+    def test_extra_tag_overrides_level(self):
+        # Given
+        formatter = TaggedFormatter("%(message)s")
+
+        # When
+        result = formatter.format(make_record(logging.INFO, "id=%s", "abc", tag=LogTag.REQUEST.value))
+
+        # Then
+        assert result == "[REQUEST] id=abc"
+
+
+class TestDroppingQueueHandler:
+    def test_enqueue_without_formatting(self):
+        # Given
+        handler = DroppingQueueHandler(Queue())
+        record = make_record(logging.INFO, "id=%s", "abc")
+
+        # When
+        handler.emit(record)
+
+        # Then - 메시지 합성은 리스너 스레드에서 수행
+        queued = handler.queue.get_nowait()
+        assert queued is record
+        assert queued.msg == "id=%s"
+
+    def test_full_queue_drops_and_counts(self):
+        # Given
+        handler = DroppingQueueHandler(Queue(maxsize=1))
+
+        # When
+        for _ in range(3):
+            handler.emit(make_record(logging.INFO, "msg"))
+
+        # Then
+        assert handler.queue.qsize() == 1
+        assert handler.dropped == 2
+
+
+class TestCreateLogger:
+    def test_only_queue_handler_on_logger(self):
+        # When
+        logger = create_logger(name="test.logger.queue", level="INFO")
+
+        # Then - 로거에는 큐 핸들러만 붙고 출력 핸들러는 리스너 스레드가 호출한다
+        assert len(logger.handlers) == 1
+        assert isinstance(logger.handlers[0], DroppingQueueHandler)
+        assert get_dropped_log_counts()["test.logger.queue"] == 0
+
+    def test_cloudwatch_not_attached_at_import(self):
+        # When
+        with patch("boto3.Session") as mock_session:
+            logger = create_logger(name="test.logger.cloudwatch", level="INFO", cloudwatch_group="olass-test")
+
+        # Then - 임포트 시점에는 네트워크 호출 없음
+        mock_session.assert_not_called()
+        assert len(logger.handlers) == 1
+
+
+class TestAttachCloudWatchHandlers:
+    def test_attach_to_listener_and_set_retention(self):
+        # Given
+        create_logger(name="test.logger.attach", level="INFO", cloudwatch_group="olass-test-attach")
+        target = next(target for target in _cloudwatch_targets if target.logger_name == "test.logger.attach")
+        handlers = target.listener.handlers
+        cw_handler = MagicMock(spec=logging.Handler, level=logging.NOTSET)
+
+        # When
+        with (
+            patch("boto3.Session") as mock_session,
+            patch("watchtower.CloudWatchLogHandler", return_value=cw_handler),
+        ):
+            attach_cloudwatch_handlers()
+
+        # Then
+        assert target.listener.handlers == (*handlers, cw_handler)
+        logs_client = mock_session.return_value.client.return_value
+        logs_client.put_retention_policy.assert_any_call(logGroupName="olass-test-attach", retentionInDays=14)
+        assert _cloudwatch_targets == []
+        target.listener.handlers = handlers
@@ -0,0 +1,107 @@
+import os
+
+from app.common.metrics.registry import (
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    read_snapshots,
+    remove_snapshot,
+    write_snapshot,
+)
+
+
+def make_registry() -> tuple[MetricsRegistry, Counter, Histogram]:
+    registry = MetricsRegistry()
+    counter = registry.register(Counter("cache_requests_total", "cache", ("cache", "result")))
+    histogram = registry.register(Histogram("latency_seconds", "latency", ("route",), (0.1, 1.0)))
+    registry.register(Gauge("pool_connections", "pool", ("state",), lambda: [(("in_use",), 2)]))
+    return registry, counter, histogram
+
+
+class TestMetricsRegistry:
+    def test_render_prometheus_text(self):
+        # Given
+        registry, counter, histogram = make_registry()
+        counter.inc("car_rank", "hit")
+        counter.inc("car_rank", "hit")
+        histogram.observe(0.05, "/jobs")
+        histogram.observe(0.5, "/jobs")
+        histogram.observe(3.0, "/jobs")
+
+        # When
+        text = registry.render([registry.snapshot()])
+
+        # Then - 히스토그램 구간은 누적 개수로 출력
+        assert "# TYPE cache_requests_total counter" in text
+        assert 'cache_requests_total{cache="car_rank",result="hit"} 2' in text
+        assert 'latency_seconds_bucket{route="/jobs",le="0.1"} 1' in text
+        assert 'latency_seconds_bucket{route="/jobs",le="1"} 2' in text
+        assert 'latency_seconds_bucket{route="/jobs",le="+Inf"} 3' in text
+        assert 'latency_seconds_sum{route="/jobs"} 3.55' in text
+        assert 'latency_seconds_count{route="/jobs"} 3' in text
+        assert 'pool_connections{state="in_use"} 2' in text
+
+    def test_render_merges_worker_snapshots(self):
+        # Given - 워커 두 개의 스냅샷
+        registry, counter, histogram = make_registry()
+        counter.inc("car_rank", "miss")
+        histogram.observe(0.05, "/jobs")
+        snapshot = registry.snapshot()
+
+        # When
+        text = registry.render([snapshot, snapshot])
+
+        # Then
+        assert 'cache_requests_total{cache="car_rank",result="miss"} 2' in text
+        assert 'latency_seconds_count{route="/jobs"} 2' in text
+        assert 'pool_connections{state="in_use"} 4' in text
+
+    def test_label_value_escaped(self):
+        # Given
+        registry, counter, _ = make_registry()
+        counter.inc('a"b', "hit")
+
+        # When
+        text = registry.render([registry.snapshot()])
+
+        # Then
+        assert 'cache="a\\"b"' in text
+
+
+class TestSnapshotFiles:
+    def test_write_and_read_snapshot(self, tmp_path):
+        # Given
+        registry, counter, _ = make_registry()
+        counter.inc("car_rank", "hit")
+
+        # When
+        write_snapshot(registry, str(tmp_path))
+        snapshots = read_snapshots(str(tmp_path), stale_sec=60)
+
+        # Then
+        assert snapshots == [registry.snapshot()]
+
+    def test_stale_snapshot_ignored(self, tmp_path):
+        # Given - 종료된 워커가 남긴 오래된 파일
+        registry, _, _ = make_registry()
+        write_snapshot(registry, str(tmp_path))
+        path = tmp_path / f"{os.getpid()}.json"
+        os.utime(path, (0, 0))
+
+        # When
+        snapshots = read_snapshots(str(tmp_path), stale_sec=60)
+
+        # Then
+        assert snapshots == []
+
+    def test_remove_snapshot(self, tmp_path):
+        # Given
+        registry, _, _ = make_registry()
+        write_snapshot(registry, str(tmp_path))
+
+        # When
+        remove_snapshot(str(tmp_path))
+
+        # Then
+        assert os.listdir(tmp_path) == []
@@ -0,0 +1,60 @@
+from app.common.metrics.request_context import RequestStats, record_db_checkout, record_span, request_stats
+
+
+class TestRequestStats:
+    def test_phases_handler_is_remaining_time(self):
+        # Given
+        stats = RequestStats()
+        stats.record_query("SELECT 1", 3_000_000)
+        stats.add_span("redis", 1_000_000)
+        stats.add_span("redis", 1_000_000)
+        stats.add_span("serialize", 500_000)
+
+        # When
+        phases = stats.phases_ms(total_ns=10_000_000)
+
+        # Then
+        assert phases == {"pool": 0.0, "db": 3.0, "redis": 2.0, "serialize": 0.5, "handler": 4.5}
+
+    def test_server_timing_header(self):
+        # Given
+        stats = RequestStats()
+        stats.record_query("SELECT 1", 1_200_000)
+
+        # When
+        header = stats.server_timing(total_ns=2_000_000)
+
+        # Then
+        assert header == 'pool;dur=0.0, db;dur=1.2;desc="1 queries", redis;dur=0.0, serialize;dur=0.0, handler;dur=0.8'
+
+
+class TestRecordSpan:
+    def test_ignored_outside_request(self):
+        # When / Then - 예외 없이 무시
+        record_span("redis", 1_000)
+        assert request_stats.get() is None
+
+    def test_recorded_inside_request(self):
+        # Given
+        stats = RequestStats()
+        token = request_stats.set(stats)
+
+        # When
+        record_span("redis", 1_000)
+        request_stats.reset(token)
+
+        # Then
+        assert stats.span_ns == {"redis": 1_000}
+
+    def test_db_checkout_counted_with_pool_wait(self):
+        # Given
+        stats = RequestStats()
+        token = request_stats.set(stats)
+
+        # When
+        record_db_checkout(2_000)
+        request_stats.reset(token)
+
+        # Then
+        assert stats.db_checkouts == 1
+        assert stats.span_ns == {"pool": 2_000}
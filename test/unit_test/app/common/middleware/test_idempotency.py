@@ -0,0 +1,155 @@
+import threading
+from unittest.mock import AsyncMock
+
+import pytest
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.common.middleware.idempotency import IdempotencyMiddleware
+from app.common.redis_repository.idempotency_redis_repository import (
+    IdempotencyClaim,
+    IdempotencyRedisRepository,
+    IdempotentResponse,
+)
+
+
+class InMemoryIdempotencyRepository:
+    """Lua 스크립트와 같은 규칙으로 동작하는 테스트용 저장소"""
+
+    def __init__(self) -> None:
+        self.responses: dict[tuple[str, str], str] = {}
+        self.locks: dict[tuple[str, str], str] = {}
+
+    async def claim(self, path, key, token, lock_ttl_ms):
+        if (path, key) in self.responses:
+            return IdempotencyClaim(
+                acquired=False, response=IdempotentResponse.model_validate_json(self.responses[(path, key)])
+            )
+        if (path, key) not in self.locks:
+            self.locks[(path, key)] = token
+            return IdempotencyClaim(acquired=True)
+        return IdempotencyClaim(acquired=False)
+
+    async def complete(self, path, key, token, response, expire):
+        if response is not None:
+            self.responses[(path, key)] = response.model_dump_json()
+        if self.locks.get((path, key)) == token:
+            del self.locks[(path, key)]
+
+
+@pytest.fixture
+def repository():
+    return InMemoryIdempotencyRepository()
+
+
+@pytest.fixture
+def calls():
+    return []
+
+
+@pytest.fixture
+def client(repository, calls):
+    async def create(request: Request) -> JSONResponse:
+        body = await request.json()
+        calls.append(body)
+        return JSONResponse({"count": len(calls), **body}, status_code=201)
+
+    async def fail(request: Request) -> JSONResponse:
+        calls.append(await request.json())
+        return JSONResponse({"message": "error"}, status_code=500)
+
+    app = Starlette(
+        routes=[Route("/create", create, methods=["POST"]), Route("/fail", fail, methods=["POST"])],
+        middleware=[Middleware(IdempotencyMiddleware, paths=frozenset({"/create", "/fail"}), repository=repository)],
+    )
+    return TestClient(app)
+
+
+class TestIdempotencyMiddleware:
+    def test_retry_is_replayed_without_running_handler(self, client, calls):
+        # Given
+        headers = {"Idempotency-Key": "key-1"}
+        first = client.post("/create", json={"salary": 8000}, headers=headers)
+
+        # When
+        retry = client.post("/create", json={"salary": 8000}, headers=headers)
+
+        # Then - 핸들러는 한 번만 실행되고 같은 응답을 돌려준다
+        assert len(calls) == 1
+        assert (retry.status_code, retry.json()) == (first.status_code, first.json())
+        assert retry.headers["Idempotent-Replayed"] == "true"
+        assert "Idempotent-Replayed" not in first.headers
+
+    def test_without_key_runs_every_time(self, client, calls):
+        # When
+        client.post("/create", json={"salary": 8000})
+        client.post("/create", json={"salary": 8000})
+
+        # Then
+        assert len(calls) == 2
+
+    def test_same_key_different_body_rejected(self, client, calls):
+        # Given
+        headers = {"Idempotency-Key": "key-1"}
+        client.post("/create", json={"salary": 8000}, headers=headers)
+
+        # When
+        response = client.post("/create", json={"salary": 9000}, headers=headers)
+
+        # Then
+        assert response.status_code == 422
+        assert response.json()["error"]["type"] == "IdempotencyError"
+        assert len(calls) == 1
+
+    def test_server_error_not_stored(self, client, calls, repository):
+        # Given
+        headers = {"Idempotency-Key": "key-1"}
+        client.post("/fail", json={}, headers=headers)
+
+        # When - 5xx는 재시도하면 다시 처리한다
+        client.post("/fail", json={}, headers=headers)
+
+        # Then
+        assert len(calls) == 2
+        assert repository.locks == {}
+
+    def test_waits_for_in_flight_request(self, client, calls, repository):
+        # Given - 같은 키의 첫 요청이 처리 중 (잠금 보유)
+        repository.locks[("/create", "key-1")] = "other"
+
+        def finish_first_request():
+            # 첫 요청이 끝나 잠금이 풀린 상황
+            threading.Timer(0.1, lambda: repository.locks.clear()).start()
+
+        # When
+        finish_first_request()
+        response = client.post("/create", json={"salary": 8000}, headers={"Idempotency-Key": "key-1"})
+
+        # Then - 잠금이 풀린 뒤 처리된다
+        assert response.status_code == 201
+        assert len(calls) == 1
+
+    def test_redis_failure_bypasses(self, calls):
+        # Given
+        repository = AsyncMock(spec=IdempotencyRedisRepository)
+        repository.claim.side_effect = ConnectionError
+
+        async def create(request: Request) -> JSONResponse:
+            calls.append(await request.json())
+            return JSONResponse({}, status_code=201)
+
+        app = Starlette(
+            routes=[Route("/create", create, methods=["POST"])],
+            middleware=[Middleware(IdempotencyMiddleware, paths=frozenset({"/create"}), repository=repository)],
+        )
+
+        # When
+        response = TestClient(app).post("/create", json={"salary": 8000}, headers={"Idempotency-Key": "key-1"})
+
+        # Then - Redis 장애가 요청 실패로 이어지지 않는다
+        assert response.status_code == 201
+        assert len(calls) == 1
@@ -0,0 +1,110 @@
+from unittest.mock import patch
+
+import pytest
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.common.metrics.request_context import request_stats
+from app.common.middleware.logger import LoggingMiddleware
+
+
+async def ping(request: Request) -> PlainTextResponse:
+    return PlainTextResponse("pong", status_code=201)
+
+
+async def boom(request: Request) -> PlainTextResponse:
+    raise RuntimeError("boom")
+
+
+async def repeated_query(request: Request) -> PlainTextResponse:
+    # SQLAlchemy 훅 대신 같은 SQL 3회 실행을 기록
+    stats = request_stats.get()
+    assert stats is not None
+    for _ in range(3):
+        stats.record_query("SELECT * FROM user_salary WHERE id = %s", 2_000_000)
+    return PlainTextResponse("ok")
+
+
+@pytest.fixture
+def client():
+    app = Starlette(
+        routes=[Route("/ping", ping), Route("/health", ping), Route("/boom", boom), Route("/repeat", repeated_query)],
+        middleware=[Middleware(LoggingMiddleware)],
+    )
+    return TestClient(app, raise_server_exceptions=False)
+
+
+class TestLoggingMiddleware:
+    def test_keeps_given_request_id(self, client):
+        # When
+        response = client.get("/ping", headers={"X-Request-ID": "req-1"})
+
+        # Then
+        assert response.status_code == 201
+        assert response.headers["X-Request-ID"] == "req-1"
+
+    def test_generates_request_id(self, client):
+        # When
+        with patch("app.common.middleware.logger.middleware_logger") as mock_logger:
+            response = client.get("/ping")
+
+        # Then - 요청/응답 로그에 같은 id가 남는다
+        request_id = response.headers["X-Request-ID"]
+        assert len(request_id) == 36
+        request_log, response_log = mock_logger.info.call_args_list
+        assert request_log.args == ("id=%s method=%s path=%s", request_id, "GET", "/ping")
+        assert response_log.args[:3] == ("id=%s status=%s latency_ms=%d queries=%d db_ms=%.1f", request_id, 201)
+
+    def test_excluded_path_not_logged(self, client):
+        # When
+        with patch("app.common.middleware.logger.middleware_logger") as mock_logger:
+            response = client.get("/health")
+
+        # Then
+        assert "X-Request-ID" not in response.headers
+        mock_logger.info.assert_not_called()
+
+    def test_slow_request_warning(self, client):
+        # Given - 요청 시작 / 응답 헤더 전송 / 종료 시각
+        with (
+            patch("app.common.middleware.logger.perf_counter_ns", side_effect=[0, 900_000_000, 1_000_000_000]),
+            patch("app.common.middleware.logger.middleware_logger") as mock_logger,
+        ):
+            # When
+            client.get("/ping")
+
+        # Then - 구간별 시간도 함께 남긴다
+        mock_logger.warning.assert_called_once_with(
+            "SLOWREQUEST: latency_ms=%d method=%s path=%s %s",
+            1000,
+            "GET",
+            "/ping",
+            "pool_ms=0.0 db_ms=0.0 redis_ms=0.0 serialize_ms=0.0 handler_ms=1000.0",
+        )
+
+    def test_exception_logged_and_reraised(self, client):
+        # When
+        with patch("app.common.middleware.logger.middleware_logger") as mock_logger:
+            response = client.get("/boom")
+
+        # Then
+        assert response.status_code == 500
+        mock_logger.error.assert_called_once()
+
+    def test_db_time_in_server_timing_and_n_plus_one_warning(self, client):
+        # When
+        with patch("app.common.middleware.logger.middleware_logger") as mock_logger:
+            response = client.get("/repeat")
+
+        # Then
+        assert 'db;dur=6.0;desc="3 queries"' in response.headers["Server-Timing"].split(", ")
+        response_log = mock_logger.info.call_args_list[-1]
+        assert response_log.args[4:] == (3, 6.0)
+        mock_logger.warning.assert_called_once_with(
+            "N+1 의심: path=%s count=%d statement=%s", "/repeat", 3, "SELECT * FROM user_salary WHERE id = %s"
+        )
+        assert request_stats.get() is None
@@ -0,0 +1,153 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import mysql
+from sqlalchemy.exc import DBAPIError
+
+from app.common.repository.abstract_repository import BaseRepository, BulkWriteResult
+from app.module.asset.model import Job
+
+
+class JobTestRepository(BaseRepository):
+    async def save(self, instance, refresh=False):
+        return instance
+
+    async def get(self, id_):
+        return await self._get_by_id(Job, id_)
+
+
+def disconnect_error(invalidated: bool = True) -> DBAPIError:
+    return DBAPIError("SELECT 1", {}, Exception("Lost connection to MySQL server"), connection_invalidated=invalidated)
+
+
+@pytest.fixture
+def session():
+    session = AsyncMock()
+    session.in_transaction = MagicMock(return_value=False)
+    session.add = MagicMock()
+    return session
+
+
+class TestStaleConnectionRetry:
+    async def test_retries_once_on_first_use(self, session):
+        # Given - 풀에서 꺼낸 커넥션이 이미 끊겨 있음
+        result = MagicMock()
+        session.execute.side_effect = [disconnect_error(), result]
+        repository = JobTestRepository(session)
+
+        # When
+        actual = await repository.execute_read(select(Job))
+
+        # Then
+        assert actual is result
+        assert session.execute.await_count == 2
+        session.rollback.assert_awaited_once()
+
+    async def test_no_retry_inside_transaction(self, session):
+        # Given - 같은 트랜잭션에서 이미 실행한 문장이 있음
+        session.in_transaction.return_value = True
+        session.execute.side_effect = disconnect_error()
+        repository = JobTestRepository(session)
+
+        # When & Then
+        with pytest.raises(DBAPIError):
+            await repository.execute_read(select(Job))
+        assert session.execute.await_count == 1
+
+    async def test_no_retry_on_other_errors(self, session):
+        # Given
+        session.execute.side_effect = disconnect_error(invalidated=False)
+        repository = JobTestRepository(session)
+
+        # When & Then
+        with pytest.raises(DBAPIError):
+            await repository.get(1)
+        assert session.execute.await_count == 1
+        session.rollback.assert_not_awaited()
+
+
+class TestUnitOfWork:
+    async def test_commits_once_on_success(self, session):
+        # Given
+        repository = JobTestRepository(session)
+
+        # When
+        async with repository.unit_of_work():
+            repository.stage(Job(group_id=1, name="백엔드"))
+            await repository.stage_and_flush(Job(group_id=1, name="프론트엔드"))
+
+        # Then
+        assert session.add.call_count == 2
+        session.flush.assert_awaited_once()
+        session.commit.assert_awaited_once()
+        session.rollback.assert_not_awaited()
+
+    async def test_rolls_back_on_error(self, session):
+        # Given
+        repository = JobTestRepository(session)
+
+        # When & Then
+        with pytest.raises(ValueError):
+            async with repository.unit_of_work():
+                repository.stage(Job(group_id=1, name="백엔드"))
+                raise ValueError
+
+        session.commit.assert_not_awaited()
+        session.rollback.assert_awaited_once()
+
+
+class TestBulkWrite:
+    async def test_save_many_in_batches(self, session):
+        # Given - 5개를 2개씩 나누면 3번의 INSERT
+        session.execute.side_effect = [MagicMock(rowcount=2), MagicMock(rowcount=2), MagicMock(rowcount=1)]
+        repository = JobTestRepository(session)
+        jobs = [Job(group_id=1, name=f"직무{i}") for i in range(5)]
+
+        # When
+        result = await repository.save_many(Job, jobs, batch_size=2)
+
+        # Then - 배치마다 한 문장, 한 번의 커밋
+        assert result == BulkWriteResult(inserted=5, updated=0, batches=3)
+        assert session.execute.await_count == 3
+        assert session.commit.await_count == 3
+
+    async def test_upsert_many_counts_inserted_and_updated(self, session):
+        # Given - 3행 중 1행이 기존 행 갱신 (affected rows = 1 + 1 + 2)
+        session.execute.return_value = MagicMock(rowcount=4)
+        repository = JobTestRepository(session)
+        rows = [{"group_id": 1, "name": "백엔드"}, {"group_id": 1, "name": "프론트엔드"}, Job(group_id=2, name="PM")]
+
+        # When
+        result = await repository.upsert_many(Job, rows, ("updated_at",))
+
+        # Then
+        assert result == BulkWriteResult(inserted=2, updated=1, batches=1)
+        stmt = session.execute.await_args[0][0]
+        assert "ON DUPLICATE KEY UPDATE" in str(stmt.compile(dialect=mysql.dialect()))
+
+    async def test_upsert_many_with_version_column_skips_older_rows(self, session):
+        # Given
+        session.execute.return_value = MagicMock(rowcount=1)
+        repository = JobTestRepository(session)
+
+        # When
+        await repository.upsert_many(
+            Job, [{"group_id": 1, "name": "백엔드"}], ("group_id", "updated_at"), version_column="updated_at"
+        )
+
+        # Then - 새 값이 같거나 최신일 때만 갱신하고, 비교 컬럼은 마지막에 대입한다
+        sql = str(session.execute.await_args[0][0].compile(dialect=mysql.dialect()))
+        updates = sql.split("ON DUPLICATE KEY UPDATE")[1]
+        assert "group_id = if(VALUES(updated_at) >= job.updated_at, VALUES(group_id), job.group_id)" in updates
+        assert updates.strip().endswith("updated_at = greatest(VALUES(updated_at), job.updated_at)")
+
+    def test_rows_share_all_columns(self):
+        # When - 딕셔너리와 모델이 섞여 있어도 모든 행이 같은 컬럼을 가진다
+        chunks = list(BaseRepository._chunk_rows(Job, [{"group_id": 1, "name": "백엔드"}, Job(name="PM")], 10))
+
+        # Then
+        assert len(chunks) == 1
+        first, second = chunks[0]
+        assert first.keys() == second.keys()
+        assert second["group_id"] is None
@@ -0,0 +1,41 @@
+import json
+
+from app.api.asset.v1.schemas.asset_schema import JobItem, JobResponseData, JobSuccessResponse
+from app.common.response import CustomJSONResponse, camel_key
+
+
+class TestCustomJSONResponse:
+    def test_dict_keys_converted_to_camel_case(self):
+        # Given
+        content = {"user_salary": 5000, "items": [{"job_id": 1, "name": "백엔드"}], 1: "non-str key"}
+
+        # When
+        body = json.loads(CustomJSONResponse(content).body)
+
+        # Then
+        assert body == {"userSalary": 5000, "items": [{"jobId": 1, "name": "백엔드"}], "1": "non-str key"}
+
+    def test_model_serialized_by_alias(self):
+        # Given
+        response = JobSuccessResponse(data=JobResponseData(items=[JobItem(id=1, name="백엔드")]))
+
+        # When
+        body = json.loads(CustomJSONResponse(response).body)
+
+        # Then - 모델 직렬화와 dict 경로의 결과가 같다
+        assert body == json.loads(CustomJSONResponse(response.model_dump(mode="json")).body)
+        assert body["data"]["items"] == [{"id": 1, "name": "백엔드"}]
+
+    def test_nested_model_in_dict(self):
+        # Given
+        content = {"job_list": [JobItem(id=2, name="프론트엔드")]}
+
+        # When
+        body = json.loads(CustomJSONResponse(content).body)
+
+        # Then
+        assert body == {"jobList": [{"id": 2, "name": "프론트엔드"}]}
+
+    def test_camel_key_keeps_camel_case(self):
+        assert camel_key("userExperience") == "userExperience"
+        assert camel_key("user_experience") == "userExperience"
@@ -0,0 +1,34 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.module.asset.repositories.salary_histogram_redis_repository import SalaryHistogramRedisRepository
+
+
+@pytest.fixture
+def redis():
+    redis = MagicMock()
+    redis.pipeline.return_value = MagicMock(execute=AsyncMock())
+    return redis
+
+
+class TestReplaceAll:
+    @pytest.mark.asyncio
+    async def test_stale_keys_removed(self, redis):
+        # Given - 이전 집계에만 있던 (9, 9) 키와 중단된 재구축의 임시 키
+        async def scan_iter(match):
+            for key in ["salary_hist:1:0", "salary_hist:9:9", "salary_hist:1:0:rebuild"]:
+                yield key
+
+        redis.scan_iter = scan_iter
+        repository = SalaryHistogramRedisRepository(redis)
+
+        # When
+        await repository.replace_all({(1, 0): {30: 5}})
+
+        # Then - 새 집계의 키는 RENAME으로 교체하고, 없어진 키만 지운다
+        pipe = redis.pipeline.return_value
+        pipe.rename.assert_called_once_with("salary_hist:1:0:rebuild", "salary_hist:1:0")
+        pipe.delete.assert_any_call("salary_hist:9:9")
+        assert all(call.args != ("salary_hist:1:0",) for call in pipe.delete.call_args_list)
+        pipe.execute.assert_awaited_once()
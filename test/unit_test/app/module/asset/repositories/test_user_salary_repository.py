@@ -0,0 +1,38 @@
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import mysql
+
+from app.module.asset.model import UserSalary
+from app.module.asset.repositories.user_salary_repository import UserSalaryRepository
+
+
+@pytest.fixture
+def session():
+    session = AsyncMock()
+    session.execute.return_value = MagicMock(rowcount=2)
+    return session
+
+
+def compiled(call) -> str:
+    return str(call.args[0].compile(dialect=mysql.dialect()))
+
+
+class TestSalaryUpsertVersion:
+    async def test_upsert_and_submissions_share_versioned_updates(self, session):
+        # Given
+        repository = UserSalaryRepository(session)
+        salary = UserSalary(id=uuid.uuid4().bytes, user_id=1, job_id=1, experience=3, salary=50_000_000, version=9)
+
+        # When - 바로 저장(버퍼 꺼짐)과 쓰기 버퍼 반영
+        await repository.upsert(salary)
+        await repository.upsert_submissions([salary])
+
+        # Then - 두 경로 모두 user_id는 그대로 두고, 제출 순번이 작지 않을 때만 갱신
+        direct_sql, buffered_sql = [compiled(call) for call in session.execute.await_args_list]
+        for sql in (direct_sql, buffered_sql):
+            updates = sql.split("ON DUPLICATE KEY UPDATE")[1]
+            assert "user_id" not in updates
+            assert "salary = if(VALUES(version) >= user_salary.version, VALUES(salary), user_salary.salary)" in updates
+            assert updates.strip().endswith("version = greatest(VALUES(version), user_salary.version)")
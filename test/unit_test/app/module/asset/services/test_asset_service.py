@@ -1,136 +1,165 @@
+import json
 import uuid
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from sqlalchemy.exc import IntegrityError
 
-from app.api.asset.v1.constant import SALARY_THOUSAND_WON
-from app.api.asset.v1.schemas.asset_schema import UserProfilePostRequest, UserSalaryPostRequest
+from app.api.asset.v1.constant import EXPIRE_JOB_REDIS_SEC, JOB_ETAG_REDIS_KEY, JOB_REDIS_KEY, SALARY_THOUSAND_WON
+from app.api.asset.v1.schemas.asset_schema import UserCarRankData, UserProfilePostRequest, UserSalaryPostRequest
+from app.common.redis_repository.general_redis_repository import IntRedisRepository
+from app.module.asset.caches.job_catalog_snapshot import JobCatalogSnapshot
 from app.module.asset.enums import CarRank
-from app.module.asset.errors.asset_error import NoMatchJobSalary, NoMatchUserSalary
-from app.module.asset.model import SalaryStat, UserProfile, UserSalary
+from app.module.asset.errors.asset_error import (
+    NoMatchJobSalary,
+    NoMatchUserProfile,
+    NoMatchUserSalary,
+    NoUserProfileSaveRate,
+)
+from app.module.asset.model import Job, SalaryStat, UserProfile, UserSalary
+from app.module.asset.repositories.salary_write_buffer_redis_repository import SalarySubmitResult
+from main_config import settings
 
 # Fixtures imported via pytest plugin system
 pytest_plugins = ["test.unit_test.fixtures.asset_mock_fixture"]
 
 
-class TestGetJobSalary:
+class TestGetJobCatalog:
     @pytest.mark.asyncio
-    async def test_get_job_salary_success(self, asset_service, mock_salary_stat_repo):
-        # Given
-        job_id = 1
-        experience = 3
-        salary_stat = SalaryStat(job_id=job_id, experience=experience, avg=70000000)
-        mock_salary_stat_repo.get_by_job_id_experience.return_value = salary_stat
+    async def test_etag_matches_worker_snapshot(
+        self, asset_service, mock_job_repo, mock_job_cache_repo, job_catalog_holder
+    ):
+        # Given - 워커에 보관된 스냅샷과 Redis etag가 같음
+        snapshot = JobCatalogSnapshot.from_jobs([Job(id=1, group_id=1, name="개발 전체")])
+        job_catalog_holder.set(snapshot)
+        mock_job_cache_repo.get.return_value = snapshot.etag
 
         # When
-        result = await asset_service.get_job_salary(job_id, experience)
+        result = await asset_service.get_job_catalog()
+
+        # Then - etag만 조회하고 본문과 DB는 건드리지 않음
+        assert result is snapshot
+        mock_job_cache_repo.get.assert_called_once_with(JOB_ETAG_REDIS_KEY)
+        mock_job_repo.gets.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_body_loaded_from_redis(self, asset_service, mock_job_repo, mock_job_cache_repo, job_catalog_holder):
+        # Given - 다른 워커가 만든 스냅샷이 Redis에 있음
+        snapshot = JobCatalogSnapshot.from_jobs([Job(id=1, group_id=1, name="개발 전체")])
+        mock_job_cache_repo.get.side_effect = [snapshot.etag, snapshot.body.decode()]
+
+        # When
+        result = await asset_service.get_job_catalog()
 
         # Then
-        assert result == salary_stat
-        mock_salary_stat_repo.get_by_job_id_experience.assert_called_once_with(job_id, experience)
+        assert result == snapshot
+        assert job_catalog_holder.get(snapshot.etag) == snapshot
+        mock_job_repo.gets.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_cache_miss_builds_snapshot(self, asset_service, mock_job_repo, mock_job_cache_repo):
+        # Given
+        mock_job_cache_repo.get.return_value = None
+        mock_job_repo.gets.return_value = [Job(id=1, group_id=1, name="개발 전체"), Job(id=2, group_id=1, name="서버")]
+
+        # When
+        result = await asset_service.get_job_catalog()
+
+        # Then - camelCase 응답 본문과 etag를 TTL과 함께 저장
+        assert json.loads(result.body) == {
+            "code": 200,
+            "data": {"items": [{"id": 1, "name": "개발 전체"}, {"id": 2, "name": "서버"}]},
+            "message": "요청이 성공적으로 처리되었습니다.",
+            "success": True,
+        }
+        assert result.etag == JobCatalogSnapshot.make_etag(result.body)
+        mock_job_cache_repo.set.assert_any_call(JOB_REDIS_KEY, result.body.decode(), EXPIRE_JOB_REDIS_SEC)
+        mock_job_cache_repo.set.assert_any_call(JOB_ETAG_REDIS_KEY, result.etag, EXPIRE_JOB_REDIS_SEC)
 
-class TestGetUserCar:
     @pytest.mark.asyncio
-    async def test_car_rank_calculation(self, asset_service, mock_user_salary_repo):
+    async def test_invalidate_job_cache(self, asset_service, mock_job_cache_repo, job_catalog_holder):
         # Given
-        user_profile_id = uuid.uuid4()
-        save_rate = 50
-        user_salary = UserSalary(
-            id=user_profile_id.bytes,
-            user_id=1,
-            job_id=1,
-            experience=3,
-            salary=60000000,
-        )
-        mock_user_salary_repo.get_by_uuid.return_value = user_salary
+        snapshot = JobCatalogSnapshot.from_jobs([])
+        job_catalog_holder.set(snapshot)
 
         # When
-        with patch.object(CarRank, "get_car_rank", return_value="중형차") as mock_get_car_rank:
-            result = await asset_service.get_user_car(user_profile_id, save_rate)
+        await asset_service.invalidate_job_cache()
 
         # Then
-        assert result == "중형차"
-        expected_asset = int(60000000 * 0.5 * 5 * 0.3)  # 45000000
-        mock_get_car_rank.assert_called_once_with(expected_asset)
+        mock_job_cache_repo.delete.assert_called_once_with(JOB_ETAG_REDIS_KEY, JOB_REDIS_KEY)
+        assert job_catalog_holder.get(snapshot.etag) is None
 
-    @pytest.mark.asyncio
-    async def test_no_user_salary_raises_error(self, asset_service, mock_user_salary_repo):
+    def test_snapshot_matches_if_none_match(self):
         # Given
-        user_profile_id = uuid.uuid4()
-        mock_user_salary_repo.get_by_uuid.return_value = None
+        snapshot = JobCatalogSnapshot.from_jobs([])
 
-        # When & Then
-        with pytest.raises(NoMatchUserSalary):
-            await asset_service.get_user_car(user_profile_id, 50)
+        # Then
+        assert snapshot.matches(snapshot.etag)
+        assert snapshot.matches(f'"other", W/{snapshot.etag}')
+        assert snapshot.matches("*")
+        assert not snapshot.matches('"other"')
+        assert not snapshot.matches(None)
 
 
-class TestGetUserPercentage:
+class TestGetJobSalary:
     @pytest.mark.asyncio
-    async def test_percentage_calculation(self, asset_service, mock_user_salary_repo, mock_salary_stat_repo):
-        # Given
-        user_profile_id = uuid.uuid4()
-        save_rate = 30
-        user_salary = UserSalary(
-            id=user_profile_id.bytes,
-            user_id=1,
-            job_id=1,
-            experience=3,
-            salary=50000000,
-        )
-        job_salary = SalaryStat(job_id=1, experience=3, avg=60000000)
-
-        mock_user_salary_repo.get_by_uuid.return_value = user_salary
-        mock_salary_stat_repo.get_by_job_id_experience.return_value = job_salary
+    async def test_get_job_salary_before_table_loaded(self, asset_service, mock_salary_stat_repo):
+        # Given - 메모리 테이블 적재 전에는 DB로 조회
+        job_id = 1
+        experience = 3
+        salary_stat = SalaryStat(job_id=job_id, experience=experience, avg=70000000)
+        mock_salary_stat_repo.get_by_job_id_experience.return_value = salary_stat
 
         # When
-        result = await asset_service.get_user_percentage(user_profile_id, save_rate)
+        result = await asset_service.get_job_salary(job_id, experience)
 
         # Then
-        user_asset = int(50000000 * 0.3)  # 15000000
-        expected_percentage = 100 - int((user_asset / 60000000) * 100)  # 100 - 25 = 75
-        assert result == expected_percentage
+        assert result == 70000000
+        mock_salary_stat_repo.get_by_job_id_experience.assert_called_once_with(job_id, experience)
 
     @pytest.mark.asyncio
-    async def test_percentage_bounds(self, asset_service, mock_user_salary_repo, mock_salary_stat_repo):
-        # Given - 매우 높은 저축률로 상위 퍼센트를 초과하는 경우
-        user_profile_id = uuid.uuid4()
-        save_rate = 200  # 200% 저축률 (불가능하지만 테스트용)
-        user_salary = UserSalary(
-            id=user_profile_id.bytes,
-            user_id=1,
-            job_id=1,
-            experience=3,
-            salary=100000000,
-        )
-        job_salary = SalaryStat(job_id=1, experience=3, avg=50000000)
-
-        mock_user_salary_repo.get_by_uuid.return_value = user_salary
-        mock_salary_stat_repo.get_by_job_id_experience.return_value = job_salary
+    async def test_get_job_salary_from_loaded_table(self, asset_service, mock_salary_stat_repo, salary_stat_table):
+        # Given
+        salary_stat_table.load([SalaryStat(job_id=3, experience=10, avg=90000000)], version=1)
 
         # When
-        result = await asset_service.get_user_percentage(user_profile_id, save_rate)
+        hit = await asset_service.get_job_salary(3, 10)
+        miss = await asset_service.get_job_salary(4, 0)
+
+        # Then - DB를 조회하지 않고 적중/미스 횟수를 집계
+        assert hit == 90000000
+        assert miss is None
+        mock_salary_stat_repo.get_by_job_id_experience.assert_not_called()
+        assert salary_stat_table.stats() == {"loaded": True, "version": 1, "rows": 1, "hits": 1, "misses": 1}
 
-        # Then - 0과 100 사이로 제한됨
-        assert result == 0  # max(0, min(percentage, 100))
 
+class TestSalaryStatTable:
     @pytest.mark.asyncio
-    async def test_no_job_salary_raises_error(self, asset_service, mock_user_salary_repo, mock_salary_stat_repo):
+    async def test_refresh_only_when_version_changes(self, salary_stat_table, mock_salary_stat_repo):
         # Given
-        user_profile_id = uuid.uuid4()
-        user_salary = UserSalary(
-            id=user_profile_id.bytes,
-            user_id=1,
-            job_id=1,
-            experience=3,
-            salary=50000000,
-        )
-        mock_user_salary_repo.get_by_uuid.return_value = user_salary
-        mock_salary_stat_repo.get_by_job_id_experience.return_value = None
+        version_repo = AsyncMock(spec=IntRedisRepository)
+        version_repo.get.return_value = 2
+        mock_salary_stat_repo.gets.return_value = [SalaryStat(job_id=1, experience=0, avg=30000000)]
 
-        # When & Then
-        with pytest.raises(NoMatchJobSalary):
-            await asset_service.get_user_percentage(user_profile_id, 30)
+        # When
+        first = await salary_stat_table.refresh(mock_salary_stat_repo, version_repo)
+        second = await salary_stat_table.refresh(mock_salary_stat_repo, version_repo)
+
+        # Then - 같은 버전이면 다시 적재하지 않음
+        assert first is True
+        assert second is False
+        mock_salary_stat_repo.gets.assert_called_once()
+        assert salary_stat_table.get_avg(1, 0) == 30000000
+
+    def test_out_of_range_lookup_is_miss(self, salary_stat_table):
+        # Given
+        salary_stat_table.load([SalaryStat(job_id=1, experience=0, avg=30000000)], version=0)
+
+        # Then
+        assert salary_stat_table.get_avg(1, 11) is None
+        assert salary_stat_table.get_avg(-1, 0) is None
+        assert salary_stat_table.get_avg(100, 0) is None
 
 
 class TestGetUserProfile:
@@ -155,6 +184,100 @@ class TestGetUserProfile:
         mock_user_profile_repo.get_by_salary_id.assert_called_once_with(unique_id.bytes)
 
 
+class TestGetSharedCarRank:
+    @pytest.mark.asyncio
+    async def test_stored_car_rank_returned_without_calculation(
+        self, asset_service, mock_user_profile_repo, mock_user_salary_repo, mock_percentile_service
+    ):
+        # Given - 프로필 저장 시 함께 저장된 값
+        unique_id = uuid.uuid4()
+        mock_user_profile_repo.get_car_rank_by_salary_id.return_value = SimpleNamespace(
+            save_rate=30, car_rank="benz", percentage=25
+        )
+
+        # When
+        result = await asset_service.get_shared_car_rank(unique_id)
+
+        # Then - 조회 한 번으로 반환하고 계산/다른 조회는 하지 않음
+        assert result == UserCarRankData(car="benz", percentage=25)
+        mock_user_profile_repo.get_car_rank_by_salary_id.assert_called_once_with(unique_id.bytes)
+        mock_user_profile_repo.get_car_rank_row.assert_not_called()
+        mock_user_salary_repo.get_by_uuid.assert_not_called()
+        mock_percentile_service.get_top_percentage.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_db(self, asset_service, mock_user_profile_repo, mock_car_rank_cache_repo):
+        # Given - 프로필 저장 시 미리 채운 캐시
+        unique_id = uuid.uuid4()
+        mock_car_rank_cache_repo.get_car_rank.return_value = (UserCarRankData(car="benz", percentage=25), 3)
+
+        # When
+        result = await asset_service.get_shared_car_rank(unique_id)
+
+        # Then
+        assert result == UserCarRankData(car="benz", percentage=25)
+        mock_user_profile_repo.get_car_rank_by_salary_id.assert_not_called()
+        mock_car_rank_cache_repo.set_car_rank.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cache_miss_fills_with_read_version(
+        self, asset_service, mock_user_profile_repo, mock_car_rank_cache_repo
+    ):
+        # Given - 캐시가 없고 조회 시점의 캐시 버전은 3
+        unique_id = uuid.uuid4()
+        mock_car_rank_cache_repo.get_car_rank.return_value = (None, 3)
+        mock_user_profile_repo.get_car_rank_by_salary_id.return_value = SimpleNamespace(
+            save_rate=30, car_rank="benz", percentage=25
+        )
+
+        # When
+        await asset_service.get_shared_car_rank(unique_id)
+
+        # Then - 읽은 버전으로 채워서 그 사이 재계산이 있었다면 다음 조회에서 버려진다
+        mock_car_rank_cache_repo.set_car_rank.assert_awaited_once_with(
+            unique_id, 3, UserCarRankData(car="benz", percentage=25)
+        )
+
+    @pytest.mark.asyncio
+    async def test_missing_values_are_calculated_without_writing(self, asset_service, mock_user_profile_repo):
+        # Given - 컬럼 추가 후 아직 재계산되지 않은 프로필
+        unique_id = uuid.uuid4()
+        mock_user_profile_repo.get_car_rank_by_salary_id.return_value = SimpleNamespace(
+            save_rate=30, car_rank=None, percentage=None
+        )
+        mock_user_profile_repo.get_car_rank_row.return_value = SimpleNamespace(
+            id=7, save_rate=30, job_id=1, experience=3, salary=50000000, avg=60000000
+        )
+
+        # When
+        result = await asset_service.get_shared_car_rank(unique_id)
+
+        # Then - JOIN 행 하나로 계산해 반환하고 DB에는 쓰지 않는다
+        expected_car = CarRank.get_car_rank(int(50000000 * 0.3 * 5 * 0.3))
+        assert result == UserCarRankData(car=expected_car, percentage=75)
+        mock_user_profile_repo.update_car_ranks.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_no_profile_raises_error(self, asset_service, mock_user_profile_repo):
+        # Given
+        mock_user_profile_repo.get_car_rank_by_salary_id.return_value = None
+
+        # When & Then
+        with pytest.raises(NoMatchUserProfile):
+            await asset_service.get_shared_car_rank(uuid.uuid4())
+
+    @pytest.mark.asyncio
+    async def test_no_save_rate_raises_error(self, asset_service, mock_user_profile_repo):
+        # Given
+        mock_user_profile_repo.get_car_rank_by_salary_id.return_value = SimpleNamespace(
+            save_rate=None, car_rank=None, percentage=None
+        )
+
+        # When & Then
+        with pytest.raises(NoUserProfileSaveRate):
+            await asset_service.get_shared_car_rank(uuid.uuid4())
+
+
 class TestSaveUserSalary:
     @pytest.mark.asyncio
     async def test_save_user_salary_success(self, asset_service, mock_user_salary_repo):
@@ -179,6 +302,85 @@ class TestSaveUserSalary:
         assert saved_salary.job_id == 2
         assert saved_salary.experience == 5
 
+    @pytest.mark.asyncio
+    async def test_save_user_salary_uses_issued_version(
+        self, asset_service, mock_user_salary_repo, mock_salary_write_buffer_repo
+    ):
+        # Given - 버퍼가 꺼져 있어도 제출 순번은 Redis에서 발급
+        request = UserSalaryPostRequest(unique_id=uuid.uuid4(), job_id=2, experience=5, salary=8000)
+        mock_salary_write_buffer_repo.submit.side_effect = None
+        mock_salary_write_buffer_repo.submit.return_value = SalarySubmitResult(version=42, enqueued=False)
+        mock_user_salary_repo.upsert.return_value = MagicMock()
+
+        # When
+        await asset_service.save_user_salary(request)
+
+        # Then - 적재하지 않고(max_backlog=0) 발급받은 순번으로 저장
+        assert mock_salary_write_buffer_repo.submit.call_args[0][1] == 0
+        assert mock_user_salary_repo.upsert.call_args[0][0].version == 42
+
+    @pytest.mark.asyncio
+    async def test_resubmission_refreshes_stored_car_rank(
+        self, asset_service, mock_user_salary_repo, mock_user_profile_repo, mock_percentile_service
+    ):
+        # Given - 이미 프로필이 있는 uuid가 연봉을 다시 제출 (버퍼 꺼짐)
+        unique_id = uuid.uuid4()
+        mock_user_salary_repo.upsert.return_value = MagicMock()
+        mock_user_profile_repo.get_car_rank_rows_by_salary_ids.return_value = [
+            SimpleNamespace(id=7, save_rate=30, job_id=2, experience=5, salary=80000000, avg=60000000)
+        ]
+
+        # When
+        await asset_service.save_user_salary(
+            UserSalaryPostRequest(unique_id=unique_id, job_id=2, experience=5, salary=8000)
+        )
+
+        # Then - 히스토그램 반영 뒤 새 연봉 기준 등급/퍼센트를 저장해 공유 링크가 옛 값을 보여주지 않는다
+        mock_percentile_service.record_submission.assert_called_once()
+        mock_user_profile_repo.get_car_rank_rows_by_salary_ids.assert_called_once_with([unique_id.bytes])
+        values = mock_user_profile_repo.update_car_ranks.call_args.args[0]
+        assert values == [{"id": 7, "car_rank": CarRank.get_car_rank(int(80000000 * 0.3 * 5 * 0.3)), "percentage": 60}]
+
+    @pytest.mark.asyncio
+    async def test_save_user_salary_records_histogram(
+        self, asset_service, mock_user_salary_repo, mock_percentile_service
+    ):
+        # Given
+        request = UserSalaryPostRequest(unique_id=uuid.uuid4(), job_id=2, experience=5, salary=8000)
+        mock_user_salary_repo.upsert.return_value = MagicMock()
+
+        # When
+        await asset_service.save_user_salary(request)
+
+        # Then - 처음 제출이므로 이전 값 없이 히스토그램 반영
+        current, previous = mock_percentile_service.record_submission.call_args[0]
+        assert (current.job_id, current.experience, current.salary) == (2, 5, 8000 * SALARY_THOUSAND_WON)
+        assert previous is None
+
+    @pytest.mark.asyncio
+    async def test_resubmission_passes_previous_salary_to_histogram(
+        self, asset_service, mock_user_salary_repo, mock_salary_write_buffer_repo, mock_percentile_service
+    ):
+        # Given - 같은 uuid로 이미 제출한 연봉 (Redis에 남아 있는 직전 제출)
+        unique_id = uuid.uuid4()
+        previous = UserSalary(id=unique_id.bytes, job_id=2, experience=5, salary=70000000)
+        mock_salary_write_buffer_repo.submit.side_effect = None
+        mock_salary_write_buffer_repo.submit.return_value = SalarySubmitResult(
+            version=2, enqueued=False, previous=previous
+        )
+        mock_user_salary_repo.upsert.return_value = MagicMock()
+
+        # When
+        await asset_service.save_user_salary(
+            UserSalaryPostRequest(unique_id=unique_id, job_id=2, experience=5, salary=8000)
+        )
+
+        # Then - 이전 제출 구간을 빼고 새 구간에 더하도록 이전 값을 함께 넘긴다 (MySQL 조회 없음)
+        current, passed_previous = mock_percentile_service.record_submission.call_args[0]
+        assert current.salary == 8000 * SALARY_THOUSAND_WON
+        assert passed_previous is previous
+        mock_user_salary_repo.get_by_uuid.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_save_user_salary_duplicate_id_updates(self, asset_service, mock_user_salary_repo):
         # Given - 동일한 ID로 두 번 요청하는 경우
@@ -225,41 +427,71 @@ class TestSaveUserSalary:
 
 class TestSaveUserProfile:
     @pytest.mark.asyncio
-    async def test_save_user_profile_success(self, asset_service, mock_user_profile_repo, mock_user_salary_repo):
+    async def test_save_user_profile_success(
+        self,
+        asset_service,
+        mock_user_profile_repo,
+        mock_user_salary_repo,
+        mock_salary_stat_repo,
+        mock_car_rank_cache_repo,
+    ):
         # Given
         unique_id = uuid.uuid4()
         request = UserProfilePostRequest(
             unique_id=unique_id,
             age=28,
-            save_rate=45,
+            save_rate=30,
             has_car=False,
             is_monthly_rent=True,
         )
-
-        # UserSalary가 이미 존재한다고 가정
         mock_user_salary_repo.get_by_uuid.return_value = UserSalary(
             id=unique_id.bytes, user_id=1, job_id=1, experience=3, salary=50000000
         )
-        mock_user_profile_repo.upsert.return_value = MagicMock(salary_id=unique_id.bytes)
+        mock_salary_stat_repo.get_by_job_id_experience.return_value = SalaryStat(job_id=1, experience=3, avg=60000000)
 
         # When
         result = await asset_service.save_user_profile(request)
 
-        # Then
-        assert result is True
+        # Then - 계산한 등급/퍼센트를 프로필과 같은 upsert로 저장하고 반환
+        expected_car = CarRank.get_car_rank(int(50000000 * 0.3 * 5 * 0.3))
+        assert result == UserCarRankData(car=expected_car, percentage=75)
         saved_profile = mock_user_profile_repo.upsert.call_args[0][0]
         assert saved_profile.salary_id == unique_id.bytes
         assert saved_profile.age == 28
-        assert saved_profile.save_rate == 45
+        assert saved_profile.save_rate == 30
         assert saved_profile.has_car is False
         assert saved_profile.is_monthly_rent is True
+        assert saved_profile.car_rank == expected_car
+        assert saved_profile.percentage == 75
+        mock_car_rank_cache_repo.warm_car_rank.assert_awaited_once_with(unique_id, result)
 
     @pytest.mark.asyncio
-    async def test_save_user_profile_no_salary_raises_error(self, asset_service, mock_user_salary_repo):
-        # Given - UserSalary가 존재하지 않는 경우
+    async def test_percentage_from_histogram(
+        self, asset_service, mock_user_profile_repo, mock_user_salary_repo, mock_percentile_service
+    ):
+        # Given - 히스토그램 표본이 충분한 경우
         unique_id = uuid.uuid4()
+        request = UserProfilePostRequest(unique_id=unique_id, age=28, save_rate=30, has_car=False, is_monthly_rent=True)
+        mock_user_salary_repo.get_by_uuid.return_value = UserSalary(
+            id=unique_id.bytes, user_id=1, job_id=1, experience=3, salary=50000000
+        )
+        mock_percentile_service.get_top_percentage.return_value = 12
+
+        # When
+        result = await asset_service.save_user_profile(request)
+
+        # Then
+        assert result.percentage == 12
+        assert mock_user_profile_repo.upsert.call_args[0][0].percentage == 12
+        mock_percentile_service.get_top_percentage.assert_called_once_with(1, 3, 50000000)
+
+    @pytest.mark.asyncio
+    async def test_save_user_profile_no_salary_raises_error(
+        self, asset_service, mock_user_profile_repo, mock_user_salary_repo
+    ):
+        # Given - UserSalary가 존재하지 않는 경우
         request = UserProfilePostRequest(
-            unique_id=unique_id,
+            unique_id=uuid.uuid4(),
             age=28,
             save_rate=45,
             has_car=False,
@@ -270,56 +502,148 @@ class TestSaveUserProfile:
         # When & Then
         with pytest.raises(NoMatchUserSalary):
             await asset_service.save_user_profile(request)
+        mock_user_profile_repo.upsert.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_save_user_profile_duplicate_id_updates(
-        self, asset_service, mock_user_profile_repo, mock_user_salary_repo
+    async def test_no_job_salary_raises_error(
+        self, asset_service, mock_user_profile_repo, mock_user_salary_repo, mock_salary_stat_repo
     ):
-        # Given - 동일한 salary_id로 두 번 요청하는 경우
+        # Given - 히스토그램 표본도, 평균 연봉 통계도 없는 경우
         unique_id = uuid.uuid4()
+        request = UserProfilePostRequest(unique_id=unique_id, age=28, save_rate=45, has_car=False, is_monthly_rent=True)
+        mock_user_salary_repo.get_by_uuid.return_value = UserSalary(
+            id=unique_id.bytes, user_id=1, job_id=1, experience=3, salary=50000000
+        )
+        mock_salary_stat_repo.get_by_job_id_experience.return_value = None
+
+        # When & Then
+        with pytest.raises(NoMatchJobSalary):
+            await asset_service.save_user_profile(request)
+        mock_user_profile_repo.upsert.assert_not_called()
 
-        # UserSalary가 이미 존재한다고 가정
+    @pytest.mark.asyncio
+    async def test_salary_deleted_before_upsert_raises_error(
+        self, asset_service, mock_user_profile_repo, mock_user_salary_repo, mock_salary_stat_repo
+    ):
+        # Given - 조회 후 저장 사이에 연봉 기록이 지워져 salary_id FK 위반
+        unique_id = uuid.uuid4()
+        request = UserProfilePostRequest(unique_id=unique_id, age=28, save_rate=45, has_car=False, is_monthly_rent=True)
         mock_user_salary_repo.get_by_uuid.return_value = UserSalary(
             id=unique_id.bytes, user_id=1, job_id=1, experience=3, salary=50000000
         )
+        mock_salary_stat_repo.get_by_job_id_experience.return_value = SalaryStat(job_id=1, experience=3, avg=60000000)
+        mock_user_profile_repo.upsert.side_effect = IntegrityError(
+            "INSERT INTO user_profile ...", {}, Exception(1452, "Cannot add or update a child row")
+        )
 
-        # 첫 번째 요청
-        first_request = UserProfilePostRequest(
-            unique_id=unique_id,
-            age=25,
-            save_rate=30,
-            has_car=False,
-            is_monthly_rent=True,
+        # When & Then
+        with pytest.raises(NoMatchUserSalary):
+            await asset_service.save_user_profile(request)
+
+    @pytest.mark.asyncio
+    async def test_save_user_profile_other_integrity_error_propagates(
+        self, asset_service, mock_user_profile_repo, mock_user_salary_repo, mock_salary_stat_repo
+    ):
+        # Given
+        unique_id = uuid.uuid4()
+        request = UserProfilePostRequest(unique_id=unique_id, age=28, save_rate=45, has_car=False, is_monthly_rent=True)
+        mock_user_salary_repo.get_by_uuid.return_value = UserSalary(
+            id=unique_id.bytes, user_id=1, job_id=1, experience=3, salary=50000000
+        )
+        mock_salary_stat_repo.get_by_job_id_experience.return_value = SalaryStat(job_id=1, experience=3, avg=60000000)
+        mock_user_profile_repo.upsert.side_effect = IntegrityError(
+            "INSERT INTO user_profile ...", {}, Exception(1062, "Duplicate entry")
         )
 
-        # 두 번째 요청 (동일한 ID, 다른 데이터)
-        second_request = UserProfilePostRequest(
-            unique_id=unique_id,
-            age=28,
-            save_rate=45,
-            has_car=True,
-            is_monthly_rent=False,
+        # When & Then
+        with pytest.raises(IntegrityError):
+            await asset_service.save_user_profile(request)
+
+
+class TestSalaryWriteBehind:
+    @pytest.fixture(autouse=True)
+    def write_behind_enabled(self):
+        with patch.object(settings, "salary_write_behind_enabled", True):
+            yield
+
+    @pytest.mark.asyncio
+    async def test_save_user_salary_enqueues_without_db(
+        self, asset_service, mock_user_salary_repo, mock_salary_write_buffer_repo, mock_percentile_service
+    ):
+        # Given
+        request = UserSalaryPostRequest(unique_id=uuid.uuid4(), job_id=2, experience=5, salary=8000)
+
+        # When
+        result = await asset_service.save_user_salary(request)
+
+        # Then - DB 대신 버퍼에 적재하고, 히스토그램은 바로 반영
+        assert result is True
+        buffered = mock_salary_write_buffer_repo.submit.call_args[0][0]
+        assert buffered.id == request.unique_id.bytes
+        assert buffered.salary == 8000 * SALARY_THOUSAND_WON
+        mock_user_salary_repo.upsert.assert_not_called()
+        mock_percentile_service.record_submission.assert_called_once_with(buffered, None)
+
+    @pytest.mark.asyncio
+    async def test_resubmission_reads_previous_from_redis_only(
+        self, asset_service, mock_user_salary_repo, mock_salary_write_buffer_repo, mock_percentile_service
+    ):
+        # Given - 이전 제출이 있는 재제출
+        request = UserSalaryPostRequest(unique_id=uuid.uuid4(), job_id=2, experience=5, salary=8000)
+        previous = UserSalary(id=request.unique_id.bytes, job_id=2, experience=5, salary=70000000)
+        mock_salary_write_buffer_repo.submit.side_effect = None
+        mock_salary_write_buffer_repo.submit.return_value = SalarySubmitResult(
+            version=3, enqueued=True, previous=previous
         )
 
-        mock_user_profile_repo.upsert.return_value = MagicMock(salary_id=unique_id.bytes)
+        # When
+        await asset_service.save_user_salary(request)
 
-        # When - 첫 번째 저장
-        result1 = await asset_service.save_user_profile(first_request)
+        # Then - 적재 스크립트가 돌려준 직전 제출을 사용하고 MySQL/pending은 따로 조회하지 않는다
+        assert mock_percentile_service.record_submission.call_args[0][1] is previous
+        mock_user_salary_repo.get_by_uuid.assert_not_called()
+        mock_user_salary_repo.upsert.assert_not_called()
+        mock_salary_write_buffer_repo.get_pending.assert_not_called()
 
-        # When - 두 번째 저장 (업데이트)
-        result2 = await asset_service.save_user_profile(second_request)
+    @pytest.mark.asyncio
+    async def test_backlog_full_falls_back_to_db(
+        self, asset_service, mock_user_salary_repo, mock_salary_write_buffer_repo
+    ):
+        # Given - 적체량 한도 초과
+        request = UserSalaryPostRequest(unique_id=uuid.uuid4(), job_id=2, experience=5, salary=8000)
+        mock_salary_write_buffer_repo.submit.side_effect = None
+        mock_salary_write_buffer_repo.submit.return_value = SalarySubmitResult(version=7, enqueued=False)
+        mock_user_salary_repo.upsert.return_value = MagicMock()
 
-        # Then
-        assert result1 is True
-        assert result2 is True
+        # When
+        result = await asset_service.save_user_salary(request)
 
-        # upsert가 두 번 호출되었는지 확인
-        assert mock_user_profile_repo.upsert.call_count == 2
+        # Then - 발급받은 제출 순번으로 바로 저장
+        assert result is True
+        mock_user_salary_repo.upsert.assert_called_once()
+        assert mock_user_salary_repo.upsert.call_args[0][0].version == 7
 
-        # 두 번째 호출의 데이터 확인
-        second_call_profile = mock_user_profile_repo.upsert.call_args[0][0]
-        assert second_call_profile.salary_id == unique_id.bytes
-        assert second_call_profile.age == 28
-        assert second_call_profile.save_rate == 45
-        assert second_call_profile.has_car is True
-        assert second_call_profile.is_monthly_rent is False
+    @pytest.mark.asyncio
+    async def test_profile_uses_flushed_pending_salary(
+        self,
+        asset_service,
+        mock_user_profile_repo,
+        mock_user_salary_repo,
+        mock_salary_stat_repo,
+        mock_salary_write_buffer_repo,
+    ):
+        # Given - 연봉 제출이 아직 버퍼에만 있는 경우
+        unique_id = uuid.uuid4()
+        request = UserProfilePostRequest(unique_id=unique_id, age=28, save_rate=30, has_car=False, is_monthly_rent=True)
+        pending = UserSalary(id=unique_id.bytes, job_id=1, experience=3, salary=50000000)
+        mock_salary_write_buffer_repo.get_pending.return_value = pending
+        mock_salary_stat_repo.get_by_job_id_experience.return_value = SalaryStat(job_id=1, experience=3, avg=60000000)
+
+        # When
+        result = await asset_service.save_user_profile(request)
+
+        # Then - 먼저 DB에 반영하고, 반영한 값으로 계산
+        mock_user_salary_repo.upsert_submissions.assert_called_once_with([pending])
+        mock_user_salary_repo.get_by_uuid.assert_not_called()
+        assert result.percentage == 75
+        mock_user_profile_repo.upsert.assert_called_once()
@@ -0,0 +1,157 @@
+import uuid
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from app.module.asset.enums import CarRank
+from app.module.asset.errors.asset_error import NoMatchJobSalary
+
+# Fixtures imported via pytest plugin system
+pytest_plugins = ["test.unit_test.fixtures.asset_mock_fixture"]
+
+
+def car_rank_row(id_: int, salary: int = 50000000, avg: int | None = 60000000) -> SimpleNamespace:
+    return SimpleNamespace(id=id_, save_rate=30, job_id=1, experience=3, salary=salary, avg=avg)
+
+
+class TestCalcCar:
+    def test_car_rank_calculation(self, car_rank_service):
+        # When
+        with patch.object(CarRank, "get_car_rank", return_value="중형차") as mock_get_car_rank:
+            result = car_rank_service.calc_car(60000000, 50)
+
+        # Then
+        assert result == "중형차"
+        expected_asset = int(60000000 * 0.5 * 5 * 0.3)  # 45000000
+        mock_get_car_rank.assert_called_once_with(expected_asset)
+
+
+class TestCalcPercentage:
+    @pytest.mark.asyncio
+    async def test_percentage_calculation(self, car_rank_service):
+        # When
+        result = await car_rank_service.calc_percentage(1, 3, 50000000, 30, 60000000)
+
+        # Then
+        user_asset = int(50000000 * 0.3)  # 15000000
+        expected_percentage = 100 - int((user_asset / 60000000) * 100)  # 100 - 25 = 75
+        assert result == expected_percentage
+
+    @pytest.mark.asyncio
+    async def test_percentage_bounds(self, car_rank_service):
+        # Given - 매우 높은 저축률로 상위 퍼센트를 초과하는 경우 (200%, 테스트용)
+        # When
+        result = await car_rank_service.calc_percentage(1, 3, 100000000, 200, 50000000)
+
+        # Then - 0과 100 사이로 제한됨
+        assert result == 0
+
+    @pytest.mark.asyncio
+    async def test_percentage_from_histogram(self, car_rank_service, mock_percentile_service):
+        # Given - 히스토그램 표본이 충분한 경우
+        mock_percentile_service.get_top_percentage.return_value = 12
+
+        # When - 평균 연봉이 없어도 히스토그램 값을 사용
+        result = await car_rank_service.calc_percentage(1, 3, 50000000, 30, None)
+
+        # Then
+        assert result == 12
+        mock_percentile_service.get_top_percentage.assert_called_once_with(1, 3, 50000000)
+
+    @pytest.mark.asyncio
+    async def test_no_job_salary_raises_error(self, car_rank_service):
+        # When & Then
+        with pytest.raises(NoMatchJobSalary):
+            await car_rank_service.calc_percentage(1, 3, 50000000, 30, None)
+
+
+class TestRecomputeAll:
+    @pytest.mark.asyncio
+    async def test_pages_by_id_and_updates_each_batch(self, car_rank_service, mock_user_profile_repo):
+        # Given - 2개씩 두 페이지
+        mock_user_profile_repo.get_car_rank_rows.side_effect = [
+            [car_rank_row(1), car_rank_row(4)],
+            [car_rank_row(9)],
+            [],
+        ]
+        mock_user_profile_repo.update_car_ranks.side_effect = lambda values: len(values)
+
+        # When
+        updated = await car_rank_service.recompute_all(batch_size=2)
+
+        # Then - 마지막으로 읽은 id 다음부터 이어서 읽는다
+        assert updated == 3
+        assert [call.args for call in mock_user_profile_repo.get_car_rank_rows.call_args_list] == [
+            (0, 2),
+            (4, 2),
+            (9, 2),
+        ]
+        first_batch = mock_user_profile_repo.update_car_ranks.call_args_list[0].args[0]
+        assert first_batch[0] == {
+            "id": 1,
+            "car_rank": CarRank.get_car_rank(int(50000000 * 0.3 * 5 * 0.3)),
+            "percentage": 75,
+        }
+
+    @pytest.mark.asyncio
+    async def test_row_without_job_salary_is_cleared(self, car_rank_service, mock_user_profile_repo):
+        # Given - 평균 연봉 통계가 없는 행
+        mock_user_profile_repo.get_car_rank_rows.side_effect = [[car_rank_row(1, avg=None), car_rank_row(2)], []]
+        mock_user_profile_repo.update_car_ranks.side_effect = lambda values: len(values)
+
+        # When
+        updated = await car_rank_service.recompute_all(batch_size=10)
+
+        # Then - 이전 직무/경력 기준 값이 남지 않도록 비운다
+        assert updated == 2
+        values = mock_user_profile_repo.update_car_ranks.call_args.args[0]
+        assert values[0] == {"id": 1, "car_rank": None, "percentage": None}
+        assert values[1]["id"] == 2
+
+    @pytest.mark.asyncio
+    async def test_bumps_share_cache_version_after_recompute(
+        self, car_rank_service, mock_user_profile_repo, mock_car_rank_cache_repo
+    ):
+        # Given
+        mock_user_profile_repo.get_car_rank_rows.side_effect = [[car_rank_row(1)], []]
+        mock_user_profile_repo.update_car_ranks.side_effect = lambda values: len(values)
+
+        # When
+        await car_rank_service.recompute_all(batch_size=10)
+
+        # Then - 이전 기준으로 캐시된 공유 링크 값을 한 번에 무효화
+        mock_car_rank_cache_repo.bump_version.assert_awaited_once()
+
+
+class TestRefresh:
+    @pytest.mark.asyncio
+    async def test_recomputes_profiles_of_saved_salaries(self, car_rank_service, mock_user_profile_repo):
+        # Given - 연봉을 다시 제출한 프로필
+        salary_ids = [b"a" * 16, b"b" * 16]
+        mock_user_profile_repo.get_car_rank_rows_by_salary_ids.return_value = [car_rank_row(7, salary=80000000)]
+        mock_user_profile_repo.update_car_ranks.side_effect = lambda values: len(values)
+
+        # When
+        updated = await car_rank_service.refresh(salary_ids)
+
+        # Then - 새 연봉으로 계산한 값을 저장
+        assert updated == 1
+        mock_user_profile_repo.get_car_rank_rows_by_salary_ids.assert_called_once_with(salary_ids)
+        values = mock_user_profile_repo.update_car_ranks.call_args.args[0]
+        assert values == [{"id": 7, "car_rank": CarRank.get_car_rank(int(80000000 * 0.3 * 5 * 0.3)), "percentage": 60}]
+
+    @pytest.mark.asyncio
+    async def test_deletes_share_cache_of_saved_salaries(
+        self, car_rank_service, mock_user_profile_repo, mock_car_rank_cache_repo
+    ):
+        # Given
+        unique_id = uuid.uuid4()
+        mock_user_profile_repo.get_car_rank_rows_by_salary_ids.return_value = []
+        mock_user_profile_repo.update_car_ranks.return_value = 0
+
+        # When
+        await car_rank_service.refresh([unique_id.bytes])
+
+        # Then - 다음 공유 링크 조회가 새로 저장한 값을 읽도록 캐시를 지운다
+        mock_car_rank_cache_repo.delete_car_ranks.assert_awaited_once_with([unique_id])
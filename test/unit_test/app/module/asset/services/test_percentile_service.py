@@ -0,0 +1,136 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.api.asset.v1.constant import SALARY_THOUSAND_WON
+from app.module.asset.model import UserSalary
+from app.module.asset.repositories.salary_histogram_redis_repository import SalaryHistogramRedisRepository
+from app.module.asset.repositories.user_salary_repository import UserSalaryRepository
+from app.module.asset.services.percentile_service import MAX_BUCKET, SalaryPercentileService
+
+
+@pytest.fixture
+def mock_histogram_repo():
+    """SalaryHistogramRedisRepository Mock"""
+    return AsyncMock(spec=SalaryHistogramRedisRepository)
+
+
+@pytest.fixture
+def mock_user_salary_repo():
+    """UserSalaryRepository Mock"""
+    return AsyncMock(spec=UserSalaryRepository)
+
+
+@pytest.fixture
+def percentile_service(mock_histogram_repo, mock_user_salary_repo):
+    return SalaryPercentileService(histogram_repo=mock_histogram_repo, user_salary_repo=mock_user_salary_repo)
+
+
+class TestToBucket:
+    def test_bucket_by_100_manwon(self):
+        # Given - 4,550만원 / 10억 / 상한 초과
+        assert SalaryPercentileService.to_bucket(4550 * SALARY_THOUSAND_WON) == 45
+        assert SalaryPercentileService.to_bucket(100_000 * SALARY_THOUSAND_WON) == MAX_BUCKET
+        assert SalaryPercentileService.to_bucket(200_000 * SALARY_THOUSAND_WON) == MAX_BUCKET
+
+
+class TestRecord:
+    @pytest.mark.asyncio
+    async def test_record_increments_bucket(self, percentile_service, mock_histogram_repo):
+        # When
+        await percentile_service.record(job_id=1, experience=3, salary=4550 * SALARY_THOUSAND_WON)
+
+        # Then
+        mock_histogram_repo.increment.assert_called_once_with(1, 3, 45)
+
+
+class TestRecordSubmission:
+    @pytest.mark.asyncio
+    async def test_first_submission_increments(self, percentile_service, mock_histogram_repo):
+        # Given
+        current = UserSalary(job_id=1, experience=3, salary=4550 * SALARY_THOUSAND_WON)
+
+        # When
+        await percentile_service.record_submission(current, None)
+
+        # Then
+        mock_histogram_repo.increment.assert_called_once_with(1, 3, 45)
+        mock_histogram_repo.move.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_resubmission_moves_bucket(self, percentile_service, mock_histogram_repo):
+        # Given - 같은 uuid가 연봉/경력을 수정해 다시 제출
+        previous = UserSalary(job_id=1, experience=3, salary=4550 * SALARY_THOUSAND_WON)
+        current = UserSalary(job_id=1, experience=4, salary=6000 * SALARY_THOUSAND_WON)
+
+        # When
+        await percentile_service.record_submission(current, previous)
+
+        # Then - 이전 구간에서 빼고 새 구간에 더한다 (중복 집계 없음)
+        mock_histogram_repo.move.assert_called_once_with((1, 3, 45), (1, 4, 60))
+        mock_histogram_repo.increment.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_resubmission_in_same_bucket_is_noop(self, percentile_service, mock_histogram_repo):
+        # Given
+        previous = UserSalary(job_id=1, experience=3, salary=4550 * SALARY_THOUSAND_WON)
+        current = UserSalary(job_id=1, experience=3, salary=4580 * SALARY_THOUSAND_WON)
+
+        # When
+        await percentile_service.record_submission(current, previous)
+
+        # Then
+        mock_histogram_repo.move.assert_not_called()
+        mock_histogram_repo.increment.assert_not_called()
+
+
+class TestGetTopPercentage:
+    @pytest.mark.asyncio
+    async def test_prefix_sum_percentage(self, percentile_service, mock_histogram_repo):
+        # Given - 100명 중 위 구간 20명, 같은 구간 10명
+        mock_histogram_repo.get_histogram.return_value = {30: 40, 40: 30, 45: 10, 60: 15, 80: 5}
+
+        # When
+        result = await percentile_service.get_top_percentage(1, 3, 4550 * SALARY_THOUSAND_WON)
+
+        # Then - (20 + 10 / 2) / 100
+        assert result == 25
+
+    @pytest.mark.asyncio
+    async def test_not_enough_samples(self, percentile_service, mock_histogram_repo):
+        # Given
+        mock_histogram_repo.get_histogram.return_value = {45: 3}
+
+        # When
+        result = await percentile_service.get_top_percentage(1, 3, 4550 * SALARY_THOUSAND_WON)
+
+        # Then
+        assert result is None
+
+
+class TestRebuild:
+    @pytest.mark.asyncio
+    async def test_rebuild_from_mysql_aggregate(self, percentile_service, mock_histogram_repo, mock_user_salary_repo):
+        # Given
+        mock_user_salary_repo.get_salary_bucket_counts.return_value = [(1, 0, 30, 5), (1, 0, 40, 2), (2, 3, 50, 1)]
+
+        # When
+        result = await percentile_service.rebuild()
+
+        # Then
+        assert result == 2
+        mock_histogram_repo.replace_all.assert_called_once_with({(1, 0): {30: 5, 40: 2}, (2, 3): {50: 1}})
+
+    @pytest.mark.asyncio
+    async def test_rebuild_with_no_rows_clears_histograms(
+        self, percentile_service, mock_histogram_repo, mock_user_salary_repo
+    ):
+        # Given
+        mock_user_salary_repo.get_salary_bucket_counts.return_value = []
+
+        # When
+        result = await percentile_service.rebuild()
+
+        # Then - 남아 있는 기존 키도 지우도록 빈 집계로 교체
+        assert result == 0
+        mock_histogram_repo.replace_all.assert_called_once_with({})
@@ -0,0 +1,237 @@
+import uuid
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.module.asset.model import UserSalary
+from app.module.asset.repositories.salary_write_buffer_redis_repository import (
+    SalaryBufferEntry,
+    SalaryWriteBufferRedisRepository,
+)
+from app.module.asset.repositories.user_salary_repository import UserSalaryRepository
+from app.module.asset.services.car_rank_service import CarRankService
+from app.module.asset.services.salary_write_behind_service import SalaryWriteBehindService
+
+SERVICE_MODULE = "app.module.asset.services.salary_write_behind_service"
+
+
+def buffer_entry(entry_id: str, uid: uuid.UUID, salary: int) -> SalaryBufferEntry:
+    user_salary = UserSalary(id=uid.bytes, job_id=1, experience=3, salary=salary)
+    return SalaryBufferEntry(
+        entry_id=entry_id, uid=uid.hex, payload=SalaryWriteBufferRedisRepository.serialize_salary(user_salary)
+    )
+
+
+@pytest.fixture
+def pending_hash() -> dict[str, str]:
+    return {}
+
+
+@pytest.fixture
+def mock_buffer_repo(pending_hash):
+    buffer_repo = AsyncMock(spec=SalaryWriteBufferRedisRepository)
+    buffer_repo.ack.return_value = 0
+    buffer_repo.get_pending_payloads.side_effect = lambda uids: [pending_hash.get(uid) for uid in uids]
+    return buffer_repo
+
+
+def enqueue(pending_hash: dict[str, str], *entries: SalaryBufferEntry) -> list[SalaryBufferEntry]:
+    """적재 순서대로 pending 해시에 UUID별 최신 제출을 남긴다"""
+    for entry in entries:
+        pending_hash[entry.uid] = entry.payload
+    return list(entries)
+
+
+@pytest.fixture
+def mock_car_rank_service():
+    car_rank_service = AsyncMock(spec=CarRankService)
+    with patch(f"{SERVICE_MODULE}.CarRankService", return_value=car_rank_service):
+        yield car_rank_service
+
+
+@pytest.fixture
+def mock_user_salary_repo(mock_car_rank_service):
+    user_salary_repo = AsyncMock(spec=UserSalaryRepository)
+    with (
+        patch(f"{SERVICE_MODULE}.UserSalaryRepository", return_value=user_salary_repo),
+        patch(f"{SERVICE_MODULE}.mysql_session_factory", side_effect=asynccontextmanager(_session)),
+    ):
+        yield user_salary_repo
+
+
+async def _session():
+    yield MagicMock()
+
+
+class TestDrainOnce:
+    async def test_latest_submission_per_uuid_is_written_then_acked(
+        self, mock_buffer_repo, mock_user_salary_repo, pending_hash
+    ):
+        # Given - 같은 UUID를 두 번 제출
+        first_uid, second_uid = uuid.uuid4(), uuid.uuid4()
+        entries = enqueue(
+            pending_hash,
+            buffer_entry("1000-0", first_uid, 50_000_000),
+            buffer_entry("1001-0", second_uid, 60_000_000),
+            buffer_entry("1002-0", first_uid, 70_000_000),
+        )
+        mock_buffer_repo.read_batch.return_value = entries
+        mock_buffer_repo.ack.return_value = 5
+        service = SalaryWriteBehindService(mock_buffer_repo, consumer="test")
+
+        # When
+        processed = await service.drain_once(batch_size=10)
+
+        # Then - 한 번의 upsert로 UUID별 마지막 제출만 반영하고 전부 ack
+        assert processed == 3
+        written = mock_user_salary_repo.upsert_submissions.call_args[0][0]
+        assert {(salary.id, salary.salary) for salary in written} == {
+            (first_uid.bytes, 70_000_000),
+            (second_uid.bytes, 60_000_000),
+        }
+        mock_buffer_repo.ack.assert_awaited_once_with(entries)
+        assert service.backlog == 5
+
+    async def test_car_ranks_refreshed_for_written_salaries(
+        self, mock_buffer_repo, mock_user_salary_repo, mock_car_rank_service, pending_hash
+    ):
+        # Given
+        uid = uuid.uuid4()
+        mock_buffer_repo.read_batch.return_value = enqueue(pending_hash, buffer_entry("1000-0", uid, 50_000_000))
+
+        # When
+        await SalaryWriteBehindService(mock_buffer_repo, consumer="test").drain_once(batch_size=10)
+
+        # Then - 반영한 연봉의 프로필 등급/퍼센트를 다시 계산
+        mock_user_salary_repo.upsert_submissions.assert_awaited_once()
+        mock_car_rank_service.refresh.assert_awaited_once_with([uid.bytes])
+
+    async def test_db_failure_leaves_entries_unacked(self, mock_buffer_repo, mock_user_salary_repo, pending_hash):
+        # Given - DB 장애
+        mock_buffer_repo.read_batch.return_value = enqueue(
+            pending_hash, buffer_entry("1000-0", uuid.uuid4(), 50_000_000)
+        )
+        mock_user_salary_repo.upsert_submissions.side_effect = ConnectionError
+        service = SalaryWriteBehindService(mock_buffer_repo, consumer="test")
+
+        # When & Then - ack하지 않으므로 나중에 다시 회수된다
+        with pytest.raises(ConnectionError):
+            await service.drain_once(batch_size=10)
+        mock_buffer_repo.ack.assert_not_called()
+
+    async def test_invalid_row_is_dropped_others_written(self, mock_buffer_repo, mock_user_salary_repo, pending_hash):
+        # Given - 배치 중 한 행이 FK 위반
+        entries = enqueue(
+            pending_hash,
+            buffer_entry("1000-0", uuid.uuid4(), 50_000_000),
+            buffer_entry("1001-0", uuid.uuid4(), 60_000_000),
+        )
+        mock_buffer_repo.read_batch.return_value = entries
+        fk_error = IntegrityError("INSERT INTO user_salary ...", {}, Exception(1452, "Cannot add or update"))
+        mock_user_salary_repo.upsert_submissions.side_effect = [fk_error, fk_error, MagicMock()]
+        service = SalaryWriteBehindService(mock_buffer_repo, consumer="test")
+
+        # When
+        processed = await service.drain_once(batch_size=10)
+
+        # Then - 배치 실패 후 한 건씩 재시도, 전부 ack해 같은 행이 계속 막지 않게 한다
+        assert processed == 2
+        assert mock_user_salary_repo.upsert_submissions.await_count == 3
+        mock_buffer_repo.ack.assert_awaited_once_with(entries)
+
+    async def test_batches_committed_in_reverse_order_keep_latest(
+        self, mock_buffer_repo, mock_user_salary_repo, pending_hash
+    ):
+        # Given - 워커 A가 첫 제출, 워커 B가 두 번째 제출을 가져갔고 B가 먼저 커밋한다
+        uid = uuid.uuid4()
+        older, newer = enqueue(
+            pending_hash, buffer_entry("1000-0", uid, 50_000_000), buffer_entry("1001-0", uid, 70_000_000)
+        )
+        worker_a = SalaryWriteBehindService(mock_buffer_repo, consumer="a")
+        worker_b = SalaryWriteBehindService(mock_buffer_repo, consumer="b")
+
+        # When - B 반영(ack 전) 후 늦게 도착한 A의 배치 반영
+        mock_buffer_repo.read_batch.return_value = [newer]
+        await worker_b.drain_once(batch_size=10)
+        mock_buffer_repo.read_batch.return_value = [older]
+        await worker_a.drain_once(batch_size=10)
+
+        # Then - A도 항목 payload가 아니라 pending의 최신 제출을 쓴다
+        written = [call.args[0][0].salary for call in mock_user_salary_repo.upsert_submissions.await_args_list]
+        assert written == [70_000_000, 70_000_000]
+
+    async def test_entry_whose_pending_was_already_written_is_skipped(
+        self, mock_buffer_repo, mock_user_salary_repo, mock_car_rank_service
+    ):
+        # Given - 더 새로운 제출이 이미 반영돼 pending 값이 지워진 뒤 오래된 항목이 회수됨
+        entries = [buffer_entry("1000-0", uuid.uuid4(), 50_000_000)]
+        mock_buffer_repo.read_batch.return_value = entries
+
+        # When
+        processed = await SalaryWriteBehindService(mock_buffer_repo, consumer="test").drain_once(batch_size=10)
+
+        # Then - DB에 쓰지 않고 ack만 한다
+        assert processed == 1
+        mock_user_salary_repo.upsert_submissions.assert_not_called()
+        mock_car_rank_service.refresh.assert_not_called()
+        mock_buffer_repo.ack.assert_awaited_once_with(entries)
+
+    async def test_empty_read(self, mock_buffer_repo, mock_user_salary_repo):
+        # Given
+        mock_buffer_repo.read_batch.return_value = []
+        service = SalaryWriteBehindService(mock_buffer_repo, consumer="test")
+
+        # When
+        processed = await service.drain_once(batch_size=10)
+
+        # Then
+        assert processed == 0
+        mock_user_salary_repo.upsert_submissions.assert_not_called()
+
+
+class TestSalaryBufferEntry:
+    def test_round_trip(self):
+        # Given
+        uid = uuid.uuid4()
+        entry = buffer_entry("1700000000123-4", uid, 50_000_000)
+
+        # When
+        user_salary = entry.to_user_salary()
+
+        # Then
+        assert entry.enqueued_at_ms == 1700000000123
+        assert (user_salary.id, user_salary.job_id, user_salary.experience, user_salary.salary) == (
+            uid.bytes,
+            1,
+            3,
+            50_000_000,
+        )
+        assert SalaryWriteBufferRedisRepository.serialize_salary(user_salary) == entry.payload
+
+    def test_version_from_payload(self):
+        # Given - SUBMIT_LUA가 발급한 순번이 들어 있는 payload
+        uid = uuid.uuid4()
+
+        # When
+        user_salary = SalaryWriteBufferRedisRepository.deserialize_salary(
+            uid.hex, '{"job_id": 1, "experience": 3, "salary": 50000000, "version": 12}'
+        )
+
+        # Then
+        assert user_salary.version == 12
+
+    def test_legacy_payload_without_version(self):
+        # Given - 제출 시각/순번을 남기기 전에 적재된 항목
+        uid = uuid.uuid4()
+
+        # When
+        user_salary = SalaryWriteBufferRedisRepository.deserialize_salary(
+            uid.hex, '{"job_id": 1, "experience": 3, "salary": 50000000}'
+        )
+
+        # Then - 반영 시각을 제출 시각으로 보고, 순번이 없으면 어떤 제출보다도 오래된 것으로 본다
+        assert user_salary.salary == 50_000_000
+        assert user_salary.updated_at is not None
+        assert user_salary.version == 0
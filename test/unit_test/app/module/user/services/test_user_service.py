@@ -1,17 +1,14 @@
 import uuid
+from unittest.mock import patch
 
 import pytest
 
 from app.api.auth.v1.schemas.user_schema import UserEmailRequest
 from app.module.asset.model import UserSalary
 from app.module.auth.enums import UserConsentEventEnum
-from app.module.auth.errors.user_error import (
-    ConsentCreationFailed,
-    SalaryAlreadyLinked,
-    SalaryNotFound,
-    UserCreationFailed,
-)
-from app.module.auth.model import User, UserConsent
+from app.module.auth.errors.user_error import SalaryAlreadyLinked, SalaryNotFound, UserCreationFailed
+from app.module.auth.model import User
+from main_config import settings
 
 # Fixtures imported via pytest plugin system
 pytest_plugins = ["test.unit_test.fixtures.auth_mock_fixture"]
@@ -33,28 +30,12 @@ class TestSaveUserWithMarketing:
             agree=agree,
         )
 
-        # UserSalary 레코드 (아직 user_id가 없는 상태)
-        salary_record = UserSalary(
-            id=unique_id.bytes,
-            user_id=None,  # 아직 연결되지 않음
-            job_id=1,
-            experience=3,
-            salary=50000000,
-        )
-        mock_user_salary_repo_for_auth.get_by_uuid.return_value = salary_record
-
-        # 새로 생성될 User
+        # 새로 생성될 User (flush 후 id가 채워진 상태)
         created_user = User(id=123, email=email)
-        mock_user_repo.save.return_value = created_user
+        mock_user_repo.stage_and_flush.return_value = created_user
 
-        # 생성될 UserConsent
-        created_consent = UserConsent(
-            id=1,
-            user_id=created_user.id,
-            event=UserConsentEventEnum.MARKETING,
-            agree=agree,
-        )
-        mock_user_consent_repo.save.return_value = created_consent
+        # 아직 user_id가 없는 연봉 기록에 연결 성공
+        mock_user_salary_repo_for_auth.link_user.return_value = True
 
         # When
         result = await user_service.save_user_with_marketing(request)
@@ -62,26 +43,26 @@ class TestSaveUserWithMarketing:
         # Then
         assert result is True
 
-        # UserSalary 조회 확인
-        mock_user_salary_repo_for_auth.get_by_uuid.assert_called_once_with(unique_id)
-
         # User 생성 확인
-        saved_user = mock_user_repo.save.call_args[0][0]
+        saved_user = mock_user_repo.stage_and_flush.call_args[0][0]
         assert saved_user.email == email
-        assert mock_user_repo.save.call_args[0][1] is True  # flush=True
 
         # UserConsent 생성 확인
-        saved_consent = mock_user_consent_repo.save.call_args[0][0]
+        saved_consent = mock_user_consent_repo.stage.call_args[0][0]
         assert saved_consent.user_id == created_user.id
         assert saved_consent.event == UserConsentEventEnum.MARKETING
         assert saved_consent.agree == agree
 
-        # UserSalary에 user_id 연결 확인
-        updated_salary = mock_user_salary_repo_for_auth.save.call_args[0][0]
-        assert updated_salary.user_id == created_user.id
+        # UserSalary에 user_id 연결 확인 (사전 조회 없이 조건부 UPDATE)
+        mock_user_salary_repo_for_auth.link_user.assert_awaited_once_with(unique_id, created_user.id)
+        mock_user_salary_repo_for_auth.get_by_uuid.assert_not_called()
+
+        # 한 번만 커밋
+        mock_user_repo.unit_of_work.assert_called_once()
+        assert mock_user_repo.unit_of_work.committed is True
 
     @pytest.mark.asyncio
-    async def test_salary_not_found(self, user_service, mock_user_salary_repo_for_auth):
+    async def test_salary_not_found(self, user_service, mock_user_repo, mock_user_salary_repo_for_auth):
         # Given
         unique_id = uuid.uuid4()
         request = UserEmailRequest(
@@ -90,14 +71,19 @@ class TestSaveUserWithMarketing:
             agree=True,
         )
 
+        mock_user_repo.stage_and_flush.return_value = User(id=123, email="test@example.com")
+        mock_user_salary_repo_for_auth.link_user.return_value = False
         mock_user_salary_repo_for_auth.get_by_uuid.return_value = None
 
         # When & Then
         with pytest.raises(SalaryNotFound):
             await user_service.save_user_with_marketing(request)
 
+        # 생성한 유저와 동의는 롤백된다
+        assert mock_user_repo.unit_of_work.committed is False
+
     @pytest.mark.asyncio
-    async def test_salary_already_linked(self, user_service, mock_user_salary_repo_for_auth):
+    async def test_salary_already_linked(self, user_service, mock_user_repo, mock_user_salary_repo_for_auth):
         # Given
         unique_id = uuid.uuid4()
         request = UserEmailRequest(
@@ -106,6 +92,9 @@ class TestSaveUserWithMarketing:
             agree=True,
         )
 
+        mock_user_repo.stage_and_flush.return_value = User(id=123, email="test@example.com")
+        mock_user_salary_repo_for_auth.link_user.return_value = False
+
         # 이미 user_id가 연결된 UserSalary
         salary_record = UserSalary(
             id=unique_id.bytes,
@@ -119,35 +108,10 @@ class TestSaveUserWithMarketing:
         # When & Then
         with pytest.raises(SalaryAlreadyLinked):
             await user_service.save_user_with_marketing(request)
+        assert mock_user_repo.unit_of_work.committed is False
 
     @pytest.mark.asyncio
-    async def test_user_creation_failed(self, user_service, mock_user_repo, mock_user_salary_repo_for_auth):
-        # Given
-        unique_id = uuid.uuid4()
-        request = UserEmailRequest(
-            unique_id=unique_id,
-            email="test@example.com",
-            agree=True,
-        )
-
-        salary_record = UserSalary(
-            id=unique_id.bytes,
-            user_id=None,
-            job_id=1,
-            experience=3,
-            salary=50000000,
-        )
-        mock_user_salary_repo_for_auth.get_by_uuid.return_value = salary_record
-
-        # User 생성 실패
-        mock_user_repo.save.return_value = None
-
-        # When & Then
-        with pytest.raises(UserCreationFailed):
-            await user_service.save_user_with_marketing(request)
-
-    @pytest.mark.asyncio
-    async def test_consent_creation_failed(
+    async def test_user_creation_failed(
         self, user_service, mock_user_repo, mock_user_salary_repo_for_auth, mock_user_consent_repo
     ):
         # Given
@@ -158,24 +122,15 @@ class TestSaveUserWithMarketing:
             agree=True,
         )
 
-        salary_record = UserSalary(
-            id=unique_id.bytes,
-            user_id=None,
-            job_id=1,
-            experience=3,
-            salary=50000000,
-        )
-        mock_user_salary_repo_for_auth.get_by_uuid.return_value = salary_record
-
-        created_user = User(id=123, email="test@example.com")
-        mock_user_repo.save.return_value = created_user
-
-        # Consent 생성 실패
-        mock_user_consent_repo.save.return_value = None
+        # User 생성 실패 (id가 채워지지 않음)
+        mock_user_repo.stage_and_flush.return_value = User(email="test@example.com")
 
         # When & Then
-        with pytest.raises(ConsentCreationFailed):
+        with pytest.raises(UserCreationFailed):
             await user_service.save_user_with_marketing(request)
+        mock_user_consent_repo.stage.assert_not_called()
+        mock_user_salary_repo_for_auth.link_user.assert_not_called()
+        assert mock_user_repo.unit_of_work.committed is False
 
     @pytest.mark.asyncio
     async def test_marketing_consent_disagree(
@@ -192,25 +147,8 @@ class TestSaveUserWithMarketing:
             agree=agree,
         )
 
-        salary_record = UserSalary(
-            id=unique_id.bytes,
-            user_id=None,
-            job_id=1,
-            experience=3,
-            salary=50000000,
-        )
-        mock_user_salary_repo_for_auth.get_by_uuid.return_value = salary_record
-
-        created_user = User(id=123, email=email)
-        mock_user_repo.save.return_value = created_user
-
-        created_consent = UserConsent(
-            id=1,
-            user_id=created_user.id,
-            event=UserConsentEventEnum.MARKETING,
-            agree=agree,
-        )
-        mock_user_consent_repo.save.return_value = created_consent
+        mock_user_repo.stage_and_flush.return_value = User(id=123, email=email)
+        mock_user_salary_repo_for_auth.link_user.return_value = True
 
         # When
         result = await user_service.save_user_with_marketing(request)
@@ -219,5 +157,25 @@ class TestSaveUserWithMarketing:
         assert result is True
 
         # 동의하지 않은 경우에도 UserConsent는 저장됨 (agree=False로)
-        saved_consent = mock_user_consent_repo.save.call_args[0][0]
+        saved_consent = mock_user_consent_repo.stage.call_args[0][0]
         assert saved_consent.agree is False
+
+    @pytest.mark.asyncio
+    async def test_pending_salary_flushed_before_link(
+        self, user_service, mock_user_repo, mock_user_salary_repo_for_auth, mock_salary_write_buffer_repo_for_auth
+    ):
+        # Given - 연봉 제출이 아직 쓰기 버퍼에만 있음
+        unique_id = uuid.uuid4()
+        request = UserEmailRequest(unique_id=unique_id, email="test@example.com", agree=True)
+        pending = UserSalary(id=unique_id.bytes, job_id=1, experience=3, salary=50000000)
+        mock_salary_write_buffer_repo_for_auth.get_pending.return_value = pending
+        mock_user_repo.stage_and_flush.return_value = User(id=123, email="test@example.com")
+        mock_user_salary_repo_for_auth.link_user.return_value = True
+
+        # When
+        with patch.object(settings, "salary_write_behind_enabled", True):
+            result = await user_service.save_user_with_marketing(request)
+
+        # Then
+        assert result is True
+        mock_user_salary_repo_for_auth.upsert_submissions.assert_awaited_once_with([pending])
@@ -0,0 +1,120 @@
+from unittest.mock import patch
+
+import pytest
+from redis.asyncio import BlockingConnectionPool
+
+from app.common.metrics.request_context import RequestStats, request_stats
+from database import dependency
+from database.config import mysql_engine
+from database.dependency import (
+    close_redis_pool,
+    describe_pool_capacity,
+    get_mysql_session_router,
+    get_redis_pool,
+    get_redis_pool_stats,
+    init_redis_pool,
+)
+from main_config import Settings, settings
+
+
+@pytest.fixture(autouse=True)
+def reset_redis_pool():
+    # 연결을 맺지 않은 풀이므로 참조만 끊는다
+    dependency._redis_client = None
+    yield
+    dependency._redis_client = None
+
+
+class TestRedisPool:
+    def test_get_redis_pool_shares_one_client(self):
+        # When
+        first = get_redis_pool()
+        second = get_redis_pool()
+
+        # Then - 요청마다 새 풀을 만들지 않는다
+        assert first is second
+        assert first.connection_pool.max_connections == settings.redis_max_connections
+
+    def test_pool_waits_instead_of_failing_when_exhausted(self):
+        # When
+        pool = get_redis_pool().connection_pool
+
+        # Then - 가득 차면 즉시 ConnectionError 대신 timeout까지 대기하는 풀
+        assert isinstance(pool, BlockingConnectionPool)
+        assert pool.timeout == settings.redis_pool_timeout_sec
+
+    def test_init_redis_pool_reuses_existing(self):
+        # Given
+        client = get_redis_pool()
+
+        # When
+        result = init_redis_pool()
+
+        # Then
+        assert result is client
+
+    def test_stats_before_any_connection(self):
+        # Given
+        get_redis_pool()
+
+        # When
+        stats = get_redis_pool_stats()
+
+        # Then
+        assert stats == {"in_use": 0, "idle": 0, "max": settings.redis_max_connections}
+
+    @pytest.mark.asyncio
+    async def test_close_redis_pool_resets_client(self):
+        # Given
+        client = get_redis_pool()
+
+        # When
+        await close_redis_pool()
+
+        # Then - 다음 호출에서 새 풀 생성
+        assert dependency._redis_client is None
+        assert get_redis_pool() is not client
+
+
+class TestMysqlSessionRouter:
+    @pytest.mark.asyncio
+    async def test_unused_session_never_checks_out_connection(self):
+        # Given - 접속할 수 없는 DB여도 쿼리가 없으면 커넥션을 요청하지 않는다
+        stats = RequestStats()
+        token = request_stats.set(stats)
+
+        # When
+        session_router = get_mysql_session_router()
+        session = await anext(session_router)
+        await session_router.aclose()
+        request_stats.reset(token)
+
+        # Then
+        assert session is not None
+        assert stats.db_checkouts == 0
+        assert mysql_engine.pool.checkedout() == 0
+
+
+class TestPoolCapacity:
+    def test_env_defaults_and_override(self):
+        # Given
+        prod = Settings(environment="prod")
+        overridden = Settings(environment="prod", db_pool_size=3, db_max_overflow=0)
+
+        # Then
+        assert (prod.mysql_pool_size, prod.mysql_max_overflow) == (10, 10)
+        assert (overridden.mysql_pool_size, overridden.mysql_max_overflow) == (3, 0)
+
+    def test_capacity_per_worker_and_node(self):
+        # Given
+        config = Settings(environment="prod", web_concurrency=4, redis_max_connections=20)
+
+        # When
+        with patch.object(dependency, "settings", config):
+            capacity = describe_pool_capacity()
+
+        # Then - replica가 없으면 primary와 redis만 계산
+        assert capacity == {
+            "mysql_primary": {"per_worker": 20, "per_node": 80},
+            "redis": {"per_worker": 20, "per_node": 80},
+        }
@@ -0,0 +1,53 @@
+from sqlalchemy import create_engine, text
+
+from app.common.metrics.metrics import DB_POOL_EVENTS
+from app.common.metrics.request_context import RequestStats, request_stats
+from database.instrumentation import instrument_engine, instrument_pool
+
+
+class TestInstrumentEngine:
+    def test_queries_attributed_to_current_request(self):
+        # Given
+        engine = create_engine("sqlite://")
+        instrument_engine(engine)
+        stats = RequestStats()
+        token = request_stats.set(stats)
+
+        # When
+        with engine.connect() as conn:
+            for user_id in (1, 2, 3):
+                conn.execute(text("SELECT :id"), {"id": user_id})
+            conn.execute(text("SELECT 1"))
+        request_stats.reset(token)
+
+        # Then - 파라미터가 달라도 같은 형태의 SQL로 집계
+        assert stats.query_count == 4
+        assert stats.query_time_ns > 0
+        assert stats.repeated_statements(2) == [("SELECT ?", 3)]
+
+    def test_no_request_context(self):
+        # Given
+        engine = create_engine("sqlite://")
+        instrument_engine(engine)
+
+        # When
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        # Then - 요청 밖(배치 스크립트 등)에서는 기록하지 않는다
+        assert request_stats.get() is None
+
+
+class TestInstrumentPool:
+    def test_pool_events_counted_by_role(self):
+        # Given
+        engine = create_engine("sqlite://")
+        instrument_pool(engine, "test_role")
+
+        # When
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        # Then
+        counts = {labels[1]: count for labels, count in DB_POOL_EVENTS.collect() if labels[0] == "test_role"}
+        assert counts == {"connect": 1, "checkout": 1, "checkin": 1}
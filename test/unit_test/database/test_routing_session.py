@@ -0,0 +1,59 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import insert, select
+
+from app.module.asset.model import Job
+from database.config import RoutingSession, mysql_engine
+
+
+@pytest.fixture
+def replica_engine():
+    engine = MagicMock()
+    with patch("database.config.mysql_replica_engine", engine):
+        yield engine
+
+
+class TestRoutingSession:
+    def test_marked_read_goes_to_replica(self, replica_engine):
+        # Given
+        session = RoutingSession()
+
+        # When
+        bind = session.get_bind(clause=select(Job), replica=True)
+
+        # Then
+        assert bind is replica_engine.sync_engine
+
+    def test_unmarked_read_goes_to_primary(self, replica_engine):
+        # Given
+        session = RoutingSession()
+
+        # When
+        bind = session.get_bind(clause=select(Job))
+
+        # Then
+        assert bind is mysql_engine.sync_engine
+
+    def test_read_after_write_sticks_to_primary(self, replica_engine):
+        # Given - 같은 세션(요청)에서 쓰기 발생
+        session = RoutingSession()
+        write_bind = session.get_bind(clause=insert(Job).values(group_id=1, name="백엔드"))
+
+        # When
+        read_bind = session.get_bind(clause=select(Job), replica=True)
+
+        # Then
+        assert write_bind is mysql_engine.sync_engine
+        assert read_bind is mysql_engine.sync_engine
+
+    def test_no_replica_configured(self):
+        # Given
+        session = RoutingSession()
+
+        # When
+        with patch("database.config.mysql_replica_engine", None):
+            bind = session.get_bind(clause=select(Job), replica=True)
+
+        # Then
+        assert bind is mysql_engine.sync_engine
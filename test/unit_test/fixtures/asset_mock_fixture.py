@@ -4,18 +4,29 @@ from unittest.mock import AsyncMock
 
 import pytest
 
-from app.common.redis_repository.general_redis_repository import ListRedisRepository
+from app.common.redis_repository.general_redis_repository import GeneralRedisRepository
+from app.module.asset.caches.job_catalog_snapshot import JobCatalogSnapshotHolder
+from app.module.asset.caches.salary_stat_table import SalaryStatTable
 from app.module.asset.repositories.job_repository import JobRepository
 from app.module.asset.repositories.salary_stat_repository import SalaryStatRepository
+from app.module.asset.repositories.salary_write_buffer_redis_repository import (
+    SalarySubmitResult,
+    SalaryWriteBufferRedisRepository,
+)
+from app.module.asset.repositories.user_car_rank_redis_repository import UserCarRankRedisRepository
 from app.module.asset.repositories.user_profile_repository import UserProfileRepository
 from app.module.asset.repositories.user_salary_repository import UserSalaryRepository
 from app.module.asset.services.asset_service import AssetService
+from app.module.asset.services.car_rank_service import CarRankService
+from app.module.asset.services.percentile_service import SalaryPercentileService
 
 
 @pytest.fixture
 def mock_user_salary_repo():
-    """UserSalaryRepository Mock"""
-    return AsyncMock(spec=UserSalaryRepository)
+    """UserSalaryRepository Mock (기본값: 저장된 연봉 없음)"""
+    user_salary_repo = AsyncMock(spec=UserSalaryRepository)
+    user_salary_repo.get_by_uuid.return_value = None
+    return user_salary_repo
 
 
 @pytest.fixture
@@ -38,8 +49,57 @@ def mock_job_repo():
 
 @pytest.fixture
 def mock_job_cache_repo():
-    """ListRedisRepository Mock for Job caching"""
-    return AsyncMock(spec=ListRedisRepository)
+    """GeneralRedisRepository Mock for Job caching"""
+    return AsyncMock(spec=GeneralRedisRepository)
+
+
+@pytest.fixture
+def job_catalog_holder():
+    """워커 단위 직무 스냅샷 보관소 (테스트마다 새로 생성)"""
+    return JobCatalogSnapshotHolder()
+
+
+@pytest.fixture
+def salary_stat_table():
+    """적재 전 상태의 SalaryStat 메모리 테이블 (테스트마다 새로 생성)"""
+    return SalaryStatTable()
+
+
+@pytest.fixture
+def mock_percentile_service():
+    """SalaryPercentileService Mock (기본값: 히스토그램 표본 부족)"""
+    percentile_service = AsyncMock(spec=SalaryPercentileService)
+    percentile_service.get_top_percentage.return_value = None
+    return percentile_service
+
+
+@pytest.fixture
+def mock_car_rank_cache_repo():
+    """UserCarRankRedisRepository Mock (기본값: 캐시 없음, 버전 0)"""
+    car_rank_cache_repo = AsyncMock(spec=UserCarRankRedisRepository)
+    car_rank_cache_repo.get_car_rank.return_value = (None, 0)
+    return car_rank_cache_repo
+
+
+@pytest.fixture
+def car_rank_service(mock_percentile_service, mock_user_profile_repo, mock_car_rank_cache_repo):
+    """Mock 의존성으로 만든 CarRankService (계산은 실제 로직)"""
+    return CarRankService(
+        percentile_service=mock_percentile_service,
+        user_profile_repo=mock_user_profile_repo,
+        car_rank_cache_repo=mock_car_rank_cache_repo,
+    )
+
+
+@pytest.fixture
+def mock_salary_write_buffer_repo():
+    """SalaryWriteBufferRedisRepository Mock (기본값: 버퍼가 켜져 있으면 적재 성공, 반영 대기 중인 제출 없음)"""
+    salary_write_buffer_repo = AsyncMock(spec=SalaryWriteBufferRedisRepository)
+    salary_write_buffer_repo.submit.side_effect = lambda user_salary, max_backlog: SalarySubmitResult(
+        version=1, enqueued=max_backlog > 0
+    )
+    salary_write_buffer_repo.get_pending.return_value = None
+    return salary_write_buffer_repo
 
 
 @pytest.fixture
@@ -49,6 +109,12 @@ def asset_service(
     mock_salary_stat_repo,
     mock_job_repo,
     mock_job_cache_repo,
+    job_catalog_holder,
+    salary_stat_table,
+    mock_percentile_service,
+    car_rank_service,
+    mock_salary_write_buffer_repo,
+    mock_car_rank_cache_repo,
 ):
     """AssetService with mocked dependencies"""
     return AssetService(
@@ -57,4 +123,10 @@ def asset_service(
         salary_stat_repo=mock_salary_stat_repo,
         job_repo=mock_job_repo,
         job_cache_repo=mock_job_cache_repo,
+        job_catalog_holder=job_catalog_holder,
+        salary_stat_table=salary_stat_table,
+        percentile_service=mock_percentile_service,
+        car_rank_service=car_rank_service,
+        salary_write_buffer_repo=mock_salary_write_buffer_repo,
+        car_rank_cache_repo=mock_car_rank_cache_repo,
     )
@@ -1,19 +1,36 @@
 """Auth 모듈 테스트를 위한 Mock Fixture"""
 
-from unittest.mock import AsyncMock
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from app.module.asset.repositories.salary_write_buffer_redis_repository import SalaryWriteBufferRedisRepository
 from app.module.asset.repositories.user_salary_repository import UserSalaryRepository
 from app.module.auth.repositories.user_consent_repository import UserConsentRepository
 from app.module.auth.repositories.user_repository import UserRepository
 from app.module.auth.services.user_service import UserService
 
 
+def mock_unit_of_work() -> MagicMock:
+    """블록이 정상 종료되면 committed=True, 예외로 끝나면 False를 기록하는 unit_of_work Mock"""
+
+    @asynccontextmanager
+    async def unit_of_work():
+        unit_of_work_mock.committed = False
+        yield
+        unit_of_work_mock.committed = True
+
+    unit_of_work_mock = MagicMock(side_effect=unit_of_work)
+    return unit_of_work_mock
+
+
 @pytest.fixture
 def mock_user_repo():
     """UserRepository Mock"""
-    return AsyncMock(spec=UserRepository)
+    repo = AsyncMock(spec=UserRepository)
+    repo.unit_of_work = mock_unit_of_work()
+    return repo
 
 
 @pytest.fixture
@@ -28,15 +45,25 @@ def mock_user_salary_repo_for_auth():
     return AsyncMock(spec=UserSalaryRepository)
 
 
+@pytest.fixture
+def mock_salary_write_buffer_repo_for_auth():
+    """SalaryWriteBufferRedisRepository Mock for auth module (기본값: 반영 대기 중인 제출 없음)"""
+    salary_write_buffer_repo = AsyncMock(spec=SalaryWriteBufferRedisRepository)
+    salary_write_buffer_repo.get_pending.return_value = None
+    return salary_write_buffer_repo
+
+
 @pytest.fixture
 def user_service(
     mock_user_repo,
     mock_user_consent_repo,
     mock_user_salary_repo_for_auth,
+    mock_salary_write_buffer_repo_for_auth,
 ):
     """UserService with mocked dependencies"""
     return UserService(
         user_repo=mock_user_repo,
         user_consent_repo=mock_user_consent_repo,
         user_salary_repo=mock_user_salary_repo_for_auth,
+        salary_write_buffer_repo=mock_salary_write_buffer_repo_for_auth,
     )